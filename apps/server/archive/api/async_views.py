@@ -0,0 +1,198 @@
+"""Native async implementations of the read endpoints.
+
+Served when ``ARCHIVE_ASYNC_READS`` is enabled and the app runs under ASGI
+(``config.asgi``). They use the async ORM (``aget``/``afirst``/async
+iteration), so a worker holds many concurrent slow-client reads on one event
+loop instead of one thread per request. Responses match the sync DRF views
+byte for byte: same representations, same JSON renderer, same ETags.
+
+DRF's ``@api_view`` has no async support, so these are plain Django views.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any, Dict, Optional
+
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from archive.cache import acached_read
+from archive.formatting import format_date
+from archive.group_commit import group_commit
+from archive.metrics import timed
+from archive.models import Contributor, Submission
+from archive.routing import reads_from_replica
+
+from .conditional import (
+    condition_on_clip,
+    condition_on_clip_range,
+    condition_on_clips,
+    listing_range,
+    month_day_clips,
+)
+from .pagination import Cursor, apaginate, apaginate_before
+from .renderers import FastJSONRenderer
+from .views import (
+    clip_anchor_query,
+    clip_page_to_dict,
+    closest_date,
+    contributor_clip_rows,
+    contributor_pk_query,
+    contributor_to_dict,
+    clip_row_to_dict,
+    clip_rows,
+    parse_clip_listing,
+    parse_nearest,
+    parse_neighbors,
+    parse_page,
+    populated_date_on_or_after,
+    populated_date_on_or_before,
+    parse_on_this_day,
+    submission_to_dict,
+)
+
+_renderer = FastJSONRenderer()
+
+
+def json_response(data: Any, status: int = 200) -> HttpResponse:
+    with timed("render"):
+        body = _renderer.render(data)
+    return HttpResponse(body, status=status, content_type="application/json")
+
+
+@reads_from_replica
+@require_GET
+@condition_on_clip_range(listing_range)
+async def list_clips(request):
+    try:
+        qs, cursor, limit, cache_params = parse_clip_listing(request.GET)
+    except ValueError as e:
+        return json_response({"detail": str(e)}, status=400)
+
+    async def build() -> Dict[str, Any]:
+        return clip_page_to_dict(*await apaginate(qs, cursor, limit))
+
+    return json_response(await acached_read("clips", cache_params, build))
+
+
+@reads_from_replica
+@require_GET
+@condition_on_clips(month_day_clips)
+async def list_clips_on_this_day(request):
+    try:
+        qs, cursor, limit, cache_params = parse_on_this_day(request.GET)
+    except ValueError as e:
+        return json_response({"detail": str(e)}, status=400)
+
+    async def build() -> Dict[str, Any]:
+        return clip_page_to_dict(*await apaginate(qs, cursor, limit))
+
+    return json_response(await acached_read("on-this-day", cache_params, build))
+
+
+@reads_from_replica
+@require_GET
+@condition_on_clip
+async def get_clip(request, clip_id: str):
+    async def build() -> Dict[str, Any] | None:
+        row = await clip_rows().filter(public_id=clip_id).afirst()
+        return clip_row_to_dict(row) if row else None
+
+    data = await acached_read("clip", clip_id, build)
+    if data is None:
+        return json_response({"detail": "Clip not found"}, status=404)
+    return json_response(data)
+
+
+@reads_from_replica
+@require_GET
+async def list_clip_neighbors(request, clip_id: str, direction: str):
+    try:
+        limit = parse_neighbors(request.GET)
+    except ValueError as e:
+        return json_response({"detail": str(e)}, status=400)
+
+    async def build() -> Dict[str, Any] | None:
+        anchor = await clip_anchor_query(clip_id).afirst()
+        if anchor is None:
+            return None
+        page = apaginate if direction == "next" else apaginate_before
+        return clip_page_to_dict(*await page(clip_rows(), Cursor(*anchor), limit))
+
+    data = await acached_read("neighbors", (clip_id, direction, limit), build)
+    if data is None:
+        return json_response({"detail": "Clip not found"}, status=404)
+    return json_response(data)
+
+
+async def anearest_populated_date(target: date, direction: str) -> Optional[date]:
+    before = await populated_date_on_or_before(target).afirst() if direction != "after" else None
+    if before == target:
+        return before
+    after = await populated_date_on_or_after(target).afirst() if direction != "before" else None
+    return closest_date(target, before, after)
+
+
+@reads_from_replica
+@require_GET
+async def get_nearest_clips(request):
+    try:
+        target, direction, limit = parse_nearest(request.GET)
+    except ValueError as e:
+        return json_response({"detail": str(e)}, status=400)
+
+    async def build() -> Dict[str, Any]:
+        found = await anearest_populated_date(target, direction)
+        if found is None:
+            return {"date": None, "items": [], "next_cursor": None}
+        page = await apaginate(clip_rows().filter(performance_date=found), None, limit)
+        return {"date": format_date(found), **clip_page_to_dict(*page)}
+
+    return json_response(await acached_read("nearest", (target, direction, limit), build))
+
+
+@reads_from_replica
+@require_GET
+async def get_contributor(request, contributor_id: str):
+    contributor = await Contributor.objects.filter(public_id=contributor_id).afirst()
+    if contributor is None:
+        return json_response({"detail": "Contributor not found"}, status=404)
+    return json_response(contributor_to_dict(contributor))
+
+
+@reads_from_replica
+@require_GET
+async def list_contributor_clips(request, contributor_id: str):
+    try:
+        cursor, limit = parse_page(request.GET)
+    except ValueError as e:
+        return json_response({"detail": str(e)}, status=400)
+
+    async def build() -> Dict[str, Any] | None:
+        contributor_pk = await contributor_pk_query(contributor_id).afirst()
+        if contributor_pk is None:
+            return None
+        return clip_page_to_dict(
+            *await apaginate(contributor_clip_rows(contributor_pk), cursor, limit)
+        )
+
+    data = await acached_read("contributor-clips", (contributor_id, limit, cursor), build)
+    if data is None:
+        return json_response({"detail": "Contributor not found"}, status=404)
+    return json_response(data)
+
+
+@reads_from_replica
+@require_GET
+async def get_submission(request, submission_id: str):
+    pending = group_commit.pending(submission_id)
+    if pending is not None:
+        return json_response(pending)
+    try:
+        submission = await Submission.objects.select_related("contributor", "clip").aget(
+            public_id=submission_id
+        )
+    except Submission.DoesNotExist:
+        return json_response({"detail": "Submission not found"}, status=404)
+    return json_response(submission_to_dict(submission))
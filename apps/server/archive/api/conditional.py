@@ -0,0 +1,194 @@
+"""Conditional GET support (ETag / If-None-Match / 304) for archive reads.
+
+A response that depends only on a subset of clips (a performance_date range,
+one month/day across all years) is validated by the number of clips in the
+subset and their latest created_at. Clips are insert-only, so those two
+values change whenever the subset does, and both come from an index-only scan
+(``clip_chrono_idx``, ``clip_month_day_idx``); a clip added elsewhere in the
+archive leaves the tag alone. A listing bounded by neither ``from`` nor
+``to`` depends on every clip, so it is validated by the archive version
+(``archive.cache.archive_version``) instead of a count over the whole table.
+
+The decorators wrap Django's ``condition`` and go *above* ``@api_view`` so a
+matching If-None-Match returns 304 before DRF parses the request or any rows
+are fetched or serialized.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import date
+from functools import wraps
+from inspect import iscoroutinefunction
+from typing import Awaitable, Callable, Optional, Tuple
+
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
+
+from archive.cache import aarchive_version, archive_version
+from archive.calendar import month_range, parse_month_day
+from archive.models import Clip
+
+DateRange = Tuple[Optional[date], Optional[date]]
+
+
+def _range_queryset(start: Optional[date], end: Optional[date]):
+    qs = Clip.objects.all()
+    if start is not None:
+        qs = qs.filter(performance_date__gte=start)
+    if end is not None:
+        qs = qs.filter(performance_date__lte=end)
+    return qs
+
+
+def _format_validator(agg: dict) -> str:
+    latest = agg["latest"].isoformat() if agg["latest"] else "-"
+    return f"{agg['n']}:{latest}"
+
+
+def clip_set_validator(clips: Optional[QuerySet]) -> str:
+    """Return "<count>:<max created_at>" for ``clips``, or "v<archive version>" for None."""
+    if clips is None:
+        return f"v{archive_version()}"
+    agg = clips.aggregate(n=Count("*"), latest=Max("created_at"))
+    return _format_validator(agg)
+
+
+async def aclip_set_validator(clips: Optional[QuerySet]) -> str:
+    if clips is None:
+        return f"v{await aarchive_version()}"
+    agg = await clips.aaggregate(n=Count("*"), latest=Max("created_at"))
+    return _format_validator(agg)
+
+
+def clip_range_validator(start: Optional[date], end: Optional[date]) -> str:
+    """Return "<count>:<max created_at>" for clips with performance_date in [start, end]."""
+    return clip_set_validator(_range_queryset(start, end))
+
+
+def _digest(value: str) -> str:
+    return hashlib.blake2b(value.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def acondition(etag_func: Callable[..., Awaitable[Optional[str]]]):
+    """Async counterpart of Django's ``condition`` (ETag only).
+
+    ``condition`` calls its ``etag_func`` synchronously, which cannot use the
+    ORM from an async view; here ``etag_func`` is awaited instead.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            etag = await etag_func(request, *args, **kwargs)
+            etag = quote_etag(etag) if etag is not None else None
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+            if etag and request.method in ("GET", "HEAD"):
+                response.headers.setdefault("ETag", etag)
+            return response
+
+        return inner
+
+    return decorator
+
+
+def condition_on_clips(get_clips: Callable[..., Optional[QuerySet]]):
+    """Decorator factory: ETag/304 for views that depend on a subset of clips.
+
+    ``get_clips(request, *args, **kwargs)`` returns the Clip queryset the
+    response depends on, or None if it depends on the whole archive. If it
+    raises ValueError or KeyError no ETag is produced and the view handles the
+    bad request itself. The full request path is part of the tag, so different
+    pages or representations of the same subset get different ETags. Works on
+    both sync and async views.
+    """
+
+    def etag_func(request, *args, **kwargs) -> Optional[str]:
+        try:
+            clips = get_clips(request, *args, **kwargs)
+        except (KeyError, ValueError):
+            return None
+        return _digest(f"{request.get_full_path()}|{clip_set_validator(clips)}")
+
+    async def aetag_func(request, *args, **kwargs) -> Optional[str]:
+        try:
+            clips = get_clips(request, *args, **kwargs)
+        except (KeyError, ValueError):
+            return None
+        validator = await aclip_set_validator(clips)
+        return _digest(f"{request.get_full_path()}|{validator}")
+
+    def decorator(view):
+        if iscoroutinefunction(view):
+            return acondition(aetag_func)(view)
+        return condition(etag_func=etag_func)(view)
+
+    return decorator
+
+
+def condition_on_clip_range(get_range: Callable[..., DateRange]):
+    """``condition_on_clips`` for a performance_date range.
+
+    ``get_range(request, *args, **kwargs)`` returns the (start, end) range the
+    response depends on; either bound may be None, and with neither the
+    response depends on the whole archive.
+    """
+
+    def get_clips(request, *args, **kwargs) -> Optional[QuerySet]:
+        start, end = get_range(request, *args, **kwargs)
+        if start is None and end is None:
+            return None
+        return _range_queryset(start, end)
+
+    return condition_on_clips(get_clips)
+
+
+def _optional_date(raw: Optional[str]) -> Optional[date]:
+    return date.fromisoformat(raw) if raw else None
+
+
+def listing_range(request, *args, **kwargs) -> DateRange:
+    """Range of GET /clips: the optional ``from``/``to`` query parameters."""
+    return _optional_date(request.GET.get("from")), _optional_date(request.GET.get("to"))
+
+
+def calendar_range(request, *args, **kwargs) -> DateRange:
+    """Range of GET /calendar: the requested year or month."""
+    month = request.GET.get("month")
+    return month_range(int(request.GET["year"]), int(month) if month else None)
+
+
+def month_day_clips(request, *args, **kwargs) -> QuerySet:
+    """Clips of GET /clips/on-this-day: one month and day in every year."""
+    month, day = parse_month_day(request.GET)
+    return Clip.objects.filter(performance_month=month, performance_day=day)
+
+
+def _clip_created_at(clip_id: str):
+    return Clip.objects.filter(public_id=clip_id).values_list("created_at", flat=True)
+
+
+def clip_etag(request, clip_id: str, *args, **kwargs) -> Optional[str]:
+    """ETag for a single clip. Clips are immutable once created."""
+    created_at = _clip_created_at(clip_id).first()
+    if created_at is None:
+        return None
+    return _digest(f"{clip_id}|{created_at.isoformat()}")
+
+
+async def aclip_etag(request, clip_id: str, *args, **kwargs) -> Optional[str]:
+    created_at = await _clip_created_at(clip_id).afirst()
+    if created_at is None:
+        return None
+    return _digest(f"{clip_id}|{created_at.isoformat()}")
+
+
+def condition_on_clip(view):
+    """ETag/304 for clip detail views (sync or async)."""
+    if iscoroutinefunction(view):
+        return acondition(aclip_etag)(view)
+    return condition(etag_func=clip_etag)(view)
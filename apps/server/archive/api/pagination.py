@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import date, datetime
+from typing import NamedTuple
+
+from django.db.models import Q, QuerySet
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+# Chronological order used by every clip listing. Must match the columns of
+# Clip.Meta's "clip_chrono_idx" so the seek below is a single index range scan.
+CHRONO_ORDER = ("performance_date", "created_at", "id")
+
+
+class Cursor(NamedTuple):
+    """Position of the last row of a page: (performance_date, created_at, pk)."""
+
+    performance_date: date
+    created_at: datetime
+    pk: int
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    raw = "|".join(
+        [
+            cursor.performance_date.isoformat(),
+            cursor.created_at.isoformat(),
+            str(cursor.pk),
+        ]
+    )
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decode an opaque cursor produced by ``encode_cursor``.
+
+    Raises ValueError if the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        perf, created, pk = raw.split("|")
+        return Cursor(date.fromisoformat(perf), datetime.fromisoformat(created), int(pk))
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def cursor_for(obj) -> Cursor:
+    return Cursor(obj.performance_date, obj.created_at, obj.pk)
+
+
+def parse_limit(raw: str | None, default: int = DEFAULT_LIMIT) -> int:
+    """Parse the ``limit`` query parameter (1..MAX_LIMIT, default ``default``).
+
+    Raises ValueError if the value is not an integer in range.
+    """
+    if raw is None or raw == "":
+        return default
+    try:
+        limit = int(raw)
+    except ValueError as e:
+        raise ValueError("limit must be an integer") from e
+    if not 1 <= limit <= MAX_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+    return limit
+
+
+def seek_after(qs: QuerySet, cursor: Cursor) -> QuerySet:
+    """Restrict ``qs`` to rows strictly after ``cursor`` in CHRONO_ORDER.
+
+    The leading ``performance_date >= ...`` bound lets the database start an
+    index range scan at the cursor instead of skipping over earlier rows, so
+    every page costs the same regardless of depth.
+    """
+    d, c, pk = cursor
+    return qs.filter(performance_date__gte=d).filter(
+        Q(performance_date__gt=d)
+        | Q(created_at__gt=c)
+        | Q(created_at=c, pk__gt=pk)
+    )
+
+
+def seek_before(qs: QuerySet, cursor: Cursor) -> QuerySet:
+    """Restrict ``qs`` to rows strictly before ``cursor`` in CHRONO_ORDER (mirror of seek_after)."""
+    d, c, pk = cursor
+    return qs.filter(performance_date__lte=d).filter(
+        Q(performance_date__lt=d)
+        | Q(created_at__lt=c)
+        | Q(created_at=c, pk__lt=pk)
+    )
+
+
+def _page_query(qs: QuerySet, cursor: Cursor | None, limit: int) -> QuerySet:
+    if cursor is not None:
+        qs = seek_after(qs, cursor)
+    return qs.order_by(*CHRONO_ORDER)[: limit + 1]
+
+
+def _page(rows: list, limit: int) -> tuple[list, str | None]:
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(cursor_for(rows[-1]))
+
+
+def paginate(qs: QuerySet, cursor: Cursor | None, limit: int) -> tuple[list, str | None]:
+    """Return one page of ``qs`` in CHRONO_ORDER and the cursor for the next page."""
+    return _page(list(_page_query(qs, cursor, limit)), limit)
+
+
+def _before_query(qs: QuerySet, cursor: Cursor, limit: int) -> QuerySet:
+    # Walks the chronological index backwards from the cursor.
+    return seek_before(qs, cursor).order_by(*(f"-{f}" for f in CHRONO_ORDER))[:limit]
+
+
+def _before_page(rows: list) -> tuple[list, str | None]:
+    rows.reverse()
+    return rows, encode_cursor(cursor_for(rows[-1])) if rows else None
+
+
+def paginate_before(qs: QuerySet, cursor: Cursor, limit: int) -> tuple[list, str | None]:
+    """Return the ``limit`` rows of ``qs`` just before ``cursor``, in CHRONO_ORDER.
+
+    The returned cursor continues after the last of them (as a ``paginate``
+    cursor would); it is None only when there are no such rows.
+    """
+    return _before_page(list(_before_query(qs, cursor, limit)))
+
+
+async def apaginate(
+    qs: QuerySet, cursor: Cursor | None, limit: int
+) -> tuple[list, str | None]:
+    """Async ``paginate``: rows are fetched with async iteration."""
+    return _page([row async for row in _page_query(qs, cursor, limit)], limit)
+
+
+async def apaginate_before(
+    qs: QuerySet, cursor: Cursor, limit: int
+) -> tuple[list, str | None]:
+    """Async ``paginate_before``."""
+    return _before_page([row async for row in _before_query(qs, cursor, limit)])
@@ -0,0 +1,49 @@
+"""JSON renderer for API responses, backed by orjson when it is installed.
+
+``FastJSONRenderer`` produces exactly the bytes of DRF's ``JSONRenderer``
+with the default settings (compact separators, UTF-8 output, ``\\u2028`` and
+``\\u2029`` escaped):
+
+- str, int, bool, None, dict and list (including their subclasses such as
+  ``ErrorDetail`` and ``ReturnDict``) are encoded by orjson, whose output for
+  them matches ``json.dumps``;
+- datetimes and everything else orjson does not handle natively go through
+  DRF's own ``JSONEncoder.default``;
+- anything orjson rejects (integers beyond 64 bits, non-string keys, lone
+  surrogates) and indented (browsable/``?indent=``) output fall back to the
+  stock renderer.
+
+The API has no float fields; orjson and ``json`` may format some floats
+differently.
+"""
+
+from __future__ import annotations
+
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional: render with the stock JSONRenderer
+    orjson = None
+
+
+class FastJSONRenderer(JSONRenderer):
+    def __init__(self) -> None:
+        super().__init__()
+        self._default = self.encoder_class().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self._default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same escaping as JSONRenderer: these are valid JSON but not JavaScript.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
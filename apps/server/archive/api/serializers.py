@@ -13,6 +13,8 @@ class CreateContributorRequest(serializers.Serializer):
 class CreateSubmissionRequest(serializers.Serializer):
     contributor_id = serializers.CharField()
     raw_youtube_input = serializers.CharField()
-    raw_date_input = serializers.CharField()
-    title = serializers.CharField(required=False, allow_null=True, allow_blank=True)
+    raw_date_input = serializers.CharField(max_length=50)
+    title = serializers.CharField(
+        required=False, allow_null=True, allow_blank=True, max_length=500
+    )
     notes = serializers.CharField(required=False, allow_null=True, allow_blank=True)
@@ -0,0 +1,71 @@
+"""DRF throttle applying the submission token buckets (``archive.ratelimit``).
+
+DRF checks throttles in ``APIView.initial()``, before the view body runs, so
+an over-limit POST /submissions or POST /submissions:batch is answered with
+``429`` and ``Retry-After`` without touching the database.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Any, List, Tuple
+
+from django.conf import settings
+from rest_framework.throttling import BaseThrottle
+
+from archive.ratelimit import Limit, submission_limiter
+
+# Longer values are not contributor ids; don't let them key buckets.
+MAX_KEY_LENGTH = 64
+
+
+def _payloads(data: Any) -> List[Any]:
+    """The submissions of a single or batch request body (as the views accept them)."""
+    if isinstance(data, dict):
+        data = data.get("items", [data])
+    return data if isinstance(data, list) else []
+
+
+class SubmissionRateThrottle(BaseThrottle):
+    """One bucket per client IP and one per ``contributor_id`` in the body.
+
+    The request is admitted only if every bucket has enough tokens: a batch
+    costs the IP bucket one token per item, and each contributor's bucket one
+    per item of that contributor. The IP comes from ``BaseThrottle.get_ident``
+    (``REMOTE_ADDR``, or X-Forwarded-For as configured by
+    ``REST_FRAMEWORK["NUM_PROXIES"]``).
+    """
+
+    def __init__(self) -> None:
+        self._wait = 0.0
+
+    def limits(self, request) -> Tuple[List[Limit], List[int]]:
+        """The buckets ``request`` draws from and how many tokens from each."""
+        rates = settings.ARCHIVE_SUBMISSION_RATE_LIMITS
+        limits: List[Limit] = []
+        costs: List[int] = []
+        payloads = _payloads(request.data)
+        if rates.get("ip"):
+            limits.append((f"ip:{self.get_ident(request)}", *rates["ip"]))
+            costs.append(max(1, len(payloads)))
+        if rates.get("contributor"):
+            contributors = Counter(
+                p["contributor_id"][:MAX_KEY_LENGTH]
+                for p in payloads
+                if isinstance(p, dict) and isinstance(p.get("contributor_id"), str)
+            )
+            for contributor_id, n in sorted(contributors.items()):
+                limits.append((f"ctr:{contributor_id}", *rates["contributor"]))
+                costs.append(n)
+        return limits, costs
+
+    def allow_request(self, request, view) -> bool:
+        if not settings.ARCHIVE_RATE_LIMIT:
+            return True
+        limits, costs = self.limits(request)
+        self._wait = submission_limiter.acquire(limits, time.time(), costs)
+        return not self._wait
+
+    def wait(self) -> float:
+        return self._wait
@@ -1,7 +1,51 @@
+from django.conf import settings
 from django.urls import path
-from .views import create_contributor, create_submission
+
+from . import async_views
+from .views import (
+    create_contributor,
+    create_submission,
+    create_submission_batch,
+    export_clips,
+    get_calendar,
+    get_clip,
+    get_contributor,
+    get_metrics,
+    get_nearest_clips,
+    get_submission,
+    get_submission_stats,
+    list_clip_neighbors,
+    list_clips,
+    list_clips_on_this_day,
+    list_contributor_clips,
+)
+
+if settings.ARCHIVE_ASYNC_READS:
+    # Native async read endpoints; only worthwhile under ASGI.
+    list_clips = async_views.list_clips  # noqa: F811
+    list_clips_on_this_day = async_views.list_clips_on_this_day  # noqa: F811
+    get_nearest_clips = async_views.get_nearest_clips  # noqa: F811
+    get_clip = async_views.get_clip  # noqa: F811
+    list_clip_neighbors = async_views.list_clip_neighbors  # noqa: F811
+    get_submission = async_views.get_submission  # noqa: F811
+    get_contributor = async_views.get_contributor  # noqa: F811
+    list_contributor_clips = async_views.list_contributor_clips  # noqa: F811
 
 urlpatterns = [
     path("contributors", create_contributor),
+    path("contributors/<str:contributor_id>", get_contributor),
+    path("contributors/<str:contributor_id>/clips", list_contributor_clips),
     path("submissions", create_submission),
+    path("submissions:batch", create_submission_batch),
+    path("submissions/<str:submission_id>", get_submission),
+    path("clips", list_clips),
+    path("clips/export", export_clips),
+    path("clips/on-this-day", list_clips_on_this_day),
+    path("clips/nearest", get_nearest_clips),
+    path("clips/<str:clip_id>", get_clip),
+    path("clips/<str:clip_id>/next", list_clip_neighbors, {"direction": "next"}),
+    path("clips/<str:clip_id>/prev", list_clip_neighbors, {"direction": "prev"}),
+    path("calendar", get_calendar),
+    path("stats/submissions", get_submission_stats),
+    path("metrics", get_metrics, name="metrics"),
 ]
@@ -1,44 +1,156 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone, date
-from uuid import uuid4
+from datetime import date
 from archive.models import Contributor, Clip, Submission
-from django.db import transaction, IntegrityError
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, OuterRef, QuerySet, Subquery
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
 
 from rest_framework import status
-from rest_framework.decorators import api_view
+from rest_framework.decorators import api_view, parser_classes, throttle_classes
+from rest_framework.parsers import JSONParser
 from rest_framework.response import Response
 
-import re
-from typing import Any, Dict, cast
+from typing import Any, Dict, List, Optional, Tuple, cast
 
+from archive.cache import cached_read
+from archive.calendar import calendar_days, month_range, parse_month_day
+from archive.contributors import record_submissions
+from archive.db import retry_on_lock
+from archive.export import csv_lines, export_fields, iter_clip_rows, ndjson_lines
+from archive.formatting import dt_to_z, format_date, youtube_url
+from archive.metrics import collect, render_prometheus, timed
+from archive.rollups import submission_stats
+from archive.routing import reads_from_replica
+from archive.duplicates import duplicate_filter
+from archive.group_commit import PENDING, PendingSubmission, group_commit
+from archive.ingest import (
+    SubmissionInput,
+    clip_exists,
+    clips_created,
+    ingest_batch,
+    insert_clip_if_absent,
+)
+from archive.validation import (
+    DUPLICATE_CLIP_ERROR,
+    validate_submission_inputs,
+)
+from .conditional import (
+    calendar_range,
+    condition_on_clip,
+    condition_on_clip_range,
+    condition_on_clips,
+    listing_range,
+    month_day_clips,
+)
+from .pagination import (
+    CHRONO_ORDER,
+    Cursor,
+    decode_cursor,
+    paginate,
+    paginate_before,
+    parse_limit,
+)
+from .parsers import NDJSONParser
 from .serializers import CreateContributorRequest, CreateSubmissionRequest
+from .throttling import SubmissionRateThrottle
 
+MAX_BATCH_ITEMS = 5000
 
-def utc_now_z() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+# Default page size of GET /clips/{id}/next and /prev: one hop along the timeline.
+NEIGHBOR_LIMIT = 1
 
+NEAREST_DIRECTIONS = ("before", "after", "either")
 
-def dt_to_z(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
 
+def clip_queryset() -> QuerySet:
+    """Clips annotated with the public ids needed by the Clip representation.
+
+    Annotating (rather than select_related/prefetch) keeps a page of clips to a
+    single query.
+    """
+    accepted_submission = Submission.objects.filter(
+        clip=OuterRef("pk"), status=Submission.Status.ACCEPTED
+    ).order_by("pk")
+    return Clip.objects.annotate(
+        contributor_public_id=F("contributor__public_id"),
+        submission_public_id=Subquery(accepted_submission.values("public_id")[:1]),
+    )
+
+
+def contributor_to_dict(contributor: Contributor) -> Dict[str, Any]:
+    """Render a contributor with its counters (GET /contributors/{id})."""
+    accepted = contributor.accepted_submission_count
+    rejected = contributor.rejected_submission_count
+    return {
+        "id": contributor.public_id,
+        "display_name": contributor.display_name,
+        "external_id": contributor.external_id,
+        "created_at": dt_to_z(contributor.created_at),
+        "submission_count": accepted + rejected,
+        "accepted_submission_count": accepted,
+        "rejected_submission_count": rejected,
+        "clip_count": contributor.clip_count,
+    }
 
-YOUTUBE_ID_RE = re.compile(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})")
 
+def submission_to_dict(submission: Submission) -> Dict[str, Any]:
+    """Render a submission using the OpenAPI Submission schema."""
+    return {
+        "id": submission.public_id,
+        "contributor_id": submission.contributor.public_id,
+        "clip_id": submission.clip.public_id if submission.clip else None,
+        "status": submission.status,
+        "validation_error": submission.validation_error,
+        "raw_youtube_input": submission.raw_youtube_input,
+        "raw_date_input": submission.raw_date_input,
+        "title": submission.title,
+        "notes": submission.notes,
+        "submitted_at": dt_to_z(submission.submitted_at),
+    }
 
-def extract_youtube_video_id(raw: str) -> str:
-    """Extract a YouTube video id from common URL formats.
 
-    Accepts URLs like:
-      - https://youtu.be/<id>
-      - https://www.youtube.com/watch?v=<id>
+# Columns of a Clip row, in the order ``clip_row_to_dict`` unpacks them. The
+# trailing pk (with performance_date and created_at) positions page cursors.
+CLIP_ROW_FIELDS = (
+    "public_id",
+    "youtube_video_id",
+    "performance_date",
+    "title",
+    "notes",
+    "created_at",
+    "contributor_public_id",
+    "submission_public_id",
+    "pk",
+)
 
-    Raises ValueError if the id cannot be extracted.
+
+def clip_rows() -> QuerySet:
+    """``clip_queryset`` as named rows of CLIP_ROW_FIELDS.
+
+    Listings fetch only the columns of the representation and skip model
+    instantiation; the rows still carry the attributes ``cursor_for`` reads.
     """
-    m = YOUTUBE_ID_RE.search(raw or "")
-    if not m:
-        raise ValueError("Invalid YouTube URL or video id")
-    return m.group(1)
+    return clip_queryset().values_list(*CLIP_ROW_FIELDS, named=True)
+
+
+def clip_row_to_dict(row: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Render a row of ``clip_rows`` using the OpenAPI Clip schema."""
+    public_id, video_id, perf, title, notes, created, contributor_id, sub_id, _ = row
+    return {
+        "id": public_id,
+        "youtube_video_id": video_id,
+        "youtube_url": youtube_url(video_id),
+        "performance_date": format_date(perf),
+        "title": title,
+        "notes": notes,
+        "created_at": dt_to_z(created),
+        "created_by_contributor_id": contributor_id,
+        "added_via_submission_id": sub_id,
+    }
 
 
 @api_view(["POST"])
@@ -63,10 +175,79 @@ def create_contributor(request):
     )
 
 
+def enqueue_submission(submission: Submission) -> Response:
+    """POST /submissions in asynchronous mode: validate now, write in a group commit.
+
+    Valid input is answered with status "pending" until the worker decides
+    between accepted and duplicate; invalid input is already final. Either
+    way the submission is recorded by the worker, with the public id handed
+    out here. ``submitted_at`` is the request time; the stored one is the
+    commit time, a few milliseconds later.
+    """
+    try:
+        with timed("validate"):
+            validate_submission_inputs(submission.raw_youtube_input, submission.raw_date_input)
+        submission.status = PENDING
+    except ValueError as e:
+        submission.validation_error = str(e)
+    submission.submitted_at = timezone.now()
+    representation = submission_to_dict(submission)
+    item = SubmissionInput(
+        contributor=submission.contributor,
+        raw_youtube_input=submission.raw_youtube_input,
+        raw_date_input=submission.raw_date_input,
+        title=submission.title,
+        notes=submission.notes,
+        public_id=submission.public_id,
+    )
+    group_commit.submit(PendingSubmission(item, representation))
+    return Response(representation, status=status.HTTP_202_ACCEPTED)
+
+
+def save_rejected(submission: Submission) -> None:
+    """INSERT a rejected submission and count it, in one transaction."""
+    with transaction.atomic():
+        submission.save(force_insert=True)
+        record_submissions([submission])
+
+
+@reads_from_replica
+@api_view(["GET"])
+def get_contributor(request, contributor_id: str):
+    # Not cached: rejected submissions change the counters without bumping
+    # the archive version. This is a single unique-index lookup anyway.
+    contributor = Contributor.objects.filter(public_id=contributor_id).first()
+    if contributor is None:
+        return Response({"detail": "Contributor not found"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(contributor_to_dict(contributor))
+
+
+@reads_from_replica
+@api_view(["GET"])
+def list_contributor_clips(request, contributor_id: str):
+    try:
+        cursor, limit = parse_page(request.query_params)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def build() -> Dict[str, Any] | None:
+        contributor_pk = contributor_pk_query(contributor_id).first()
+        if contributor_pk is None:
+            return None
+        return clip_page_to_dict(*paginate(contributor_clip_rows(contributor_pk), cursor, limit))
+
+    data = cached_read("contributor-clips", (contributor_id, limit, cursor), build)
+    if data is None:
+        return Response({"detail": "Contributor not found"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(data)
+
+
 @api_view(["POST"])
+@throttle_classes([SubmissionRateThrottle])
 def create_submission(request):
-    ser = CreateSubmissionRequest(data=request.data)
-    ser.is_valid(raise_exception=True)
+    with timed("validate"):
+        ser = CreateSubmissionRequest(data=request.data)
+        ser.is_valid(raise_exception=True)
     payload = cast(Dict[str, Any], ser.validated_data)
 
     # Resolve contributor by public_id
@@ -78,96 +259,457 @@ def create_submission(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    validation_error: str | None = None
-    clip_id: str | None = None
-    status_str = "accepted"
-    http_status = status.HTTP_201_CREATED
+    # Every outcome writes exactly one Submission row, built in its final state,
+    # and bumps the contributor's counters in the same transaction:
+    #   invalid input   -> INSERT + counter UPDATE
+    #   known duplicate -> existence check + INSERT + counter UPDATE (no Clip
+    #                      insert attempted; only checked for pairs the
+    #                      duplicate filter may contain, so not when it is off)
+    #   otherwise       -> conflict-aware Clip INSERT, then either derived-state
+    #                      updates + Submission INSERT (accepted) or just the
+    #                      Submission INSERT (duplicate that was not yet known),
+    #                      then the counter UPDATE
+    submission = Submission(
+        contributor=contributor,
+        status=Submission.Status.REJECTED,
+        raw_youtube_input=payload["raw_youtube_input"],
+        raw_date_input=payload["raw_date_input"],
+        title=payload.get("title"),
+        notes=payload.get("notes"),
+    )
+    if settings.ARCHIVE_ASYNC_SUBMISSIONS:
+        return enqueue_submission(submission)
 
-    # Always create a Submission record
     try:
-        # Validate required inputs first.
-        performance_date = date.fromisoformat(cast(str, payload["raw_date_input"]))
-        youtube_video_id = extract_youtube_video_id(
-            cast(str, payload["raw_youtube_input"])
-        )
-
-        with transaction.atomic():
-            # Check if clip already exists (duplicate check) - inside transaction for consistency
-            existing_clip = Clip.objects.filter(
-                youtube_video_id=youtube_video_id, performance_date=performance_date
-            ).first()
-
-            submission = Submission.objects.create(
-                contributor=contributor,
-                status=Submission.Status.REJECTED,  # Start as rejected, update if validation passes
-                raw_youtube_input=payload["raw_youtube_input"],
-                raw_date_input=payload["raw_date_input"],
-                title=payload.get("title"),
-                notes=payload.get("notes"),
+        with timed("validate"):
+            youtube_video_id, performance_date = validate_submission_inputs(
+                cast(str, payload["raw_youtube_input"]),
+                cast(str, payload["raw_date_input"]),
             )
+    except ValueError as e:
+        # Validation error (invalid date or YouTube URL) - still record the submission
+        submission.validation_error = str(e)
+        with timed("write"):
+            retry_on_lock(lambda: save_rejected(submission))
+        return Response(submission_to_dict(submission), status=status.HTTP_201_CREATED)
 
-            if existing_clip:
-                # Duplicate clip - mark submission as rejected
-                status_str = "rejected"
-                validation_error = "Duplicate clip: clip with this YouTube video ID and performance date already exists"
-                submission.validation_error = validation_error
-                submission.save()
-                http_status = status.HTTP_409_CONFLICT
+    key = (youtube_video_id, performance_date)
+    if duplicate_filter.enabled() and duplicate_filter.might_exist(key) and clip_exists(key):
+        # Clips are never removed, so this stays a duplicate: record it (with
+        # its counter, in one short transaction) without attempting a Clip
+        # insert that cannot succeed.
+        submission.validation_error = DUPLICATE_CLIP_ERROR
+        with timed("write"):
+            retry_on_lock(lambda: save_rejected(submission))
+        return Response(submission_to_dict(submission), status=status.HTTP_409_CONFLICT)
+
+    def write() -> int:
+        # Rebuilt on every attempt: a retried transaction starts from scratch.
+        clip = Clip(
+            contributor=contributor,
+            youtube_video_id=youtube_video_id,
+            raw_youtube_input=payload["raw_youtube_input"],
+            performance_date=performance_date,
+            title=payload.get("title"),
+            notes=payload.get("notes"),
+        )
+        submission.pk = None
+        with transaction.atomic():
+            if insert_clip_if_absent(clip):
+                clips_created([clip])
+                submission.clip = clip
+                submission.status = Submission.Status.ACCEPTED
+                submission.validation_error = None
+                http_status = status.HTTP_201_CREATED
             else:
-                # Create new clip (with try/except to handle race condition)
-                try:
-                    clip = Clip.objects.create(
-                        contributor=contributor,
-                        youtube_video_id=youtube_video_id,
-                        raw_youtube_input=payload["raw_youtube_input"],
-                        performance_date=performance_date,
-                        title=payload.get("title"),
-                        notes=payload.get("notes"),
-                    )
-
-                    # Update submission to accepted
-                    submission.clip = clip
-                    submission.status = Submission.Status.ACCEPTED
-                    submission.validation_error = None
-                    submission.save()
-
-                    clip_id = clip.public_id
-                    status_str = "accepted"
-                except IntegrityError:
-                    # Race condition: clip was created between our check and creation
-                    status_str = "rejected"
-                    validation_error = "Duplicate clip: clip with this YouTube video ID and performance date already exists"
-                    submission.validation_error = validation_error
-                    submission.save()
-                    http_status = status.HTTP_409_CONFLICT
+                submission.clip = None
+                submission.status = Submission.Status.REJECTED
+                submission.validation_error = DUPLICATE_CLIP_ERROR
+                http_status = status.HTTP_409_CONFLICT
+            submission.save(force_insert=True)
+            record_submissions([submission])
+        return http_status
+
+    with timed("write"):
+        http_status = retry_on_lock(write)
+    return Response(submission_to_dict(submission), status=http_status)
+
+
+def _batch_items(data: Any) -> List[Any]:
+    """Accept a JSON array, ``{"items": [...]}`` or NDJSON-parsed lines."""
+    if isinstance(data, dict):
+        data = data.get("items")
+    if not isinstance(data, list):
+        raise ValueError("Expected a list of submissions")
+    if not data:
+        raise ValueError("Batch must contain at least one submission")
+    if len(data) > MAX_BATCH_ITEMS:
+        raise ValueError(f"Batch may contain at most {MAX_BATCH_ITEMS} submissions")
+    return data
+
+
+@api_view(["POST"])
+@parser_classes([JSONParser, NDJSONParser])
+@throttle_classes([SubmissionRateThrottle])
+def create_submission_batch(request):
+    try:
+        items = _batch_items(request.data)
     except ValueError as e:
-        # Validation error (invalid date or YouTube URL) - still create submission
-        with transaction.atomic():
-            submission = Submission.objects.create(
-                contributor=contributor,
-                status=Submission.Status.REJECTED,
-                raw_youtube_input=payload["raw_youtube_input"],
-                raw_date_input=payload["raw_date_input"],
-                title=payload.get("title"),
-                notes=payload.get("notes"),
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    ser = CreateSubmissionRequest(data=items, many=True)
+    ser.is_valid(raise_exception=True)
+    payloads = cast(List[Dict[str, Any]], ser.validated_data)
+
+    # Resolve every contributor in one query.
+    contributor_ids = {p["contributor_id"] for p in payloads}
+    contributors = Contributor.objects.in_bulk(contributor_ids, field_name="public_id")
+    missing = sorted(contributor_ids - contributors.keys())
+    if missing:
+        return Response(
+            {"detail": f"Contributor not found: {', '.join(missing)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    submissions = ingest_batch(
+        [
+            SubmissionInput(
+                contributor=contributors[p["contributor_id"]],
+                raw_youtube_input=p["raw_youtube_input"],
+                raw_date_input=p["raw_date_input"],
+                title=p.get("title"),
+                notes=p.get("notes"),
             )
-            status_str = "rejected"
-            validation_error = str(e)
-            submission.validation_error = validation_error
-            submission.save()
+            for p in payloads
+        ]
+    )
+
+    return Response(
+        {"items": [submission_to_dict(s) for s in submissions]},
+        status=status.HTTP_201_CREATED,
+    )
+
+
+def parse_clip_listing(params) -> Tuple[QuerySet, Cursor | None, int, Tuple[Any, ...]]:
+    """Parse GET /clips query parameters.
+
+    Returns (queryset, cursor, limit, cache_params). Raises ValueError for
+    malformed parameters.
+    """
+    date_from = params.get("from")
+    date_to = params.get("to")
+    limit = parse_limit(params.get("limit"))
+    cursor = decode_cursor(params["cursor"]) if params.get("cursor") else None
+
+    qs = clip_rows()
+    if date_from:
+        qs = qs.filter(performance_date__gte=date.fromisoformat(date_from))
+    if date_to:
+        qs = qs.filter(performance_date__lte=date.fromisoformat(date_to))
+    return qs, cursor, limit, (date_from, date_to, limit, cursor)
+
+
+def parse_on_this_day(params) -> Tuple[QuerySet, Cursor | None, int, Tuple[Any, ...]]:
+    """Parse GET /clips/on-this-day query parameters.
+
+    Returns (queryset, cursor, limit, cache_params) like ``parse_clip_listing``.
+    The clips of one month and day come from ``clip_month_day_idx`` in
+    chronological (i.e. year) order, so pages are keyset seeks like GET /clips.
+    """
+    month, day = parse_month_day(params)
+    limit = parse_limit(params.get("limit"))
+    cursor = decode_cursor(params["cursor"]) if params.get("cursor") else None
+    qs = clip_rows().filter(performance_month=month, performance_day=day)
+    return qs, cursor, limit, (month, day, limit, cursor)
+
+
+def clip_anchor_query(clip_id: str) -> QuerySet:
+    """The CHRONO_ORDER position of a clip, as one row (unique public_id lookup)."""
+    return Clip.objects.filter(public_id=clip_id).values_list(*CHRONO_ORDER)
+
+
+def parse_neighbors(params) -> int:
+    """Parse the ``limit`` of GET /clips/{id}/next and /prev. Raises ValueError."""
+    return parse_limit(params.get("limit"), default=NEIGHBOR_LIMIT)
+
+
+def parse_nearest(params) -> Tuple[date, str, int]:
+    """Parse GET /clips/nearest query parameters into (date, direction, limit).
+
+    Raises ValueError for missing or malformed parameters.
+    """
+    raw_date = params.get("date")
+    if not raw_date:
+        raise ValueError("date is required")
+    try:
+        target = date.fromisoformat(raw_date)
+    except ValueError as e:
+        raise ValueError("date must be YYYY-MM-DD") from e
+    direction = params.get("direction") or "either"
+    if direction not in NEAREST_DIRECTIONS:
+        raise ValueError(f"direction must be one of: {', '.join(NEAREST_DIRECTIONS)}")
+    return target, direction, parse_limit(params.get("limit"))
+
+
+def populated_date_on_or_before(target: date) -> QuerySet:
+    """The latest performance_date <= ``target`` (one bounded seek on clip_chrono_idx)."""
+    return (
+        Clip.objects.filter(performance_date__lte=target)
+        .order_by("-performance_date")
+        .values_list("performance_date", flat=True)[:1]
+    )
+
+
+def populated_date_on_or_after(target: date) -> QuerySet:
+    """The earliest performance_date >= ``target`` (one bounded seek on clip_chrono_idx)."""
+    return (
+        Clip.objects.filter(performance_date__gte=target)
+        .order_by("performance_date")
+        .values_list("performance_date", flat=True)[:1]
+    )
+
+
+def closest_date(target: date, before: Optional[date], after: Optional[date]) -> Optional[date]:
+    """The closer of two candidates to ``target``; the earlier one on a tie."""
+    if before is None or after is None:
+        return before or after
+    return before if target - before <= after - target else after
+
+
+def nearest_populated_date(target: date, direction: str) -> Optional[date]:
+    """The closest performance_date with clips in ``direction`` from ``target`` (inclusive)."""
+    before = populated_date_on_or_before(target).first() if direction != "after" else None
+    if before == target:
+        return before
+    after = populated_date_on_or_after(target).first() if direction != "before" else None
+    return closest_date(target, before, after)
+
+
+def contributor_pk_query(contributor_id: str) -> QuerySet:
+    return Contributor.objects.filter(public_id=contributor_id).values_list("pk", flat=True)
+
+
+def parse_page(params) -> Tuple[Cursor | None, int]:
+    """Parse the ``cursor`` and ``limit`` query parameters. Raises ValueError."""
+    limit = parse_limit(params.get("limit"))
+    cursor = decode_cursor(params["cursor"]) if params.get("cursor") else None
+    return cursor, limit
+
+
+def contributor_clip_rows(contributor_pk: int) -> QuerySet:
+    """One contributor's clips; pages are seeks on ``clip_contributor_chrono_idx``."""
+    return clip_rows().filter(contributor_id=contributor_pk)
+
+
+def clip_page_to_dict(rows: List[Tuple[Any, ...]], next_cursor: str | None) -> Dict[str, Any]:
+    return {
+        "items": [clip_row_to_dict(row) for row in rows],
+        "next_cursor": next_cursor,
+    }
+
+
+@reads_from_replica
+@condition_on_clip_range(listing_range)
+@api_view(["GET"])
+def list_clips(request):
+    try:
+        qs, cursor, limit, cache_params = parse_clip_listing(request.query_params)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def build() -> Dict[str, Any]:
+        return clip_page_to_dict(*paginate(qs, cursor, limit))
+
+    return Response(cached_read("clips", cache_params, build))
+
+
+@reads_from_replica
+@condition_on_clips(month_day_clips)
+@api_view(["GET"])
+def list_clips_on_this_day(request):
+    try:
+        qs, cursor, limit, cache_params = parse_on_this_day(request.query_params)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def build() -> Dict[str, Any]:
+        return clip_page_to_dict(*paginate(qs, cursor, limit))
+
+    return Response(cached_read("on-this-day", cache_params, build))
+
+
+@reads_from_replica
+@api_view(["GET"])
+def list_clip_neighbors(request, clip_id: str, direction: str):
+    """The ``limit`` clips right after (``next``) or before (``prev``) a clip.
+
+    One unique lookup for the anchor, then one keyset seek along
+    ``clip_chrono_idx`` (backwards for ``prev``), whatever the anchor's position.
+    """
+    try:
+        limit = parse_neighbors(request.query_params)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def build() -> Dict[str, Any] | None:
+        anchor = clip_anchor_query(clip_id).first()
+        if anchor is None:
+            return None
+        page = paginate if direction == "next" else paginate_before
+        return clip_page_to_dict(*page(clip_rows(), Cursor(*anchor), limit))
+
+    data = cached_read("neighbors", (clip_id, direction, limit), build)
+    if data is None:
+        return Response({"detail": "Clip not found"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(data)
+
+
+@reads_from_replica
+@api_view(["GET"])
+def get_nearest_clips(request):
+    """The nearest date with clips (at most two seeks) and the first page of its clips.
+
+    ``next_cursor`` continues ``GET /clips?from=<date>&to=<date>``.
+    """
+    try:
+        target, direction, limit = parse_nearest(request.query_params)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    def build() -> Dict[str, Any]:
+        found = nearest_populated_date(target, direction)
+        if found is None:
+            return {"date": None, "items": [], "next_cursor": None}
+        page = paginate(clip_rows().filter(performance_date=found), None, limit)
+        return {"date": format_date(found), **clip_page_to_dict(*page)}
+
+    return Response(cached_read("nearest", (target, direction, limit), build))
+
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+@require_GET
+def export_clips(request):
+    """Stream every clip (optionally with its submission) as NDJSON or CSV.
+
+    A plain Django view rather than ``@api_view``: nothing here needs DRF's
+    parsing or rendering, and its ``?format=`` negotiation would reject ``csv``.
+    """
+    params = request.GET
+    fmt = params.get("format", "ndjson")
+    if fmt not in EXPORT_CONTENT_TYPES:
+        return JsonResponse(
+            {"detail": "format must be one of: ndjson, csv"}, status=400
+        )
+    include_submission = params.get("include") == "submission"
+    try:
+        start, end = listing_range(request)
+    except ValueError as e:
+        return JsonResponse({"detail": str(e)}, status=400)
+
+    rows = iter_clip_rows(start, end, include_submission=include_submission)
+    if fmt == "csv":
+        lines = csv_lines(rows, export_fields(include_submission))
+    else:
+        lines = ndjson_lines(rows)
+
+    response = StreamingHttpResponse(lines, content_type=EXPORT_CONTENT_TYPES[fmt])
+    response["Content-Disposition"] = f'attachment; filename="clips.{fmt}"'
+    return response
+
+
+@reads_from_replica
+@condition_on_clip
+@api_view(["GET"])
+def get_clip(request, clip_id: str):
+    def build() -> Dict[str, Any] | None:
+        row = clip_rows().filter(public_id=clip_id).first()
+        return clip_row_to_dict(row) if row else None
+
+    data = cached_read("clip", clip_id, build)
+    if data is None:
+        return Response({"detail": "Clip not found"}, status=status.HTTP_404_NOT_FOUND)
+    return Response(data)
+
+
+@reads_from_replica
+@api_view(["GET"])
+def get_submission(request, submission_id: str):
+    # Queued by this process and not committed yet (asynchronous mode).
+    pending = group_commit.pending(submission_id)
+    if pending is not None:
+        return Response(pending)
+    submission = (
+        Submission.objects.select_related("contributor", "clip")
+        .filter(public_id=submission_id)
+        .first()
+    )
+    if submission is None:
+        return Response(
+            {"detail": "Submission not found"}, status=status.HTTP_404_NOT_FOUND
+        )
+    return Response(submission_to_dict(submission))
+
+
+@reads_from_replica
+@condition_on_clip_range(calendar_range)
+@api_view(["GET"])
+def get_calendar(request):
+    params = request.query_params
+    try:
+        year = int(params["year"])
+        month = int(params["month"]) if params.get("month") else None
+        start, end = month_range(year, month)
+    except KeyError:
+        return Response({"detail": "year is required"}, status=status.HTTP_400_BAD_REQUEST)
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    days = calendar_days(start, end)
+    months: Dict[int, int] = {}
+    for day, count in days:
+        months[day.month] = months.get(day.month, 0) + count
 
     return Response(
         {
-            "id": submission.public_id,
-            "contributor_id": contributor.public_id,
-            "clip_id": clip_id,
-            "status": status_str,
-            "validation_error": validation_error,
-            "raw_youtube_input": payload["raw_youtube_input"],
-            "raw_date_input": payload["raw_date_input"],
-            "title": payload.get("title"),
-            "notes": payload.get("notes"),
-            "submitted_at": dt_to_z(submission.submitted_at),
-        },
-        status=http_status,
+            "year": year,
+            "month": month,
+            "total": sum(months.values()),
+            "months": [{"month": m, "clip_count": n} for m, n in months.items()],
+            "days": [
+                {"date": day.isoformat(), "clip_count": count} for day, count in days
+            ],
+        }
+    )
+
+
+@api_view(["GET"])
+def get_submission_stats(request):
+    params = request.query_params
+    try:
+        start = date.fromisoformat(params["from"]) if params.get("from") else None
+        end = date.fromisoformat(params["to"]) if params.get("to") else None
+    except ValueError as e:
+        return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+    contributor_pk = None
+    if params.get("contributor_id"):
+        contributor_pk = contributor_pk_query(params["contributor_id"]).first()
+        if contributor_pk is None:
+            return Response({"detail": "Contributor not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    # Served from the daily rollups only; recent days appear once folded.
+    return Response(submission_stats(start, end, contributor_pk))
+
+
+@require_GET
+def get_metrics(request):
+    """Request histograms of every worker process in Prometheus text format."""
+    return HttpResponse(
+        render_prometheus(collect()),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
     )
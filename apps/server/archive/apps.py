@@ -3,3 +3,10 @@ from django.apps import AppConfig
 
 class ArchiveConfig(AppConfig):
     name = "archive"
+
+    def ready(self) -> None:
+        from django.db.backends.signals import connection_created
+
+        from archive.metrics import install_query_wrapper
+
+        connection_created.connect(install_query_wrapper, dispatch_uid="archive-metrics")
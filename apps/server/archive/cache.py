@@ -0,0 +1,159 @@
+"""Versioned read-through cache for archive reads.
+
+Cached entries are keyed by an archive version that is bumped in the same
+transaction that creates a Clip, so accepted submissions implicitly invalidate
+every cached read while rejected and duplicate submissions invalidate nothing.
+Stale versions are never deleted explicitly; they age out of the LRU.
+
+The version is a sharded counter (``ArchiveVersion``): a writer bumps one of
+its rows at random and holds only that row's lock until it commits, so
+concurrent writers on PostgreSQL do not queue behind a single row. Reading
+it sums the rows in one query.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+import random
+from typing import Any, Awaitable, Callable, Dict
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import F, Sum
+
+from archive.models import ArchiveVersion
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Bytes held per named cache; shared by all instances like LocMemCache's store.
+_used_bytes: Dict[str, int] = {}
+
+
+class LRUMemoryCache(LocMemCache):
+    """In-process LRU cache bounded by both entry count and total size.
+
+    Extends Django's LocMemCache (already LRU by entry count) with an
+    ``OPTIONS["MAX_BYTES"]`` limit on the pickled size of stored values.
+    Least recently used entries are evicted until the cache fits.
+    """
+
+    def __init__(self, name, params):
+        super().__init__(name, params)
+        self._name = name
+        self._max_bytes = int(params.get("OPTIONS", {}).get("MAX_BYTES", DEFAULT_MAX_BYTES))
+        _used_bytes.setdefault(name, 0)
+
+    @property
+    def used_bytes(self) -> int:
+        return _used_bytes[self._name]
+
+    def _adjust(self, delta: int) -> None:
+        _used_bytes[self._name] += delta
+
+    def _set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        # LocMemCache._set, with the replaced entry's size read after the cull
+        # (which may have evicted it and already subtracted it).
+        if len(self._cache) >= self._max_entries:
+            self._cull()
+        old = self._cache.get(key)
+        self._cache[key] = value
+        self._cache.move_to_end(key, last=False)
+        self._expire_info[key] = self.get_backend_timeout(timeout)
+        self._adjust(len(value) - (len(old) if old is not None else 0))
+        # The new entry sits at the front; evict from the back until we fit.
+        while _used_bytes[self._name] > self._max_bytes and len(self._cache) > 1:
+            evicted_key, evicted = self._cache.popitem()
+            self._expire_info.pop(evicted_key, None)
+            self._adjust(-len(evicted))
+
+    def _cull(self):
+        if self._cull_frequency == 0:
+            self._cache.clear()
+            self._expire_info.clear()
+            _used_bytes[self._name] = 0
+            return
+        for _ in range(len(self._cache) // self._cull_frequency):
+            key, value = self._cache.popitem()
+            self._expire_info.pop(key, None)
+            self._adjust(-len(value))
+
+    def _delete(self, key):
+        value = self._cache.get(key)
+        deleted = super()._delete(key)
+        if deleted and value is not None:
+            self._adjust(-len(value))
+        return deleted
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_and_validate_key(key, version=version)
+        with self._lock:
+            if self._has_expired(key):
+                self._delete(key)
+                raise ValueError("Key '%s' not found" % key)
+            old = self._cache[key]
+            new_value = pickle.loads(old) + delta
+            pickled = pickle.dumps(new_value, self.pickle_protocol)
+            self._cache[key] = pickled
+            self._cache.move_to_end(key, last=False)
+            self._adjust(len(pickled) - len(old))
+        return new_value
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+            self._expire_info.clear()
+            _used_bytes[self._name] = 0
+
+    # The store is in-process and never blocks on I/O, so the async API can
+    # call straight through instead of BaseCache's default thread hop.
+    async def aget(self, key, default=None, version=None):
+        return self.get(key, default, version)
+
+    async def aset(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.set(key, value, timeout, version)
+
+
+def archive_version() -> int:
+    """Current archive version (one aggregate over the counter's rows)."""
+    return ArchiveVersion.objects.aggregate(version=Sum("version"))["version"] or 0
+
+
+async def aarchive_version() -> int:
+    return (await ArchiveVersion.objects.aaggregate(version=Sum("version")))["version"] or 0
+
+
+def bump_archive_version() -> None:
+    """Invalidate all cached archive reads. Call inside the Clip-creating transaction."""
+    shard = random.randint(1, ArchiveVersion.SHARDS)
+    updated = ArchiveVersion.objects.filter(pk=shard).update(version=F("version") + 1)
+    if not updated:
+        ArchiveVersion.objects.get_or_create(pk=shard, defaults={"version": 1})
+
+
+def _cache_key(version: int, namespace: str, params: Any) -> str:
+    digest = hashlib.blake2b(repr(params).encode("utf-8"), digest_size=16).hexdigest()
+    return f"archive:v{version}:{namespace}:{digest}"
+
+
+def cached_read(namespace: str, params: Any, build: Callable[[], Any]) -> Any:
+    """Return ``build()`` through the cache, keyed by the current archive version."""
+    key = _cache_key(archive_version(), namespace, params)
+    value = cache.get(key)
+    if value is None:
+        value = build()
+        cache.set(key, value)
+    return value
+
+
+async def acached_read(
+    namespace: str, params: Any, build: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Async ``cached_read``; ``build`` is awaited. Shares entries with the sync path."""
+    key = _cache_key(await aarchive_version(), namespace, params)
+    value = await cache.aget(key)
+    if value is None:
+        value = await build()
+        await cache.aset(key, value)
+    return value
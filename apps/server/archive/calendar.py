@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection, transaction
+from django.db.models import Count
+
+from archive.db import lock_for_rebuild
+from archive.models import CalendarDay, Clip
+
+
+def record_new_clips(performance_dates: Iterable[date]) -> None:
+    """Add newly created clips to the per-day counts.
+
+    Must be called inside the transaction that inserted the clips. Uses a single
+    ``INSERT ... ON CONFLICT DO UPDATE`` per distinct day so concurrent writers
+    never lose increments.
+    """
+    counts = Counter(performance_dates)
+    if not counts:
+        return
+    qn = connection.ops.quote_name
+    table = qn(CalendarDay._meta.db_table)
+    sql = (
+        f"INSERT INTO {table} ({qn('performance_date')}, {qn('clip_count')}) "
+        f"VALUES (%s, %s) "
+        f"ON CONFLICT ({qn('performance_date')}) DO UPDATE "
+        f"SET {qn('clip_count')} = {table}.{qn('clip_count')} + excluded.{qn('clip_count')}"
+    )
+    params = [
+        (connection.ops.adapt_datefield_value(d), n) for d, n in sorted(counts.items())
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def month_range(year: int, month: Optional[int]) -> Tuple[date, date]:
+    """Return the inclusive [start, end] dates of a year or a single month."""
+    if month is None:
+        return date(year, 1, 1), date(year, 12, 31)
+    start = date(year, month, 1)
+    next_month = date(year + month // 12, month % 12 + 1, 1)
+    return start, date.fromordinal(next_month.toordinal() - 1)
+
+
+def parse_month_day(params) -> Tuple[int, int]:
+    """Parse the ``month`` and ``day`` query parameters into a day of the year.
+
+    February 29 is accepted. Raises ValueError if either is missing or they
+    do not form a valid day.
+    """
+    if not params.get("month") or not params.get("day"):
+        raise ValueError("month and day are required")
+    try:
+        month, day = int(params["month"]), int(params["day"])
+        date(2000, month, day)  # a leap year
+    except ValueError as e:
+        raise ValueError("month and day must form a valid day of the year") from e
+    return month, day
+
+
+def calendar_days(start: date, end: date) -> List[Tuple[date, int]]:
+    """Return (performance_date, clip_count) for populated days in [start, end]."""
+    return list(
+        CalendarDay.objects.filter(
+            performance_date__range=(start, end), clip_count__gt=0
+        )
+        .order_by("performance_date")
+        .values_list("performance_date", "clip_count")
+    )
+
+
+def actual_counts() -> Dict[date, int]:
+    """Per-day clip counts computed from the Clip table (the source of truth)."""
+    return dict(
+        Clip.objects.values("performance_date")
+        .annotate(n=Count("id"))
+        .values_list("performance_date", "n")
+        .order_by()
+    )
+
+
+def stored_counts() -> Dict[date, int]:
+    return dict(
+        CalendarDay.objects.filter(clip_count__gt=0).values_list(
+            "performance_date", "clip_count"
+        )
+    )
+
+
+def diff_counts() -> Dict[date, Tuple[int, int]]:
+    """Return {day: (stored, actual)} for every day where the table has drifted."""
+    stored = stored_counts()
+    actual = actual_counts()
+    return {
+        d: (stored.get(d, 0), actual.get(d, 0))
+        for d in stored.keys() | actual.keys()
+        if stored.get(d, 0) != actual.get(d, 0)
+    }
+
+
+def rebuild_calendar() -> int:
+    """Recompute every per-day count from the Clip table. Returns the number of days.
+
+    Clip writers are held off for the duration (see ``lock_for_rebuild``), so
+    no increment can land between the count and the rewrite.
+    """
+    with transaction.atomic():
+        lock_for_rebuild(CalendarDay)
+        actual = actual_counts()
+        CalendarDay.objects.all().delete()
+        CalendarDay.objects.bulk_create(
+            CalendarDay(performance_date=d, clip_count=n) for d, n in actual.items()
+        )
+    return len(actual)
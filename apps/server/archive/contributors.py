@@ -0,0 +1,124 @@
+"""Denormalized per-contributor counters.
+
+``Contributor`` carries accepted/rejected submission counts and a clip count
+so profile reads never aggregate over a curator's (possibly tens of
+thousands of) submissions. They are incremented with ``F()`` updates in the
+same transaction that inserts the submissions, so they commit or roll back
+together; ``manage.py rebuild_contributor_counts`` recomputes them from the
+Submission and Clip tables (and, for rejected submissions already folded and
+possibly compacted away, from the rollups; see ``archive.rollups``).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, IntegerField, OuterRef, QuerySet, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+from archive.db import lock_for_rebuild
+from archive.models import Clip, Contributor, Submission, SubmissionRollup
+from archive.rollups import folded_before, folded_through
+
+COUNTER_FIELDS = ("accepted_submission_count", "rejected_submission_count", "clip_count")
+
+Counts = Tuple[int, int, int]
+
+
+def record_submissions(submissions: Iterable[Submission]) -> None:
+    """Add newly inserted submissions to their contributors' counters.
+
+    Must be called inside the transaction that inserted them. Every accepted
+    submission has just created one clip attributed to its contributor, so it
+    also counts towards ``clip_count``. One UPDATE per distinct contributor,
+    in pk order so concurrent writers lock rows in the same order.
+    """
+    deltas: Dict[int, List[int]] = {}
+    for submission in submissions:
+        delta = deltas.setdefault(submission.contributor_id, [0, 0])
+        delta[0 if submission.status == Submission.Status.ACCEPTED else 1] += 1
+    for contributor_id, (accepted, rejected) in sorted(deltas.items()):
+        changes = {}
+        if accepted:
+            changes["accepted_submission_count"] = F("accepted_submission_count") + accepted
+            changes["clip_count"] = F("clip_count") + accepted
+        if rejected:
+            changes["rejected_submission_count"] = F("rejected_submission_count") + rejected
+        Contributor.objects.filter(pk=contributor_id).update(**changes)
+
+
+def _per_contributor(qs: QuerySet, aggregate) -> Coalesce:
+    """Correlated ``aggregate`` of ``qs`` per outer Contributor (0 when empty)."""
+    aggregated = (
+        qs.filter(contributor=OuterRef("pk"))
+        .order_by()
+        .values("contributor")
+        .annotate(n=aggregate)
+        .values("n")
+    )
+    return Coalesce(Subquery(aggregated, output_field=IntegerField()), Value(0))
+
+
+def _count(qs: QuerySet) -> Coalesce:
+    return _per_contributor(qs, Count("pk"))
+
+
+def actual_counts_expressions() -> Dict[str, Coalesce]:
+    """Per-contributor expressions computing each counter from the source tables.
+
+    Rejected submissions on folded days are counted from the rollups, since
+    compaction may have deleted them; the rest are counted directly.
+    """
+    rejected = Submission.objects.filter(status=Submission.Status.REJECTED)
+    through = folded_through()
+    if through is None:
+        rejected_count = _count(rejected)
+    else:
+        folded = SubmissionRollup.objects.filter(day__lte=through).exclude(
+            outcome=SubmissionRollup.Outcome.ACCEPTED
+        )
+        rejected_count = _per_contributor(folded, Sum("submission_count")) + _count(
+            rejected.filter(submitted_at__gte=folded_before())
+        )
+    return {
+        "accepted_submission_count": _count(
+            Submission.objects.filter(status=Submission.Status.ACCEPTED)
+        ),
+        "rejected_submission_count": rejected_count,
+        "clip_count": _count(Clip.objects.all()),
+    }
+
+
+def diff_counts() -> Dict[str, Tuple[Counts, Counts]]:
+    """Return {contributor public_id: (stored, actual)} for every drifted contributor."""
+    actual = {f"actual_{name}": expr for name, expr in actual_counts_expressions().items()}
+    rows = Contributor.objects.annotate(**actual).values_list(
+        "public_id", *COUNTER_FIELDS, *actual
+    )
+    drift = {}
+    for public_id, *values in rows.iterator(chunk_size=2000):
+        stored, computed = tuple(values[:3]), tuple(values[3:])
+        if stored != computed:
+            drift[public_id] = (stored, computed)
+    return drift
+
+
+def rebuild_contributor_counts(chunk_size: int = 1000) -> int:
+    """Recompute every contributor's counters. Returns the number of contributors.
+
+    Each chunk of contributors is rewritten by a single UPDATE in its own
+    transaction, so the command never holds the write lock for long. Each
+    transaction first locks the Contributor table (see ``lock_for_rebuild``)
+    so a submission committed mid-chunk cannot be missed by the recount and
+    then overwritten.
+    """
+    pks = list(Contributor.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(pks), chunk_size):
+        chunk = pks[start : start + chunk_size]
+        with transaction.atomic():
+            lock_for_rebuild(Contributor)
+            Contributor.objects.filter(pk__gte=chunk[0], pk__lte=chunk[-1]).update(
+                **actual_counts_expressions()
+            )
+    return len(pks)
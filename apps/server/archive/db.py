@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import random
+import time
+from typing import Callable, Type, TypeVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.db.models import Model
+
+T = TypeVar("T")
+
+_LOCK_MESSAGES = ("database is locked", "database table is locked")
+
+# PostgreSQL SQLSTATEs for serialization_failure and deadlock_detected.
+_RETRYABLE_SQLSTATES = ("40001", "40P01")
+
+
+def is_lock_error(exc: BaseException) -> bool:
+    """True for transient lock errors worth retrying the whole transaction for.
+
+    Covers SQLite's "database is locked" and PostgreSQL serialization failures
+    and deadlocks (read from the driver exception Django wraps).
+    """
+    if not isinstance(exc, OperationalError):
+        return False
+    cause = exc.__cause__
+    sqlstate = getattr(cause, "sqlstate", None) or getattr(cause, "pgcode", None)
+    if sqlstate in _RETRYABLE_SQLSTATES:
+        return True
+    return any(m in str(exc).lower() for m in _LOCK_MESSAGES)
+
+
+def retry_on_lock(func: Callable[[], T], using: str = DEFAULT_DB_ALIAS) -> T:
+    """Call ``func`` and retry it when the database reports a lock error.
+
+    ``func`` must own its whole transaction (e.g. wrap ``transaction.atomic()``)
+    and rebuild any state it writes, since a failed attempt is rolled back.
+    Retries use exponential backoff with full jitter, bounded by
+    ``ARCHIVE_WRITE_RETRY_ATTEMPTS`` / ``_BASE_DELAY`` / ``_MAX_DELAY``. Inside
+    an enclosing atomic block the error is re-raised immediately, because only
+    the outermost transaction can be safely retried.
+    """
+    attempts = getattr(settings, "ARCHIVE_WRITE_RETRY_ATTEMPTS", 5)
+    base_delay = getattr(settings, "ARCHIVE_WRITE_RETRY_BASE_DELAY", 0.02)
+    max_delay = getattr(settings, "ARCHIVE_WRITE_RETRY_MAX_DELAY", 0.5)
+
+    for attempt in range(1, attempts + 1):
+        try:
+            return func()
+        except OperationalError as e:
+            if (
+                attempt == attempts
+                or not is_lock_error(e)
+                or connections[using].in_atomic_block
+            ):
+                raise
+            time.sleep(random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1))))
+    raise AssertionError("unreachable")
+
+
+def lock_for_rebuild(model: Type[Model], using: str = DEFAULT_DB_ALIAS) -> None:
+    """Block concurrent writes to ``model``'s table until the transaction ends.
+
+    Must be called inside ``transaction.atomic()`` before reading the source
+    tables. On PostgreSQL this takes ``SHARE ROW EXCLUSIVE``, which waits for
+    in-flight writers to commit and holds off new ones, so under READ
+    COMMITTED the rebuild's queries see every committed increment and none
+    lands between its read and its write. SQLite already serializes writers
+    on the database lock, so nothing is needed there.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE")
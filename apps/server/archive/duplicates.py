@@ -0,0 +1,206 @@
+"""Process-local Bloom filter over the ``(youtube_video_id, performance_date)`` of every Clip.
+
+Many submissions are duplicates of famous shows. The filter lets the write
+paths tell, without touching the database, that a pair is *definitely not*
+in the archive yet:
+
+- ``POST /submissions`` checks a pair the filter may contain with a SELECT
+  before taking the write lock. A confirmed duplicate is then recorded in a
+  transaction holding only the Submission INSERT and the contributor counter
+  UPDATE (the counters must move with the row), and the Clip insert that
+  could only conflict is never attempted. A new pair, the filter's usual
+  answer for one, goes straight to the conflict-aware insert with no
+  SELECT at all.
+- ``ingest_batch`` only SELECTs the pairs the filter may contain.
+
+The database stays the source of truth. The filter is built from the Clip
+table in a background thread started on first use (until it is ready every
+pair "may exist", so callers fall back to the database), updated when this
+process creates clips, caught up
+incrementally (by pk) with clips other processes created every
+``ARCHIVE_DUPLICATE_FILTER_SYNC_SECONDS``, and rebuilt from scratch in a
+background thread every ``ARCHIVE_DUPLICATE_FILTER_RECONCILE_SECONDS`` (which
+also drops pairs of rolled-back inserts and resizes it as the archive grows).
+A pair missed in between can only cause a false "absent": the single-submission
+path then takes its normal conflict-aware insert, and the batch path's insert
+hits the unique constraint and is retried without the filter.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import threading
+import time
+from datetime import date
+from typing import Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import connections
+
+from archive.models import Clip
+
+ClipKey = Tuple[str, date]
+
+ERROR_RATE = 0.01
+MIN_CAPACITY = 100_000
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of ClipKeys (bit array + double hashing)."""
+
+    def __init__(self, capacity: int, error_rate: float = ERROR_RATE) -> None:
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: ClipKey):
+        digest = hashlib.blake2b(
+            f"{key[0]}|{key[1].isoformat()}".encode("utf-8"), digest_size=16
+        ).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hashes):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: ClipKey) -> None:
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: ClipKey) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._bits)
+
+
+class DuplicateFilter:
+    """The process's Bloom filter plus its warm-up and reconciliation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bloom: Optional[BloomFilter] = None
+        self._watermark = 0  # highest Clip pk folded into the filter
+        self._synced_at = 0.0
+        self._reconciled_at = 0.0
+        self._reconciling = False
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def enabled() -> bool:
+        return settings.ARCHIVE_DUPLICATE_FILTER
+
+    def might_exist(self, key: ClipKey) -> bool:
+        """False only if no Clip with ``key`` existed at the last sync.
+
+        Always True when the filter is disabled or still warming up.
+        """
+        if not self.enabled():
+            return True
+        bloom = self._current()
+        return bloom is None or key in bloom
+
+    def add(self, keys: Iterable[ClipKey]) -> None:
+        """Record keys of clips this process just inserted."""
+        bloom = self._bloom
+        if bloom is None:
+            return  # the warm-up will read them from the table
+        with self._lock:
+            for key in keys:
+                bloom.add(key)
+
+    def reset(self) -> None:
+        """Forget everything; the next use starts warming the filter again."""
+        with self._lock:
+            self._bloom = None
+            self._watermark = 0
+
+    def clear(self) -> None:
+        """Start from an empty, already warm filter (for a known-empty archive)."""
+        with self._lock:
+            self._bloom = BloomFilter(MIN_CAPACITY)
+            self._watermark = 0
+            self._synced_at = self._reconciled_at = time.monotonic()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        """Wait for a background rebuild, if one is running."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _current(self) -> Optional[BloomFilter]:
+        bloom = self._bloom
+        if bloom is None:
+            # Never build it in the caller, which may hold the write lock.
+            self._reconcile_in_background()
+            return None
+        now = time.monotonic()
+        sync_every = settings.ARCHIVE_DUPLICATE_FILTER_SYNC_SECONDS
+        if sync_every is not None and now - self._synced_at >= sync_every:
+            self.sync()
+        reconcile_every = settings.ARCHIVE_DUPLICATE_FILTER_RECONCILE_SECONDS
+        if (
+            reconcile_every is not None
+            and now - self._reconciled_at >= reconcile_every
+            and not self._reconciling
+        ) or bloom.count > bloom.capacity:
+            self._reconcile_in_background()
+        return self._bloom or bloom
+
+    def sync(self) -> int:
+        """Fold in clips created (by any process) since the last sync. Returns how many."""
+        self._synced_at = time.monotonic()
+        rows = list(
+            Clip.objects.filter(pk__gt=self._watermark)
+            .order_by("pk")
+            .values_list("pk", "youtube_video_id", "performance_date")
+        )
+        if rows:
+            with self._lock:
+                if self._bloom is not None:
+                    for _, video_id, performance_date in rows:
+                        self._bloom.add((video_id, performance_date))
+                self._watermark = max(self._watermark, rows[-1][0])
+        return len(rows)
+
+    def reconcile(self) -> BloomFilter:
+        """Rebuild the filter from the Clip table and swap it in."""
+        started = time.monotonic()
+        rows = Clip.objects.order_by().values_list("pk", "youtube_video_id", "performance_date")
+        count = rows.count()
+        bloom = BloomFilter(max(MIN_CAPACITY, 2 * count))
+        watermark = 0
+        for pk, video_id, performance_date in rows.iterator(chunk_size=10_000):
+            bloom.add((video_id, performance_date))
+            watermark = max(watermark, pk)
+        with self._lock:
+            self._bloom = bloom
+            self._watermark = watermark
+            self._synced_at = self._reconciled_at = started
+        return bloom
+
+    def _reconcile_in_background(self) -> None:
+        with self._lock:
+            if self._reconciling:
+                return
+            self._reconciling = True
+
+        def run() -> None:
+            try:
+                self.reconcile()
+            finally:
+                self._reconciling = False
+                connections.close_all()
+
+        self._thread = threading.Thread(
+            target=run, name="duplicate-filter-reconcile", daemon=True
+        )
+        self._thread.start()
+
+
+duplicate_filter = DuplicateFilter()
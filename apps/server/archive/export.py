@@ -0,0 +1,126 @@
+"""Constant-memory export of the archive as NDJSON or CSV.
+
+Rows are read with ``QuerySet.iterator()`` in chunks and rendered one line at a
+time, so memory use does not depend on archive size.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from archive.api.pagination import CHRONO_ORDER
+from archive.formatting import dt_to_z, format_date, youtube_url
+from archive.models import Clip
+
+CHUNK_SIZE = 2000
+
+CLIP_FIELDS = [
+    "id",
+    "youtube_video_id",
+    "youtube_url",
+    "performance_date",
+    "title",
+    "notes",
+    "created_at",
+    "created_by_contributor_id",
+    "added_via_submission_id",
+]
+
+SUBMISSION_FIELDS = [
+    "submission_raw_youtube_input",
+    "submission_raw_date_input",
+    "submission_title",
+    "submission_notes",
+    "submission_submitted_at",
+]
+
+_COLUMNS = [
+    "public_id",
+    "youtube_video_id",
+    "performance_date",
+    "title",
+    "notes",
+    "created_at",
+    "contributor__public_id",
+    "submissions__public_id",
+]
+
+_SUBMISSION_COLUMNS = [
+    "submissions__raw_youtube_input",
+    "submissions__raw_date_input",
+    "submissions__title",
+    "submissions__notes",
+    "submissions__submitted_at",
+]
+
+
+def export_fields(include_submission: bool) -> List[str]:
+    return CLIP_FIELDS + (SUBMISSION_FIELDS if include_submission else [])
+
+
+def iter_clip_rows(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    include_submission: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Yield every clip in [start, end] in chronological order as an export row."""
+    qs = Clip.objects.all()
+    if start is not None:
+        qs = qs.filter(performance_date__gte=start)
+    if end is not None:
+        qs = qs.filter(performance_date__lte=end)
+    columns = _COLUMNS + (_SUBMISSION_COLUMNS if include_submission else [])
+    rows = qs.order_by(*CHRONO_ORDER).values_list(*columns)
+
+    for row in rows.iterator(chunk_size=chunk_size):
+        public_id, video_id, perf, title, notes, created, contributor_id, sub_id = row[:8]
+        item: Dict[str, Any] = {
+            "id": public_id,
+            "youtube_video_id": video_id,
+            "youtube_url": youtube_url(video_id),
+            "performance_date": format_date(perf),
+            "title": title,
+            "notes": notes,
+            "created_at": dt_to_z(created),
+            "created_by_contributor_id": contributor_id,
+            "added_via_submission_id": sub_id,
+        }
+        if include_submission:
+            raw_yt, raw_date, sub_title, sub_notes, submitted = row[8:]
+            item.update(
+                {
+                    "submission_raw_youtube_input": raw_yt,
+                    "submission_raw_date_input": raw_date,
+                    "submission_title": sub_title,
+                    "submission_notes": sub_notes,
+                    "submission_submitted_at": dt_to_z(submitted) if submitted else None,
+                }
+            )
+        yield item
+
+
+# json.dumps builds a new encoder per call for non-default options; reuse one.
+_encode_json = json.JSONEncoder(ensure_ascii=False).encode
+
+
+def ndjson_lines(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield _encode_json(row) + "\n"
+
+
+class _Echo:
+    """File-like object whose write() returns the value instead of storing it."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def csv_lines(rows: Iterable[Dict[str, Any]], fields: List[str]) -> Iterator[str]:
+    writer = csv.DictWriter(_Echo(), fieldnames=fields)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
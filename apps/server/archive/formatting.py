@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib formatting below is equivalent, only slower
+    orjson = None
+
+UTC = timezone.utc
+
+# Clip pages repeat a small set of performance dates; 2^16 covers ~180 years of days.
+DATE_CACHE_SIZE = 65536
+
+
+def utc_now_z() -> str:
+    return datetime.now(UTC).isoformat().replace("+00:00", "Z")
+
+
+def _isoformat_z(dt: datetime) -> str:
+    return dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
+
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _OPT_UTC_Z = orjson.OPT_UTC_Z
+
+    def dt_to_z(dt: datetime) -> str:
+        # orjson formats a UTC datetime exactly like isoformat() (microseconds
+        # only when non-zero) with a "Z" suffix, in C and without the replace().
+        if dt.tzinfo is UTC:
+            return _dumps(dt, option=_OPT_UTC_Z)[1:-1].decode()
+        return _isoformat_z(dt)
+
+else:
+    dt_to_z = _isoformat_z
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def format_date(d: date) -> str:
+    return d.isoformat()
+
+
+def youtube_url(video_id: str) -> str:
+    return f"https://www.youtube.com/watch?v={video_id}"
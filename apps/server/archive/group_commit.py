@@ -0,0 +1,182 @@
+"""Group commit for POST /submissions in asynchronous mode.
+
+With ``ARCHIVE_ASYNC_SUBMISSIONS`` the view validates a submission, assigns
+its public id and hands it to ``group_commit``, an in-process worker thread,
+answering ``202 Accepted`` right away. The worker waits up to
+``ARCHIVE_GROUP_COMMIT_WINDOW`` seconds for more submissions (at most
+``ARCHIVE_GROUP_COMMIT_MAX_BATCH``), then writes them with ``ingest_batch``:
+one transaction, one duplicate-check query and bulk inserts, so a burst pays
+for one write lock and one fsync instead of one per submission.
+
+Until its batch commits a submission is only known to the process that
+accepted it; ``pending()`` returns its 202 representation so GET
+/submissions/{id} can report it. Queued submissions are flushed at exit; a
+crash loses them (their clients only ever saw ``pending``).
+
+If a batch fails, its submissions are retried one at a time so one bad item
+cannot take the others down. A submission that still cannot be written is
+reported by ``pending()`` as rejected with ``WRITE_FAILED_ERROR`` (the last
+``MAX_FAILED`` of them, until the process exits) instead of vanishing.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, cast
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from archive.ingest import SubmissionInput, ingest_batch
+from archive.models import Submission
+
+logger = logging.getLogger(__name__)
+
+# Status reported for a valid submission until its batch commits.
+PENDING = "pending"
+
+# Queued by ``flush()`` to end the batch being collected.
+_FLUSH = object()
+
+WRITE_FAILED_ERROR = "Submission could not be saved; please submit it again"
+
+# Failed submissions remembered for GET /submissions/{id}.
+MAX_FAILED = 10_000
+
+
+@dataclass
+class PendingSubmission:
+    item: SubmissionInput
+    representation: Dict[str, Any]
+
+
+class GroupCommitWorker:
+    """Collects submissions into batches and commits each in one transaction."""
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._failed: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self.batches = 0
+        self.committed = 0
+
+    def _check_fork(self) -> None:
+        # A forked worker process has the queue but not the thread.
+        if os.getpid() != self._pid:
+            self.__init__()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="submission-group-commit", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, pending: PendingSubmission) -> None:
+        """Queue ``pending.item``, whose ``public_id`` must already be set."""
+        self._check_fork()
+        with self._lock:
+            self._pending[pending.item.public_id] = pending.representation
+        self._ensure_started()
+        self._queue.put(pending)
+
+    def pending(self, public_id: str) -> Optional[Dict[str, Any]]:
+        """The representation of a submission queued here and not yet committed.
+
+        That is its 202 representation, or a rejection once its write failed.
+        """
+        with self._lock:
+            return self._pending.get(public_id) or self._failed.get(public_id)
+
+    def flush(self) -> None:
+        """Commit everything queued so far, without waiting for the window."""
+        self._check_fork()
+        if self._thread is None:
+            return
+        self._queue.put(_FLUSH)
+        self._queue.join()
+
+    def _collect(self) -> List[PendingSubmission]:
+        first = self._queue.get()
+        if first is _FLUSH:
+            self._queue.task_done()
+            return []
+        batch = [first]
+        deadline = time.monotonic() + settings.ARCHIVE_GROUP_COMMIT_WINDOW
+        while len(batch) < settings.ARCHIVE_GROUP_COMMIT_MAX_BATCH:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _FLUSH:
+                self._queue.task_done()
+                break
+            batch.append(item)
+        return batch
+
+    def _commit(self, batch: List[PendingSubmission]) -> None:
+        try:
+            try:
+                close_old_connections()
+                ingest_batch([p.item for p in batch])
+                self.committed += len(batch)
+            except Exception:
+                logger.exception("Group commit of %d submission(s) failed", len(batch))
+                for p in batch:
+                    self._commit_one(p)
+            self.batches += 1
+        finally:
+            # Only after the commit: until then GET falls back to ``pending()``.
+            with self._lock:
+                for p in batch:
+                    self._pending.pop(p.item.public_id, None)
+            for p in batch:
+                self._queue.task_done()
+
+    def _commit_one(self, pending: PendingSubmission) -> None:
+        try:
+            close_old_connections()
+            ingest_batch([pending.item])
+            self.committed += 1
+        except Exception:
+            logger.exception("Submission %s could not be saved", pending.item.public_id)
+            with self._lock:
+                self._failed[cast(str, pending.item.public_id)] = {
+                    **pending.representation,
+                    "status": Submission.Status.REJECTED.value,
+                    "validation_error": WRITE_FAILED_ERROR,
+                }
+                while len(self._failed) > MAX_FAILED:
+                    self._failed.popitem(last=False)
+
+    def _run(self) -> None:
+        while True:
+            # Never let the thread die: later submissions would stay pending
+            # forever and flush() would wait on them.
+            try:
+                batch = self._collect()
+                if batch:
+                    self._commit(batch)
+            except Exception:
+                logger.exception("Group commit worker error")
+
+
+group_commit = GroupCommitWorker()
+
+atexit.register(group_commit.flush)
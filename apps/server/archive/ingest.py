@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+from django.db import IntegrityError, connection, transaction
+
+from archive.cache import bump_archive_version
+from archive.calendar import record_new_clips
+from archive.contributors import record_submissions
+from archive.db import retry_on_lock
+from archive.duplicates import duplicate_filter
+from archive.models import Clip, Contributor, Submission
+from archive.shards import schedule_publish
+from archive.validation import DUPLICATE_CLIP_ERROR, validate_submission_batch
+
+ClipKey = Tuple[str, date]
+
+
+@dataclass
+class SubmissionInput:
+    """One submission attempt, already bound to a resolved Contributor."""
+
+    contributor: Contributor
+    raw_youtube_input: str
+    raw_date_input: str
+    title: Optional[str] = None
+    notes: Optional[str] = None
+    # Assigned up front when the id is handed out before the write (group commit).
+    public_id: Optional[str] = None
+
+
+def clips_created(clips: Sequence[Clip]) -> None:
+    """Update state derived from the Clip table after inserting ``clips``.
+
+    Must be called inside the transaction that inserted them, so derived state
+    commits or rolls back together with the clips. Static shards, which live
+    outside the database, are republished after the commit.
+    """
+    if not clips:
+        return
+    record_new_clips(c.performance_date for c in clips)
+    bump_archive_version()
+    duplicate_filter.add((c.youtube_video_id, c.performance_date) for c in clips)
+    schedule_publish(c.performance_date for c in clips)
+
+
+def insert_clip_if_absent(clip: Clip) -> bool:
+    """INSERT ``clip`` unless its (youtube_video_id, performance_date) already exists.
+
+    A single ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` statement replaces
+    a duplicate-check SELECT and the IntegrityError race path. On success
+    ``clip`` is marked saved with its new pk and True is returned.
+    """
+    opts = Clip._meta
+    fields = [f for f in opts.concrete_fields if not f.primary_key]
+    values = [f.get_db_prep_save(f.pre_save(clip, add=True), connection) for f in fields]
+    qn = connection.ops.quote_name
+    sql = (
+        f"INSERT INTO {qn(opts.db_table)} ({', '.join(qn(f.column) for f in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))}) "
+        f"ON CONFLICT ({qn('youtube_video_id')}, {qn('performance_date')}) DO NOTHING "
+        f"RETURNING {qn(opts.pk.column)}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, values)
+        row = cursor.fetchone()
+    if row is None:
+        return False
+    clip.pk = row[0]
+    clip._state.adding = False
+    clip._state.db = connection.alias
+    return True
+
+
+def clip_exists(key: ClipKey) -> bool:
+    youtube_video_id, performance_date = key
+    return Clip.objects.filter(
+        youtube_video_id=youtube_video_id, performance_date=performance_date
+    ).exists()
+
+
+def existing_clip_keys(keys: Iterable[ClipKey]) -> Set[ClipKey]:
+    """Return the subset of ``keys`` that already exist as Clips, in one query."""
+    keys = set(keys)
+    if not keys:
+        return set()
+    video_ids = {v for v, _ in keys}
+    dates = {d for _, d in keys}
+    rows = Clip.objects.filter(
+        youtube_video_id__in=video_ids, performance_date__in=dates
+    ).values_list("youtube_video_id", "performance_date")
+    return keys.intersection(rows)
+
+
+def _lookup_keys(
+    parsed: Sequence[Union[ClipKey, ValueError]], use_filter: bool
+) -> Set[ClipKey]:
+    """The valid keys of ``parsed`` that need checking against the Clip table."""
+    keys = {p for p in parsed if isinstance(p, tuple)}
+    if use_filter:
+        # Pairs the filter has never seen need no lookup; if another process
+        # added one meanwhile, the insert fails and the batch is retried
+        # without the filter.
+        keys = {k for k in keys if duplicate_filter.might_exist(k)}
+    return keys
+
+
+def _write_batch(
+    items: Sequence[SubmissionInput],
+    parsed: Sequence[Union[ClipKey, ValueError]],
+    lookup: Set[ClipKey],
+) -> List[Submission]:
+    existing = existing_clip_keys(lookup)
+    claimed: Set[ClipKey] = set()
+    clips: List[Clip] = []
+    submissions: List[Submission] = []
+
+    for item, result in zip(items, parsed):
+        submission = Submission(
+            contributor=item.contributor,
+            status=Submission.Status.REJECTED,
+            raw_youtube_input=item.raw_youtube_input,
+            raw_date_input=item.raw_date_input,
+            title=item.title,
+            notes=item.notes,
+        )
+        if item.public_id is not None:
+            submission.public_id = item.public_id
+        if isinstance(result, ValueError):
+            submission.validation_error = str(result)
+        elif result in existing or result in claimed:
+            # Duplicate against the archive or an earlier item of this batch.
+            submission.validation_error = DUPLICATE_CLIP_ERROR
+        else:
+            claimed.add(result)
+            youtube_video_id, performance_date = result
+            clip = Clip(
+                contributor=item.contributor,
+                youtube_video_id=youtube_video_id,
+                raw_youtube_input=item.raw_youtube_input,
+                performance_date=performance_date,
+                title=item.title,
+                notes=item.notes,
+            )
+            clips.append(clip)
+            submission.clip = clip
+            submission.status = Submission.Status.ACCEPTED
+        submissions.append(submission)
+
+    Clip.objects.bulk_create(clips)
+    clips_created(clips)
+    Submission.objects.bulk_create(submissions)
+    record_submissions(submissions)
+    return submissions
+
+
+def ingest_batch(
+    items: Sequence[SubmissionInput], max_attempts: int = 3
+) -> List[Submission]:
+    """Validate and persist many submissions with a constant number of queries.
+
+    Duplicates are detected set-wise, both within ``items`` and against existing
+    ``(youtube_video_id, performance_date)`` pairs, then Clips and Submissions
+    are written with ``bulk_create`` in a single transaction. If a concurrent
+    writer inserts a conflicting Clip between the check and the insert, the
+    transaction is rolled back and the batch is re-evaluated.
+
+    Returns the saved Submissions in input order; accepted ones have ``clip`` set.
+    """
+    parsed = validate_submission_batch(
+        [(item.raw_youtube_input, item.raw_date_input) for item in items]
+    )
+
+    def write(use_filter: bool) -> List[Submission]:
+        # The filter may sync from the Clip table: consult it before the
+        # transaction takes the write lock.
+        lookup = _lookup_keys(parsed, use_filter)
+        with transaction.atomic():
+            return _write_batch(items, parsed, lookup)
+
+    for attempt in range(max_attempts):
+        try:
+            return retry_on_lock(lambda: write(use_filter=attempt == 0))
+        except IntegrityError:
+            if attempt == max_attempts - 1:
+                raise
+    return []
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import gzip
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from archive.rollups import COMPACT_CHUNK_SIZE, FOLD_DAYS, compact_submissions, fold_submissions
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold submissions into the daily rollups behind GET /stats/submissions, then "
+        "delete rejected submissions older than --retain-days (optionally archiving "
+        "them to gzipped NDJSON). Runs in bounded chunks; rerun to continue."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retain-days",
+            type=int,
+            default=90,
+            help="Keep raw rejected submissions this many days (default: 90).",
+        )
+        parser.add_argument(
+            "--archive",
+            help="Append deleted submissions to this gzipped NDJSON file before deleting them.",
+        )
+        parser.add_argument(
+            "--fold-only",
+            action="store_true",
+            help="Update the rollups without deleting any submissions.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=COMPACT_CHUNK_SIZE,
+            help=f"Submissions deleted per transaction (default: {COMPACT_CHUNK_SIZE}).",
+        )
+        parser.add_argument(
+            "--fold-days",
+            type=int,
+            default=FOLD_DAYS,
+            help=f"Days folded per transaction (default: {FOLD_DAYS}).",
+        )
+        parser.add_argument(
+            "--max-seconds",
+            type=float,
+            default=None,
+            help="Stop starting new chunks after this long; the next run resumes.",
+        )
+
+    def handle(self, *args, **options):
+        if options["retain_days"] < 0 or options["chunk_size"] < 1 or options["fold_days"] < 1:
+            raise CommandError("--retain-days must be >= 0, --chunk-size and --fold-days >= 1")
+        started = time.monotonic()
+        deadline = started + options["max_seconds"] if options["max_seconds"] else None
+
+        through = fold_submissions(days_per_chunk=options["fold_days"], deadline=deadline)
+        self.stdout.write(f"Rollups cover submissions through {through or 'nothing yet'}.")
+
+        if not options["fold_only"]:
+            before = timezone.now() - timedelta(days=options["retain_days"])
+            archive = (
+                gzip.open(options["archive"], "at", encoding="utf-8")
+                if options["archive"]
+                else None
+            )
+            try:
+                deleted = compact_submissions(
+                    before, archive=archive, chunk_size=options["chunk_size"], deadline=deadline
+                )
+            finally:
+                if archive is not None:
+                    archive.close()
+            where = f" (archived to {options['archive']})" if archive is not None else ""
+            self.stdout.write(f"Deleted {deleted} rejected submission(s){where}.")
+
+        if deadline is not None and time.monotonic() >= deadline:
+            self.stdout.write("Stopped at --max-seconds; run again to continue.")
+        else:
+            self.stdout.write(self.style.SUCCESS("Compaction complete."))
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+import os
+import time
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.ingest import SubmissionInput, ingest_batch
+from archive.models import Contributor, Submission
+
+REQUIRED_FIELDS = ("contributor_id", "raw_youtube_input", "raw_date_input")
+
+
+def read_records(path: Path, fmt: str) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per record from an NDJSON or CSV file."""
+    with path.open("r", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                # CSV has no null; treat empty optional columns as missing.
+                yield {k: (v if v != "" else None) for k, v in row.items()}
+        else:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise CommandError(f"{path}:{lineno}: invalid JSON ({e})")
+
+
+def record_public_id(source: Path, index: int) -> str:
+    """Submission id of record ``index`` (0-based) of ``source``, the same on every run."""
+    key = f"{source.resolve()}:{index}".encode("utf-8")
+    return f"sub_{hashlib.blake2b(key, digest_size=16).hexdigest()}"
+
+
+def load_checkpoint(path: Path, source: Path) -> int:
+    """Return how many records of ``source`` a previous run already committed."""
+    if not path.exists():
+        return 0
+    data = json.loads(path.read_text())
+    if data.get("source") != str(source.resolve()):
+        raise CommandError(
+            f"Checkpoint {path} belongs to {data.get('source')}; use --restart to ignore it."
+        )
+    return int(data["records"])
+
+
+def save_checkpoint(path: Path, source: Path, records: int) -> None:
+    """Atomically record that the first ``records`` records are committed."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"source": str(source.resolve()), "records": records}))
+    os.replace(tmp, path)
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-import historical clips from an NDJSON or CSV file. Each record has "
+        "contributor_id, raw_youtube_input, raw_date_input and optional title/notes, "
+        "and is validated exactly like POST /submissions."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument(
+            "--format",
+            choices=["ndjson", "csv"],
+            help="Input format (default: from the file extension).",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--contributor-field",
+            choices=["public_id", "external_id"],
+            default="public_id",
+            help="Contributor field that contributor_id values refer to.",
+        )
+        parser.add_argument(
+            "--create-contributors",
+            action="store_true",
+            help="Create unknown contributors (requires --contributor-field external_id).",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="Checkpoint file (default: <path>.checkpoint).",
+        )
+        parser.add_argument(
+            "--restart",
+            action="store_true",
+            help="Ignore an existing checkpoint and import from the first record.",
+        )
+
+    def handle(self, *args, **options):
+        path: Path = options["path"]
+        if not path.exists():
+            raise CommandError(f"{path} does not exist")
+        fmt = options["format"] or ("csv" if path.suffix.lower() == ".csv" else "ndjson")
+        batch_size: int = options["batch_size"]
+        if batch_size < 1:
+            raise CommandError("--batch-size must be positive")
+        self.contributor_field: str = options["contributor_field"]
+        self.create_contributors: bool = options["create_contributors"]
+        if self.create_contributors and self.contributor_field != "external_id":
+            raise CommandError("--create-contributors requires --contributor-field external_id")
+
+        checkpoint: Path = options["checkpoint"] or path.with_name(path.name + ".checkpoint")
+        done = 0 if options["restart"] else load_checkpoint(checkpoint, path)
+        if done:
+            self.stdout.write(f"Resuming after {done} record(s) from {checkpoint}")
+
+        records = read_records(path, fmt)
+        for _ in islice(records, done):
+            pass
+
+        totals = {"accepted": 0, "rejected": 0, "skipped": 0}
+        started = time.monotonic()
+        processed = 0
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            ids = [record_public_id(path, done + i) for i in range(len(batch))]
+            for outcome, n in self._import_batch(batch, ids).items():
+                totals[outcome] += n
+            processed += len(batch)
+            done += len(batch)
+            save_checkpoint(checkpoint, path, done)
+
+            rate = processed / max(time.monotonic() - started, 1e-9)
+            self.stdout.write(
+                f"{done} records ({totals['accepted']} accepted, {totals['rejected']} "
+                f"rejected, {totals['skipped']} skipped) {rate:,.0f} rows/s"
+            )
+
+        checkpoint.unlink(missing_ok=True)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {processed} record(s): {totals['accepted']} accepted, "
+                f"{totals['rejected']} rejected, {totals['skipped']} skipped."
+            )
+        )
+
+    def _resolve_contributors(self, keys: set) -> Dict[str, Contributor]:
+        """Map contributor keys to Contributors with one query (plus one insert)."""
+        field = self.contributor_field
+        found = {
+            getattr(c, field): c
+            for c in Contributor.objects.filter(**{f"{field}__in": keys})
+        }
+        missing = keys - found.keys()
+        if missing and self.create_contributors:
+            Contributor.objects.bulk_create(
+                Contributor(external_id=key, display_name=key) for key in missing
+            )
+            found.update(
+                (c.external_id, c)
+                for c in Contributor.objects.filter(external_id__in=missing)
+            )
+        return found
+
+    def _import_batch(self, batch: List[Any], ids: List[str]) -> Dict[str, int]:
+        """Import ``batch``, whose records get the submission ids ``ids``.
+
+        The checkpoint is written after the batch commits, so a crash in
+        between re-reads a committed batch on the next run; records whose
+        submission already exists are skipped, which makes that rerun a
+        no-op instead of a second round of duplicate submissions.
+        """
+        valid = [
+            (r, public_id)
+            for r, public_id in zip(batch, ids)
+            if isinstance(r, dict) and all(r.get(f) for f in REQUIRED_FIELDS)
+        ]
+        imported = set(
+            Submission.objects.filter(public_id__in=[p for _, p in valid]).values_list(
+                "public_id", flat=True
+            )
+        )
+        valid = [(r, p) for r, p in valid if p not in imported]
+        contributors = self._resolve_contributors({str(r["contributor_id"]) for r, _ in valid})
+        items: List[SubmissionInput] = []
+        for r, public_id in valid:
+            contributor: Optional[Contributor] = contributors.get(str(r["contributor_id"]))
+            if contributor is None:
+                continue
+            items.append(
+                SubmissionInput(
+                    contributor=contributor,
+                    raw_youtube_input=str(r["raw_youtube_input"]),
+                    raw_date_input=str(r["raw_date_input"]),
+                    title=r.get("title"),
+                    notes=r.get("notes"),
+                    public_id=public_id,
+                )
+            )
+
+        submissions = ingest_batch(items) if items else []
+        accepted = sum(1 for s in submissions if s.status == Submission.Status.ACCEPTED)
+        return {
+            "accepted": accepted,
+            "rejected": len(submissions) - accepted,
+            "skipped": len(batch) - len(submissions),
+        }
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.shards import publish_all
+
+
+class Command(BaseCommand):
+    help = "Rebuild every static JSON month shard and the index of months."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="Directory to publish to (default: ARCHIVE_STATIC_DIR).",
+        )
+
+    def handle(self, *args, **options):
+        root = options["output"] or settings.ARCHIVE_STATIC_DIR
+        if not root:
+            raise CommandError("Set TIME_WARP_STATIC_DIR or pass --output.")
+        months, clips = publish_all(Path(root))
+        self.stdout.write(
+            self.style.SUCCESS(f"Published {clips} clip(s) in {months} month shard(s) to {root}.")
+        )
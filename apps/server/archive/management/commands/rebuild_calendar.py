@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.calendar import diff_counts, rebuild_calendar
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-day calendar counts from the Clip table and verify them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify the stored counts; exit non-zero if they have drifted.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            days = rebuild_calendar()
+            self.stdout.write(f"Rebuilt calendar counts for {days} day(s).")
+
+        drift = diff_counts()
+        if drift:
+            for day, (stored, actual) in sorted(drift.items())[:20]:
+                self.stderr.write(f"{day.isoformat()}: stored={stored} actual={actual}")
+            raise CommandError(f"Calendar counts differ from clips on {len(drift)} day(s).")
+        self.stdout.write(self.style.SUCCESS("Calendar counts match clips."))
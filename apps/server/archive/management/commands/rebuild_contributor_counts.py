@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from archive.contributors import diff_counts, rebuild_contributor_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the per-contributor submission and clip counters and verify them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only verify the stored counters; exit non-zero if they have drifted.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Contributors recomputed per transaction (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            contributors = rebuild_contributor_counts(chunk_size=options["chunk_size"])
+            self.stdout.write(f"Rebuilt counters for {contributors} contributor(s).")
+
+        drift = diff_counts()
+        if drift:
+            for public_id, (stored, actual) in sorted(drift.items())[:20]:
+                self.stderr.write(f"{public_id}: stored={stored} actual={actual}")
+            raise CommandError(f"Counters differ from the archive for {len(drift)} contributor(s).")
+        self.stdout.write(self.style.SUCCESS("Contributor counters match the archive."))
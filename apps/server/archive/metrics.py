@@ -0,0 +1,327 @@
+"""Per-request performance metrics: Server-Timing headers and Prometheus histograms.
+
+``RequestMetricsMiddleware`` measures, for every request, the total latency,
+the number and duration of database queries and the time spent rendering the
+response body. Views can time their own phases with ``timed("name")``; the
+phases show up in the ``Server-Timing`` header next to ``db`` and ``render``
+so a slow request can be attributed to validation, the transaction or
+serialization.
+
+Per-endpoint histograms are aggregated in process and, when
+``ARCHIVE_METRICS_DIR`` is set, flushed at most every
+``ARCHIVE_METRICS_FLUSH_SECONDS`` to one JSON file per process in that
+directory. ``GET /metrics`` merges every file, so all worker processes of a
+deployment are reported without an external service. Without a directory
+only the serving process's own requests are reported.
+
+Queries are counted by a wrapper installed on every database connection,
+which looks up the current request through a context variable. Context
+variables follow the ORM into ``sync_to_async`` threads, so queries issued
+from async views are attributed too.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+# Upper bounds of the histogram buckets (``+Inf`` is implicit).
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+# name -> (help text, buckets)
+HISTOGRAMS: Dict[str, Tuple[str, Sequence[float]]] = {
+    "archive_request_duration_seconds": ("Time to produce the response.", DURATION_BUCKETS),
+    "archive_db_queries": ("Database queries per request.", QUERY_COUNT_BUCKETS),
+    "archive_db_duration_seconds": ("Time spent in database queries per request.", DURATION_BUCKETS),
+    "archive_render_duration_seconds": (
+        "Time spent serializing the response body per request.",
+        DURATION_BUCKETS,
+    ),
+}
+
+Labels = Tuple[str, str, str]  # (endpoint, method, status)
+LABEL_NAMES = ("endpoint", "method", "status")
+
+
+class RequestMetrics:
+    """Measurements of the request being served."""
+
+    __slots__ = ("started", "queries", "db_seconds", "phases")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.phases: Dict[str, float] = {}
+
+    def add_phase(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("archive_request_metrics", default=None)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the time spent in the block to ``phase`` of the current request."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.add_phase(phase, time.perf_counter() - started)
+
+
+def record_query(execute, sql, params, many, context):
+    """Database execute wrapper: counts and times queries of the current request."""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.queries += 1
+        metrics.db_seconds += time.perf_counter() - started
+
+
+def install_query_wrapper(sender, connection, **kwargs) -> None:
+    """``connection_created`` receiver adding ``record_query`` to new connections."""
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+class Registry:
+    """Histograms of this process, keyed by metric name and labels.
+
+    Each series is ``[count per bucket..., count above last bucket, sum]``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._series: Dict[str, Dict[Labels, List[float]]] = {name: {} for name in HISTOGRAMS}
+        self._pid = os.getpid()
+        self._file_name = f"{self._pid}-{uuid4().hex[:8]}.json"
+        self._last_flush = 0.0
+
+    def _check_fork(self) -> None:
+        # A forked worker must not report (or overwrite) its parent's series.
+        if os.getpid() != self._pid:
+            self.__init__()
+
+    def observe(self, labels: Labels, values: Dict[str, float]) -> None:
+        self._check_fork()
+        with self._lock:
+            for name, value in values.items():
+                buckets = HISTOGRAMS[name][1]
+                series = self._series[name].get(labels)
+                if series is None:
+                    series = self._series[name][labels] = [0.0] * (len(buckets) + 2)
+                series[bisect_left(buckets, value)] += 1
+                series[-1] += value
+
+    def snapshot(self) -> Dict[str, Dict[Labels, List[float]]]:
+        self._check_fork()
+        with self._lock:
+            return {name: {k: list(v) for k, v in s.items()} for name, s in self._series.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            for series in self._series.values():
+                series.clear()
+
+    def flush(self, directory: Path, force: bool = False) -> None:
+        """Write this process's series to ``directory`` (atomically)."""
+        now = time.monotonic()
+        if not force and now - self._last_flush < settings.ARCHIVE_METRICS_FLUSH_SECONDS:
+            return
+        # Another thread flushing right now writes the same data; don't wait for it.
+        if not self._flush_lock.acquire(blocking=force):
+            return
+        try:
+            self._last_flush = now
+            document = {
+                name: [[list(labels), values] for labels, values in series.items()]
+                for name, series in self.snapshot().items()
+            }
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / self._file_name
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(document))
+            os.replace(tmp, path)
+        finally:
+            self._flush_lock.release()
+
+    @property
+    def file_name(self) -> str:
+        return self._file_name
+
+
+registry = Registry()
+
+
+def metrics_dir() -> Optional[Path]:
+    directory = settings.ARCHIVE_METRICS_DIR
+    return Path(directory) if directory else None
+
+
+def _flush_at_exit() -> None:
+    directory = metrics_dir()
+    if directory is not None:
+        registry.flush(directory, force=True)
+
+
+atexit.register(_flush_at_exit)
+
+
+def collect() -> Dict[str, Dict[Labels, List[float]]]:
+    """Series of every process: this one plus the files of the others."""
+    merged = registry.snapshot()
+    directory = metrics_dir()
+    if directory is None or not directory.is_dir():
+        return merged
+    for path in directory.glob("*.json"):
+        if path.name == registry.file_name:
+            continue
+        try:
+            document = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue  # being replaced or truncated; picked up next scrape
+        for name, rows in document.items():
+            if name not in merged:
+                continue
+            for labels, values in rows:
+                key = tuple(labels)
+                current = merged[name].get(key)
+                if current is None:
+                    merged[name][key] = values
+                else:
+                    merged[name][key] = [a + b for a, b in zip(current, values)]
+    return merged
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    pairs = [f'{k}="{v}"' for k, v in zip(LABEL_NAMES, labels)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_number(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus(series_by_name: Dict[str, Dict[Labels, List[float]]]) -> str:
+    """Prometheus text exposition format (version 0.0.4) of the histograms."""
+    lines: List[str] = []
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for labels, values in sorted(series_by_name.get(name, {}).items()):
+            cumulative = 0.0
+            for bound, count in zip(list(buckets) + ["+Inf"], values[:-1]):
+                cumulative += count
+                le = bound if isinstance(bound, str) else _format_number(bound)
+                bucket_labels = _format_labels(labels, f'le="{le}"')
+                lines.append(f"{name}_bucket{bucket_labels} {_format_number(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_number(values[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_number(cumulative)}")
+    return "\n".join(lines) + "\n"
+
+
+def server_timing(metrics: RequestMetrics, total: float) -> str:
+    """``Server-Timing`` header value; durations in milliseconds."""
+    entries = [f"total;dur={total * 1000:.2f}"]
+    entries.append(f'db;dur={metrics.db_seconds * 1000:.2f};desc="{metrics.queries} queries"')
+    for name, seconds in metrics.phases.items():
+        entries.append(f"{name};dur={seconds * 1000:.2f}")
+    return ", ".join(entries)
+
+
+class RequestMetricsMiddleware:
+    """Measure every request; add ``Server-Timing`` and feed the histograms.
+
+    Supports both WSGI and ASGI without adapting the async views. DRF
+    responses are rendered after the view returns; that time is captured by a
+    post-render callback and reported as the ``render`` phase.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, metrics)
+
+    def process_template_response(self, request, response):
+        metrics = _current.get()
+        if metrics is not None:
+            started = time.perf_counter()
+
+            def rendered(response) -> None:
+                metrics.add_phase("render", time.perf_counter() - started)
+
+            response.add_post_render_callback(rendered)
+        return response
+
+    def _finish(self, request, response, metrics: RequestMetrics):
+        total = time.perf_counter() - metrics.started
+        if settings.ARCHIVE_SERVER_TIMING:
+            response["Server-Timing"] = server_timing(metrics, total)
+
+        match = request.resolver_match
+        if match is None or match.url_name == "metrics":
+            return response
+        labels = (f"/{match.route}", request.method, str(response.status_code))
+        registry.observe(
+            labels,
+            {
+                "archive_request_duration_seconds": total,
+                "archive_db_queries": metrics.queries,
+                "archive_db_duration_seconds": metrics.db_seconds,
+                "archive_render_duration_seconds": metrics.phases.get("render", 0.0),
+            },
+        )
+        directory = metrics_dir()
+        if directory is not None:
+            registry.flush(directory)
+        return response
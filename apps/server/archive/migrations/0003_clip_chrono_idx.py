@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-17 01:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0002_clip_public_id_submission_public_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='clip',
+            index=models.Index(fields=['performance_date', 'created_at', 'id'], name='clip_chrono_idx'),
+        ),
+    ]
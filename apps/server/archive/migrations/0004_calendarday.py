@@ -0,0 +1,32 @@
+# Generated by Django 6.0 on 2026-10-17 01:40
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_calendar(apps, schema_editor):
+    Clip = apps.get_model("archive", "Clip")
+    CalendarDay = apps.get_model("archive", "CalendarDay")
+    rows = Clip.objects.values("performance_date").annotate(n=Count("id"))
+    CalendarDay.objects.bulk_create(
+        CalendarDay(performance_date=r["performance_date"], clip_count=r["n"])
+        for r in rows.iterator()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0003_clip_chrono_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CalendarDay',
+            fields=[
+                ('performance_date', models.DateField(primary_key=True, serialize=False)),
+                ('clip_count', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_calendar, migrations.RunPython.noop),
+    ]
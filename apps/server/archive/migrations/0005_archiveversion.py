@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-17 02:10
+
+from django.db import migrations, models
+
+
+def create_singleton(apps, schema_editor):
+    ArchiveVersion = apps.get_model("archive", "ArchiveVersion")
+    ArchiveVersion.objects.get_or_create(pk=1, defaults={"version": 0})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0004_calendarday'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchiveVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(create_singleton, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0 on 2026-10-17 03:12
+
+import archive.models
+from django.db import migrations, models
+from django.db.models.functions import ExtractDay, ExtractMonth
+
+
+def backfill_month_day(apps, schema_editor):
+    Clip = apps.get_model("archive", "Clip")
+    Clip.objects.update(
+        performance_month=ExtractMonth("performance_date"),
+        performance_day=ExtractDay("performance_date"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0005_archiveversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='clip',
+            name='performance_month',
+            field=archive.models.DatePartField(default=0, part='month', source='performance_date'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='clip',
+            name='performance_day',
+            field=archive.models.DatePartField(default=0, part='day', source='performance_date'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_month_day, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='clip',
+            index=models.Index(fields=['performance_month', 'performance_day', 'performance_date', 'created_at', 'id'], name='clip_month_day_idx'),
+        ),
+    ]
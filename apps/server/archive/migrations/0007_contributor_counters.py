@@ -0,0 +1,57 @@
+# Generated by Django 6.0 on 2026-10-17 04:05
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    Contributor = apps.get_model("archive", "Contributor")
+    Submission = apps.get_model("archive", "Submission")
+    Clip = apps.get_model("archive", "Clip")
+
+    def count(qs):
+        counted = (
+            qs.filter(contributor=OuterRef("pk"))
+            .order_by()
+            .values("contributor")
+            .annotate(n=Count("pk"))
+            .values("n")
+        )
+        return Coalesce(Subquery(counted, output_field=IntegerField()), Value(0))
+
+    Contributor.objects.update(
+        accepted_submission_count=count(Submission.objects.filter(status="accepted")),
+        rejected_submission_count=count(Submission.objects.filter(status="rejected")),
+        clip_count=count(Clip.objects.all()),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0006_clip_month_day'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contributor',
+            name='accepted_submission_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='contributor',
+            name='clip_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='contributor',
+            name='rejected_submission_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='clip',
+            index=models.Index(fields=['contributor', 'performance_date', 'created_at', 'id'], name='clip_contributor_chrono_idx'),
+        ),
+    ]
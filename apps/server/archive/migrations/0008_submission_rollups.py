@@ -0,0 +1,49 @@
+# Generated by Django 6.0 on 2026-10-17 05:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_watermark(apps, schema_editor):
+    SubmissionRollupWatermark = apps.get_model("archive", "SubmissionRollupWatermark")
+    SubmissionRollupWatermark.objects.get_or_create(pk=1, defaults={"folded_through": None})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0007_contributor_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('outcome', models.CharField(choices=[('accepted', 'Accepted'), ('invalid_date', 'Invalid Date'), ('invalid_youtube', 'Invalid Youtube'), ('duplicate_clip', 'Duplicate Clip')], max_length=20)),
+                ('submission_count', models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SubmissionRollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('folded_through', models.DateField(null=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='submission',
+            index=models.Index(fields=['submitted_at'], name='submission_submitted_idx'),
+        ),
+        migrations.AddField(
+            model_name='submissionrollup',
+            name='contributor',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='submission_rollups', to='archive.contributor'),
+        ),
+        migrations.AddConstraint(
+            model_name='submissionrollup',
+            constraint=models.UniqueConstraint(fields=('day', 'contributor', 'outcome'), name='submission_rollup_key'),
+        ),
+        migrations.RunPython(create_watermark, migrations.RunPython.noop),
+    ]
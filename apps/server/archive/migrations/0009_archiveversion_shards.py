@@ -0,0 +1,21 @@
+from django.db import migrations
+
+# ArchiveVersion.SHARDS when this migration was written.
+SHARDS = 16
+
+
+def create_shards(apps, schema_editor):
+    ArchiveVersion = apps.get_model("archive", "ArchiveVersion")
+    for pk in range(1, SHARDS + 1):
+        ArchiveVersion.objects.get_or_create(pk=pk, defaults={"version": 0})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('archive', '0008_submission_rollups'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_shards, migrations.RunPython.noop),
+    ]
@@ -16,6 +16,35 @@ def new_submission_public_id() -> str:
     return f"sub_{uuid4().hex}"
 
 
+class DatePartField(models.PositiveSmallIntegerField):
+    """Month or day of another DateField of the same model, stored for indexing.
+
+    The value is derived in ``pre_save``, which ``save()``, ``bulk_create()``
+    and ``insert_clip_if_absent`` all go through, so it cannot drift from its
+    source. (A GeneratedField would need Django's SQLite date functions inside
+    the schema itself.)
+    """
+
+    def __init__(self, *args, source: str = "", part: str = "", **kwargs) -> None:
+        self.source = source
+        self.part = part
+        kwargs.setdefault("editable", False)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs["source"] = self.source
+        kwargs["part"] = self.part
+        kwargs.pop("editable", None)
+        return name, path, args, kwargs
+
+    def pre_save(self, model_instance, add):
+        source = getattr(model_instance, self.source)
+        value = getattr(source, self.part) if source is not None else None
+        setattr(model_instance, self.attname, value)
+        return value
+
+
 class Contributor(models.Model):
     # Public contract id (what your API returns)
     public_id = models.CharField(
@@ -27,6 +56,13 @@ class Contributor(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Denormalized counters, updated in the transaction that writes each
+    # submission (see archive.contributors); ``manage.py
+    # rebuild_contributor_counts`` recomputes them.
+    accepted_submission_count = models.PositiveIntegerField(default=0)
+    rejected_submission_count = models.PositiveIntegerField(default=0)
+    clip_count = models.PositiveIntegerField(default=0)
+
     def __str__(self) -> str:
         return self.display_name or self.public_id
 
@@ -46,6 +82,9 @@ class Clip(models.Model):
     raw_youtube_input = models.TextField()
 
     performance_date = models.DateField()
+    # performance_date's month and day, so "this day in every year" is an index range.
+    performance_month = DatePartField(source="performance_date", part="month")
+    performance_day = DatePartField(source="performance_date", part="day")
     title = models.CharField(max_length=500, null=True, blank=True)
     notes = models.TextField(null=True, blank=True)
 
@@ -53,6 +92,30 @@ class Clip(models.Model):
 
     class Meta:
         unique_together = [["youtube_video_id", "performance_date"]]
+        indexes = [
+            # Covers the chronological ordering and keyset seeks used by GET /clips.
+            models.Index(
+                fields=["performance_date", "created_at", "id"],
+                name="clip_chrono_idx",
+            ),
+            # GET /contributors/{id}/clips: one contributor's clips in listing order.
+            models.Index(
+                fields=["contributor", "performance_date", "created_at", "id"],
+                name="clip_contributor_chrono_idx",
+            ),
+            # GET /clips/on-this-day: equality on month and day, then the same
+            # chronological keyset as clip_chrono_idx (i.e. year by year).
+            models.Index(
+                fields=[
+                    "performance_month",
+                    "performance_day",
+                    "performance_date",
+                    "created_at",
+                    "id",
+                ],
+                name="clip_month_day_idx",
+            ),
+        ]
 
 
 class Submission(models.Model):
@@ -94,3 +157,72 @@ class Submission(models.Model):
     notes = models.TextField(null=True, blank=True)
 
     submitted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # Rollup folding and retention both walk submissions by time.
+            models.Index(fields=["submitted_at"], name="submission_submitted_idx"),
+        ]
+
+
+class CalendarDay(models.Model):
+    """Denormalized number of clips per performance_date.
+
+    Maintained incrementally in the same transaction that creates each Clip so
+    calendar reads never aggregate over the Clip table. ``manage.py
+    rebuild_calendar`` recomputes it from scratch.
+    """
+
+    performance_date = models.DateField(primary_key=True)
+    clip_count = models.PositiveIntegerField(default=0)
+
+
+class SubmissionRollup(models.Model):
+    """Number of submissions per UTC day, contributor and outcome.
+
+    Folded from the Submission table by ``manage.py compact_submissions`` so
+    friction reporting (GET /stats/submissions) never scans raw submissions,
+    which lets old rejected ones be deleted. See ``archive.rollups``.
+    """
+
+    class Outcome(models.TextChoices):
+        ACCEPTED = "accepted"
+        INVALID_DATE = "invalid_date"
+        INVALID_YOUTUBE = "invalid_youtube"
+        DUPLICATE_CLIP = "duplicate_clip"
+
+    day = models.DateField()
+    contributor = models.ForeignKey(
+        Contributor, on_delete=models.PROTECT, related_name="submission_rollups"
+    )
+    outcome = models.CharField(max_length=20, choices=Outcome.choices)
+    submission_count = models.PositiveIntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["day", "contributor", "outcome"], name="submission_rollup_key"
+            )
+        ]
+
+
+class SubmissionRollupWatermark(models.Model):
+    """Single-row marker: the rollups cover every submission up to ``folded_through``."""
+
+    SINGLETON_PK = 1
+
+    folded_through = models.DateField(null=True)
+
+
+class ArchiveVersion(models.Model):
+    """Sharded counter bumped whenever a Clip is created.
+
+    The archive version is the sum of ``SHARDS`` rows (pk 1..SHARDS); each
+    Clip-creating transaction bumps one picked at random, so concurrent
+    writers rarely wait on the same row lock. Used as the namespace of cached
+    archive reads (see ``archive.cache``).
+    """
+
+    SHARDS = 16
+
+    version = models.PositiveBigIntegerField(default=0)
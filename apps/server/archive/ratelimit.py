@@ -0,0 +1,177 @@
+"""Token-bucket admission control for submission writes.
+
+Each bucket is kept as a single float, its *theoretical arrival time* (TAT;
+the GCRA formulation of a token bucket). A bucket refilling ``rate`` tokens
+per second with capacity ``burst`` admits a request at ``now`` iff
+``max(tat, now) + 1 / rate <= now + burst / rate``, and admitting it moves
+the TAT there. A request costing ``cost`` tokens moves it ``cost / rate``
+ahead; one costing more than ``burst`` (a large batch) is admitted from a
+full bucket and leaves the TAT in the future, a debt that later requests
+wait out, so batching never raises the sustained rate. An update is
+therefore one read and one write of a float,
+with no lock: two workers racing on the same key can both be admitted, so
+the limit may be exceeded by at most the number of concurrent workers,
+which is fine for shedding a runaway client.
+
+Buckets live in a dict in process memory (``MemoryStore``), or, when
+``ARCHIVE_RATE_LIMIT_FILE`` is set, in a fixed-size table in a memory-mapped
+file shared by every worker process on the host (``SharedMemoryStore``), so
+the limits hold deployment-wide without an external service.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+
+# (key, rate per second, burst)
+Limit = Tuple[str, float, int]
+
+MEMORY_MAX_KEYS = 100_000
+SHARED_SLOTS = 65_536
+# Slots examined for a key before the least recently admitted one is evicted.
+SHARED_PROBES = 4
+# Longest debt a bucket can run up; a TAT further ahead than this (plus the
+# burst window) means the clock went backwards.
+MAX_DEBT_SECONDS = 3600.0
+
+_SLOT = struct.Struct("<Qd")  # key fingerprint (0 = empty), TAT
+
+
+class MemoryStore:
+    """TATs in a dict; expired entries are dropped once ``max_keys`` is reached."""
+
+    def __init__(self, max_keys: int = MEMORY_MAX_KEYS) -> None:
+        self._tats: Dict[str, float] = {}
+        self._max_keys = max_keys
+
+    def load(self, key: str, now: float) -> Tuple[str, float]:
+        return key, self._tats.get(key, 0.0)
+
+    def save(self, ref: str, tat: float, now: float) -> None:
+        tats = self._tats
+        if ref not in tats and len(tats) >= self._max_keys:
+            # A bucket whose TAT has passed is full again: forgetting it is exact.
+            for key, old in list(tats.items()):
+                if old <= now:
+                    tats.pop(key, None)
+            if len(tats) >= self._max_keys:
+                tats.pop(next(iter(tats)), None)
+        tats[ref] = tat
+
+
+def _fingerprint(key: str) -> int:
+    # Stable across processes (unlike hash()); never 0, which marks an empty slot.
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") | 1
+
+
+class SharedMemoryStore:
+    """TATs in an open-addressed table in a memory-mapped file.
+
+    Every process mapping the same file sees the same buckets. A key probes
+    ``SHARED_PROBES`` slots; if none holds it, it takes an empty or expired
+    slot, or else evicts the slot that frees up soonest (that bucket simply
+    starts over full). Put the file on a tmpfs such as /dev/shm.
+    """
+
+    def __init__(self, path: str, slots: int = SHARED_SLOTS) -> None:
+        self._slots = slots
+        size = slots * _SLOT.size
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._map = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    def load(self, key: str, now: float) -> Tuple[Tuple[int, int], float]:
+        fingerprint = _fingerprint(key)
+        first = fingerprint % self._slots
+        victim, victim_tat = first, float("inf")
+        for probe in range(SHARED_PROBES):
+            slot = (first + probe) % self._slots
+            owner, tat = _SLOT.unpack_from(self._map, slot * _SLOT.size)
+            if owner == fingerprint:
+                return (slot, fingerprint), tat
+            # Empty slots (TAT 0.0) and expired buckets are taken first.
+            if tat < victim_tat:
+                victim, victim_tat = slot, tat
+        return (victim, fingerprint), 0.0
+
+    def save(self, ref: Tuple[int, int], tat: float, now: float) -> None:
+        slot, fingerprint = ref
+        _SLOT.pack_into(self._map, slot * _SLOT.size, fingerprint, tat)
+
+    def close(self) -> None:
+        self._map.close()
+
+
+class RateLimiter:
+    """Admission decisions over a lazily created store (see module docstring)."""
+
+    def __init__(self, store: Optional[MemoryStore | SharedMemoryStore] = None) -> None:
+        # None: chosen from ARCHIVE_RATE_LIMIT_FILE on first use.
+        self._store = store
+        self._lock = threading.Lock()
+
+    @property
+    def store(self) -> MemoryStore | SharedMemoryStore:
+        store = self._store
+        if store is None:
+            with self._lock:
+                if self._store is None:
+                    path = settings.ARCHIVE_RATE_LIMIT_FILE
+                    self._store = SharedMemoryStore(path) if path else MemoryStore()
+                store = self._store
+        return store
+
+    def acquire(
+        self, limits: Sequence[Limit], now: float, costs: Optional[Sequence[int]] = None
+    ) -> float:
+        """Take ``costs[i]`` tokens (default one) from each bucket ``limits[i]``, or none.
+
+        A cost above a bucket's burst is admitted once the bucket is full and
+        charged in full: the bucket stays empty for the excess ``cost / rate``
+        seconds (at most ``MAX_DEBT_SECONDS``). Returns 0.0 if the request is
+        admitted, otherwise the seconds until every bucket would admit it.
+        """
+        store = self.store
+        updates: List[Tuple[object, float]] = []
+        wait = 0.0
+        for i, (key, rate, burst) in enumerate(limits):
+            ref, tat = store.load(key, now)
+            interval = 1.0 / rate
+            window = burst * interval
+            if tat > now + window + MAX_DEBT_SECONDS:
+                tat = now  # the clock went backwards: start over
+            cost = costs[i] if costs is not None else 1
+            start = max(tat, now)
+            admitted_at = start + min(cost, burst) * interval
+            if admitted_at > now + window:
+                wait = max(wait, admitted_at - now - window)
+            else:
+                new_tat = min(start + cost * interval, now + window + MAX_DEBT_SECONDS)
+                updates.append((ref, new_tat))
+        if wait:
+            return wait
+        for ref, new_tat in updates:
+            store.save(ref, new_tat, now)
+        return 0.0
+
+    def reset(self) -> None:
+        """Forget every bucket of this process (and re-read the settings)."""
+        with self._lock:
+            if isinstance(self._store, SharedMemoryStore):
+                self._store.close()
+            self._store = None
+
+
+submission_limiter = RateLimiter()
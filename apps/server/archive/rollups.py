@@ -0,0 +1,293 @@
+"""Daily submission rollups and retention of the raw submission log.
+
+Every POST /submissions writes a full Submission row, rejected or not. The
+rollups fold them into one row per (UTC day, contributor, outcome), where the
+outcome is ``accepted`` or the rejection reason, so friction reporting reads a
+table that grows with days x contributors rather than with traffic.
+
+Folding is incremental: a watermark records the last folded day and each run
+continues from there, a bounded number of days per transaction. Only days
+that have ended (plus ``FOLD_GRACE`` for in-flight writes) are folded, so a
+folded day never changes again. Once a day is folded its rejected
+submissions carry no information the rollups lack beyond their raw inputs;
+``compact_submissions`` optionally archives those to NDJSON and deletes them,
+again in bounded chunks. ``manage.py compact_submissions`` runs both.
+"""
+
+from __future__ import annotations
+
+import time as _time
+from datetime import date, datetime, time, timedelta, timezone
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Case, CharField, Count, QuerySet, Sum, Value, When
+from django.db.models.functions import TruncDate
+from django.utils import timezone as dj_timezone
+
+from archive.db import retry_on_lock
+from archive.export import ndjson_lines
+from archive.formatting import dt_to_z, format_date
+from archive.models import Submission, SubmissionRollup, SubmissionRollupWatermark
+from archive.validation import DUPLICATE_CLIP_ERROR
+from archive.youtube import INVALID_YOUTUBE_ERROR
+
+Outcome = SubmissionRollup.Outcome
+
+REJECTION_REASONS = [o.value for o in Outcome if o != Outcome.ACCEPTED]
+
+# Days folded per transaction.
+FOLD_DAYS = 7
+# A submission's timestamp is taken before its transaction commits; wait this
+# long after midnight before treating the previous day as complete.
+FOLD_GRACE = timedelta(hours=1)
+# Rejected submissions deleted per transaction.
+COMPACT_CHUNK_SIZE = 1000
+
+UTC = timezone.utc
+
+ARCHIVE_FIELDS = (
+    "public_id",
+    "contributor__public_id",
+    "status",
+    "validation_error",
+    "raw_youtube_input",
+    "raw_date_input",
+    "title",
+    "notes",
+    "submitted_at",
+)
+
+
+def outcome_expression() -> Case:
+    """SQL expression mapping a Submission to its rollup outcome.
+
+    Date parsing is the only other source of validation errors (and runs
+    first), so every remaining rejection is an invalid date.
+    """
+    return Case(
+        When(status=Submission.Status.ACCEPTED, then=Value(Outcome.ACCEPTED)),
+        When(validation_error=DUPLICATE_CLIP_ERROR, then=Value(Outcome.DUPLICATE_CLIP)),
+        When(validation_error=INVALID_YOUTUBE_ERROR, then=Value(Outcome.INVALID_YOUTUBE)),
+        default=Value(Outcome.INVALID_DATE),
+        output_field=CharField(),
+    )
+
+
+def day_start(d: date) -> datetime:
+    return datetime.combine(d, time.min, tzinfo=UTC)
+
+
+def last_complete_day(now: Optional[datetime] = None) -> date:
+    """The most recent UTC day that can no longer receive submissions."""
+    now = now or dj_timezone.now()
+    return (now - FOLD_GRACE).astimezone(UTC).date() - timedelta(days=1)
+
+
+def folded_through() -> Optional[date]:
+    """Last day covered by the rollups, or None before the first fold."""
+    return (
+        SubmissionRollupWatermark.objects.filter(pk=SubmissionRollupWatermark.SINGLETON_PK)
+        .values_list("folded_through", flat=True)
+        .first()
+    )
+
+
+def folded_before() -> Optional[datetime]:
+    """Every submission before this instant is reflected in the rollups."""
+    through = folded_through()
+    return day_start(through + timedelta(days=1)) if through else None
+
+
+def _expired(deadline: Optional[float]) -> bool:
+    return deadline is not None and _time.monotonic() >= deadline
+
+
+def _next_submission_day(since: Optional[date]) -> Optional[date]:
+    qs = Submission.objects.order_by("submitted_at")
+    if since is not None:
+        qs = qs.filter(submitted_at__gte=day_start(since))
+    first = qs.values_list("submitted_at", flat=True).first()
+    return first.astimezone(UTC).date() if first else None
+
+
+def _fold_chunk(until: date, days_per_chunk: int) -> Tuple[bool, Optional[date]]:
+    """Fold the next chunk of days in one transaction. Returns (done, watermark)."""
+    with transaction.atomic():
+        watermark, _ = SubmissionRollupWatermark.objects.select_for_update().get_or_create(
+            pk=SubmissionRollupWatermark.SINGLETON_PK
+        )
+        through = watermark.folded_through
+        # Skip empty stretches with one index seek.
+        start = _next_submission_day(through + timedelta(days=1) if through else None)
+        if start is None or start > until:
+            if through is None or through < until:
+                watermark.folded_through = until
+                watermark.save(update_fields=["folded_through"])
+            return True, watermark.folded_through
+
+        end = min(start + timedelta(days=days_per_chunk - 1), until)
+        rows = (
+            Submission.objects.filter(
+                submitted_at__gte=day_start(start),
+                submitted_at__lt=day_start(end + timedelta(days=1)),
+            )
+            .annotate(day=TruncDate("submitted_at", tzinfo=UTC), outcome=outcome_expression())
+            .values("day", "contributor_id", "outcome")
+            .annotate(n=Count("pk"))
+            .order_by()
+        )
+        SubmissionRollup.objects.bulk_create(
+            SubmissionRollup(
+                day=row["day"],
+                contributor_id=row["contributor_id"],
+                outcome=row["outcome"],
+                submission_count=row["n"],
+            )
+            for row in rows
+        )
+        watermark.folded_through = end
+        watermark.save(update_fields=["folded_through"])
+        return end >= until, end
+
+
+def fold_submissions(
+    until: Optional[date] = None,
+    days_per_chunk: int = FOLD_DAYS,
+    deadline: Optional[float] = None,
+) -> Optional[date]:
+    """Fold submissions into the rollups through ``until`` (default: the last
+    complete day). Returns the new watermark.
+
+    Each chunk of days is aggregated and the watermark advanced in one
+    transaction, so an interrupted run resumes exactly where it stopped.
+    Stops early, between chunks, once ``deadline`` (``time.monotonic()``) passes.
+    """
+    until = until or last_complete_day()
+    while True:
+        done, through = retry_on_lock(lambda: _fold_chunk(until, days_per_chunk))
+        if done or _expired(deadline):
+            return through
+
+
+def _archive_row(row: tuple) -> Dict[str, Any]:
+    public_id, contributor_id, status, error, raw_yt, raw_date, title, notes, submitted = row
+    # The Submission schema, so archived rows read like GET /submissions/{id}.
+    return {
+        "id": public_id,
+        "contributor_id": contributor_id,
+        "clip_id": None,
+        "status": status,
+        "validation_error": error,
+        "raw_youtube_input": raw_yt,
+        "raw_date_input": raw_date,
+        "title": title,
+        "notes": notes,
+        "submitted_at": dt_to_z(submitted),
+    }
+
+
+def _delete_submissions(pks: List[int]) -> None:
+    with transaction.atomic():
+        Submission.objects.filter(pk__in=pks).delete()
+
+
+def compactable_submissions(before: datetime) -> QuerySet:
+    """Rejected submissions older than ``before`` whose day has been folded."""
+    boundary = folded_before()
+    if boundary is None:
+        return Submission.objects.none()
+    return Submission.objects.filter(
+        status=Submission.Status.REJECTED, submitted_at__lt=min(before, boundary)
+    )
+
+
+def compact_submissions(
+    before: datetime,
+    archive: Optional[IO[str]] = None,
+    chunk_size: int = COMPACT_CHUNK_SIZE,
+    deadline: Optional[float] = None,
+) -> int:
+    """Delete folded rejected submissions older than ``before``. Returns the count.
+
+    With ``archive``, each chunk is written there as NDJSON and flushed before
+    its rows are deleted, so a crash can repeat rows in the archive but never
+    lose them. Accepted submissions are kept: clips link to them.
+    """
+    deleted = 0
+    qs = compactable_submissions(before).order_by("submitted_at", "pk")
+    while not _expired(deadline):
+        rows = list(qs.values_list("pk", *ARCHIVE_FIELDS)[:chunk_size])
+        if not rows:
+            break
+        if archive is not None:
+            archive.writelines(ndjson_lines(_archive_row(row[1:]) for row in rows))
+            archive.flush()
+        pks = [row[0] for row in rows]
+        retry_on_lock(lambda: _delete_submissions(pks))
+        deleted += len(rows)
+    return deleted
+
+
+def _outcome_counts() -> Dict[str, int]:
+    return {o.value: 0 for o in Outcome}
+
+
+def _stats_entry(counts: Dict[str, int]) -> Dict[str, Any]:
+    rejected = {reason: counts[reason] for reason in REJECTION_REASONS}
+    return {
+        "submission_count": sum(counts.values()),
+        "accepted_submission_count": counts[Outcome.ACCEPTED],
+        "rejected_submission_count": sum(rejected.values()),
+        "rejections": rejected,
+    }
+
+
+def _rollup_days(
+    start: Optional[date], end: Optional[date], contributor_pk: Optional[int]
+) -> Iterator[tuple]:
+    qs = SubmissionRollup.objects.all()
+    if start is not None:
+        qs = qs.filter(day__gte=start)
+    if end is not None:
+        qs = qs.filter(day__lte=end)
+    if contributor_pk is not None:
+        qs = qs.filter(contributor_id=contributor_pk)
+    return (
+        qs.values("day", "outcome")
+        .annotate(n=Sum("submission_count"))
+        .order_by("day")
+        .values_list("day", "outcome", "n")
+        .iterator()
+    )
+
+
+def submission_stats(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    contributor_pk: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Friction report for GET /stats/submissions, read from the rollups only."""
+    totals = _outcome_counts()
+    days: List[Dict[str, Any]] = []
+    current: Optional[date] = None
+    counts: Dict[str, int] = {}
+    for day, outcome, n in _rollup_days(start, end, contributor_pk):
+        if day != current:
+            if current is not None:
+                days.append({"date": format_date(current), **_stats_entry(counts)})
+            current, counts = day, _outcome_counts()
+        counts[outcome] += n
+        totals[outcome] += n
+    if current is not None:
+        days.append({"date": format_date(current), **_stats_entry(counts)})
+
+    through = folded_through()
+    return {
+        "from": format_date(start) if start else None,
+        "to": format_date(end) if end else None,
+        "folded_through": format_date(through) if through else None,
+        **_stats_entry(totals),
+        "days": days,
+    }
+
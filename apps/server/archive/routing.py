@@ -0,0 +1,157 @@
+"""Read-replica routing with read-your-writes stickiness.
+
+Views decorated with ``reads_from_replica`` run their archive queries on one
+of the ``ARCHIVE_READ_REPLICAS`` database aliases, picked at random per
+request; everything else, and every write, uses ``default`` (the primary).
+
+Replicas lag the primary, so a client that has just written must not be
+sent to one: after a successful unsafe request ``ReadYourWritesMiddleware``
+pins the client to the primary for ``ARCHIVE_READ_YOUR_WRITES_SECONDS``. The
+pin travels as a cookie for browsers and as a response header that API
+clients echo back on their next requests; both hold the Unix time the pin
+expires. A pin further in the future than one window is ignored, so a client
+cannot keep itself off the replicas.
+
+Cached reads stay consistent: the archive version that keys them is read
+from the same alias as the data (see ``archive.cache``).
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+PIN_COOKIE = "archive_primary_until"
+PIN_HEADER = "X-Primary-Until"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+# Allowance beyond one window when judging a pin: rounding of the timestamp
+# and clock skew between the servers that set and read it.
+PIN_SLACK = 1.0
+
+# Alias serving the archive reads of the current request; None: the primary.
+_read_alias: ContextVar[Optional[str]] = ContextVar("archive_read_alias", default=None)
+
+
+def _pinned_until(request) -> float:
+    raw = request.headers.get(PIN_HEADER) or request.COOKIES.get(PIN_COOKIE)
+    try:
+        return float(raw) if raw else 0.0
+    except ValueError:
+        return 0.0
+
+
+def is_pinned(request, now: Optional[float] = None) -> bool:
+    """True while ``request`` carries an unexpired, plausible primary pin."""
+    now = time.time() if now is None else now
+    until = _pinned_until(request)
+    return now < until <= now + settings.ARCHIVE_READ_YOUR_WRITES_SECONDS + PIN_SLACK
+
+
+def replica_for(request) -> Optional[str]:
+    """The replica alias to read from for ``request``, or None for the primary."""
+    replicas = settings.ARCHIVE_READ_REPLICAS
+    if not replicas or request.method not in SAFE_METHODS or is_pinned(request):
+        return None
+    return random.choice(replicas)
+
+
+def reads_from_replica(view):
+    """Serve ``view``'s archive reads from a replica unless the client is pinned.
+
+    Apply it outermost, so conditional-GET validators are read from the same
+    replica as the response. Works for sync and async views.
+    """
+    if iscoroutinefunction(view):
+
+        async def async_wrapper(request, *args, **kwargs):
+            token = _read_alias.set(replica_for(request))
+            try:
+                return await view(request, *args, **kwargs)
+            finally:
+                _read_alias.reset(token)
+
+        return wraps(view)(async_wrapper)
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        token = _read_alias.set(replica_for(request))
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """Database router for the ``archive`` app (``DATABASE_ROUTERS``)."""
+
+    app_label = "archive"
+
+    def db_for_read(self, model, **hints) -> Optional[str]:
+        if model._meta.app_label == self.app_label:
+            return _read_alias.get()
+        return None
+
+    def db_for_write(self, model, **hints) -> Optional[str]:
+        # Explicit, or instances read from a replica would be saved back to it.
+        if model._meta.app_label == self.app_label:
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints) -> Optional[bool]:
+        # Replicas hold the same rows as the primary.
+        aliases = {DEFAULT_DB_ALIAS, *settings.ARCHIVE_READ_REPLICAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> Optional[bool]:
+        # Replicas receive the schema through replication.
+        if db in settings.ARCHIVE_READ_REPLICAS:
+            return False
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """Pin a client to the primary for a while after each successful write."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        return self._finish(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self._finish(request, await self.get_response(request))
+
+    def _finish(self, request, response):
+        if (
+            settings.ARCHIVE_READ_REPLICAS
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            window = settings.ARCHIVE_READ_YOUR_WRITES_SECONDS
+            until = f"{time.time() + window:.3f}"
+            response[PIN_HEADER] = until
+            response.set_cookie(
+                PIN_COOKIE, until, max_age=int(window) + 1, httponly=True, samesite="Lax"
+            )
+        return response
@@ -0,0 +1,260 @@
+"""Pre-rendered static JSON shards of the archive, for serving from a CDN.
+
+With ``ARCHIVE_STATIC_DIR`` set, the archive is published there as one file
+per populated year-month plus an index::
+
+    clips/index.json      {"total": N, "months": [{"year", "month", "clip_count", "path"}]}
+    clips/1994/06.json    {"year": 1994, "month": 6, "clip_count": n, "items": [Clip, ...]}
+
+Items use the OpenAPI Clip schema in chronological order, rendered by the
+API's JSON renderer. After a transaction that creates clips commits, the
+affected months are marked dirty (``clips_created`` schedules it) and a
+background thread, ``shard_publisher``, rewrites only their shards and index
+entries, at most ``ARCHIVE_STATIC_PUBLISH_DELAY`` seconds later and once for
+all the months dirtied meanwhile. ``manage.py publish_shards`` rebuilds
+everything.
+
+Every file is written to a temporary file in its directory and renamed into
+place, so readers see the old or the new shard, never a partial one. Each
+rebuild reads the database and writes the files under an exclusive lock on
+``.publish.lock`` in the output directory: a rebuild that starts after
+another process's commit always sees that commit and also renames last,
+so a shard never goes back to an older state. The background thread only
+tries the lock; while another process holds it (a full rebuild takes
+seconds) its months stay dirty and are retried after the delay.
+"""
+
+from __future__ import annotations
+
+import atexit
+import fcntl
+import itertools
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import close_old_connections, connections, transaction
+
+from archive.api.renderers import FastJSONRenderer
+from archive.calendar import month_range, stored_counts
+from archive.export import iter_clip_rows
+
+logger = logging.getLogger(__name__)
+
+Month = Tuple[int, int]
+
+SHARD_DIR = "clips"
+INDEX_NAME = "index.json"
+LOCK_NAME = ".publish.lock"
+
+_render = FastJSONRenderer().render
+
+
+def shard_name(month: Month) -> str:
+    """Path of a month's shard relative to the output directory."""
+    year, m = month
+    return f"{SHARD_DIR}/{year:04d}/{m:02d}.json"
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace ``path`` with ``data`` via a temporary file and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp, 0o644)  # mkstemp creates 0600; edge servers need to read it
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+@contextmanager
+def _publish_lock(root: Path, blocking: bool = True) -> Iterator[bool]:
+    """Hold the output directory's lock; yields False if ``blocking`` is off and it is taken."""
+    root.mkdir(parents=True, exist_ok=True)
+    with open(root / LOCK_NAME, "a") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _shard(month: Month, items: List[Dict[str, Any]]) -> bytes:
+    year, m = month
+    return _render({"year": year, "month": m, "clip_count": len(items), "items": items})
+
+
+def _index(months: Dict[Month, int]) -> bytes:
+    return _render(
+        {
+            "total": sum(months.values()),
+            "months": [
+                {"year": year, "month": m, "clip_count": n, "path": shard_name((year, m))}
+                for (year, m), n in sorted(months.items())
+                if n
+            ],
+        }
+    )
+
+
+def _month_counts() -> Dict[Month, int]:
+    months: Dict[Month, int] = {}
+    for day, n in stored_counts().items():
+        months[(day.year, day.month)] = months.get((day.year, day.month), 0) + n
+    return months
+
+
+def _read_index(root: Path) -> Optional[Dict[Month, int]]:
+    try:
+        data = json.loads((root / SHARD_DIR / INDEX_NAME).read_bytes())
+    except (OSError, ValueError):
+        return None
+    return {(e["year"], e["month"]): e["clip_count"] for e in data["months"]}
+
+
+def publish_months(
+    months: Iterable[Month], root: Optional[Path] = None, blocking: bool = True
+) -> bool:
+    """Rewrite the shards of ``months`` and their entries in the index.
+
+    The rest of the index is kept as it is; if it is missing or unreadable it
+    is rebuilt from the per-day calendar counts. Without ``blocking``, returns
+    False and writes nothing if another publish holds the lock.
+    """
+    root = Path(root or settings.ARCHIVE_STATIC_DIR)
+    months = sorted(set(months))
+    with _publish_lock(root, blocking) as locked:
+        if not locked:
+            return False
+        index = _read_index(root)
+        for month in months:
+            start, end = month_range(*month)
+            items = list(iter_clip_rows(start, end))
+            write_atomic(root / shard_name(month), _shard(month, items))
+            if index is not None:
+                index[month] = len(items)
+        if index is None:
+            index = _month_counts()
+        write_atomic(root / SHARD_DIR / INDEX_NAME, _index(index))
+    return True
+
+
+def publish_all(root: Optional[Path] = None) -> Tuple[int, int]:
+    """Rebuild every shard and the index. Returns (months, clips) published.
+
+    One chronological pass over the Clip table, holding one month in memory at
+    a time. Shards of months that no longer have clips are removed.
+    """
+    root = Path(root or settings.ARCHIVE_STATIC_DIR)
+    published: Dict[Month, int] = {}
+    with _publish_lock(root):
+        rows = iter_clip_rows()
+        for key, group in itertools.groupby(rows, key=lambda r: r["performance_date"][:7]):
+            month = (int(key[:4]), int(key[5:7]))
+            items = list(group)
+            write_atomic(root / shard_name(month), _shard(month, items))
+            published[month] = len(items)
+        for path in (root / SHARD_DIR).glob("[0-9]*/[0-9]*.json"):
+            if (int(path.parent.name), int(path.stem)) not in published:
+                path.unlink()
+        write_atomic(root / SHARD_DIR / INDEX_NAME, _index(published))
+    return len(published), sum(published.values())
+
+
+class ShardPublisher:
+    """Background thread republishing the months marked dirty (see module docstring)."""
+
+    def __init__(self) -> None:
+        self._dirty: Set[Month] = set()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+
+    def _check_fork(self) -> None:
+        # A forked worker process has the dirty set but not the thread.
+        if os.getpid() != self._pid:
+            self.__init__()
+
+    def mark(self, months: Iterable[Month]) -> None:
+        """Have ``months`` republished within ``ARCHIVE_STATIC_PUBLISH_DELAY`` seconds."""
+        self._check_fork()
+        with self._cond:
+            self._dirty.update(months)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="shard-publisher", daemon=True
+                )
+                self._thread.start()
+
+    def flush(self) -> None:
+        """Publish the dirty months now, in the calling thread, waiting for the lock."""
+        self._check_fork()
+        with self._cond:
+            months, self._dirty = self._dirty, set()
+        if months and settings.ARCHIVE_STATIC_DIR:
+            publish_months(months)
+
+    def _take(self) -> Set[Month]:
+        # Wait for a dirty month, then let more arrive for the publish delay.
+        with self._cond:
+            self._cond.wait_for(lambda: self._dirty)
+        time.sleep(settings.ARCHIVE_STATIC_PUBLISH_DELAY)
+        with self._cond:
+            months, self._dirty = self._dirty, set()
+        return months
+
+    def _publish(self, months: Set[Month]) -> bool:
+        if not settings.ARCHIVE_STATIC_DIR:
+            return True
+        close_old_connections()
+        try:
+            return publish_months(months, blocking=False)
+        except Exception:
+            logger.exception("Publishing %d month shard(s) failed", len(months))
+            return False
+        finally:
+            connections.close_all()
+
+    def _run(self) -> None:
+        while True:
+            months = self._take()
+            if months and not self._publish(months):
+                # The lock is taken (or the publish failed): try again later.
+                with self._cond:
+                    self._dirty.update(months)
+
+
+shard_publisher = ShardPublisher()
+
+atexit.register(shard_publisher.flush)
+
+
+def schedule_publish(performance_dates: Iterable[date]) -> None:
+    """Mark the months of ``performance_dates`` dirty once the current transaction commits.
+
+    The write never waits for the publish, and a failed publish does not
+    affect it: the months are retried, and ``publish_shards`` repairs
+    anything else.
+    """
+    if not settings.ARCHIVE_STATIC_DIR:
+        return
+    months: Set[Month] = {(d.year, d.month) for d in performance_dates}
+    if months:
+        transaction.on_commit(lambda: shard_publisher.mark(months), robust=True)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Sequence, Tuple, Union
+
+from archive.youtube import (
+    INVALID_YOUTUBE_ERROR,
+    normalize_youtube_input,
+    normalize_youtube_inputs,
+)
+
+DUPLICATE_CLIP_ERROR = "Duplicate clip: clip with this YouTube video ID and performance date already exists"
+
+# Kept under its original name for callers of this module.
+extract_youtube_video_id = normalize_youtube_input
+
+
+def parse_performance_date(raw: str) -> date:
+    """Parse a YYYY-MM-DD performance date.
+
+    Raises ValueError if the input is not a valid ISO date.
+    """
+    return date.fromisoformat(raw)
+
+
+def validate_submission_inputs(raw_youtube_input: str, raw_date_input: str) -> tuple[str, date]:
+    """Return (youtube_video_id, performance_date) for a submission.
+
+    Raises ValueError with a user-facing message if either input is invalid.
+    """
+    performance_date = parse_performance_date(raw_date_input)
+    youtube_video_id = extract_youtube_video_id(raw_youtube_input)
+    return youtube_video_id, performance_date
+
+
+def validate_submission_batch(
+    inputs: Sequence[Tuple[str, str]],
+) -> List[Union[Tuple[str, date], ValueError]]:
+    """Batch ``validate_submission_inputs`` for (raw_youtube_input, raw_date_input) pairs.
+
+    Returns, in input order, either (youtube_video_id, performance_date) or
+    the ValueError ``validate_submission_inputs`` would have raised.
+    """
+    video_ids = normalize_youtube_inputs(raw_youtube for raw_youtube, _ in inputs)
+    out: List[Union[Tuple[str, date], ValueError]] = []
+    for (_, raw_date), video_id in zip(inputs, video_ids):
+        try:
+            performance_date = parse_performance_date(raw_date)
+        except ValueError as e:
+            out.append(e)
+            continue
+        out.append((video_id, performance_date) if video_id else ValueError(INVALID_YOUTUBE_ERROR))
+    return out
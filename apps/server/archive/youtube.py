@@ -0,0 +1,114 @@
+"""Normalize raw YouTube input (a URL or a bare id) to an 11-character video id.
+
+Accepted shapes:
+
+- bare ids: ``dQw4w9WgXcQ``
+- ``youtu.be/<id>``
+- ``youtube.com/watch?v=<id>`` (the ``v`` parameter may appear anywhere in
+  the query string, next to any tracking parameters)
+- ``youtube.com/{shorts,embed,live,v,e}/<id>``
+- ``youtube-nocookie.com/embed/<id>``
+
+on the ``www.``, ``m.`` and ``music.`` hosts, with or without an http(s)
+scheme. The input is split into host, path and query once; the candidate id
+is then checked against the id alphabet.
+
+Results are memoized per raw input in a bounded LRU cache, since bulk
+imports and retries resubmit the same strings.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+INVALID_YOUTUBE_ERROR = "Invalid YouTube URL or video id"
+
+VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+
+CACHE_SIZE = 65536
+
+_WATCH_HOSTS = frozenset(
+    {"youtube.com", "www.youtube.com", "m.youtube.com", "music.youtube.com"}
+)
+_EMBED_HOSTS = frozenset({"youtube-nocookie.com", "www.youtube-nocookie.com"})
+_SHORT_HOSTS = frozenset({"youtu.be", "www.youtu.be"})
+
+# First path segment -> the id is the second segment.
+_ID_PATH_PREFIXES = frozenset({"shorts", "embed", "live", "v", "e"})
+
+
+def _watch_param(query: str) -> Optional[str]:
+    for pair in query.split("&"):
+        if pair.startswith("v="):
+            return pair[2:]
+    return None
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _normalize(raw: str) -> Optional[str]:
+    value = raw.strip()
+    if VIDEO_ID_RE.fullmatch(value):
+        return value
+
+    # Split scheme, host, path and query by hand: urlsplit's generality
+    # (and its validation) costs more than the whole lookup below.
+    scheme, sep, rest = value.partition("://")
+    if sep:
+        if scheme.lower() not in ("http", "https"):
+            return None
+    else:
+        rest = value[2:] if value.startswith("//") else value
+    rest = rest.partition("#")[0]
+    rest, _, query = rest.partition("?")
+    host, _, path = rest.partition("/")
+    host = host.partition(":")[0].lower().rstrip(".")
+
+    segments = [s for s in path.split("/") if s]
+    candidate: Optional[str] = None
+    if host in _SHORT_HOSTS:
+        candidate = segments[0] if segments else None
+    elif host in _WATCH_HOSTS or host in _EMBED_HOSTS:
+        if segments[:1] == ["watch"] and host in _WATCH_HOSTS:
+            candidate = _watch_param(query)
+        elif len(segments) >= 2 and segments[0] in _ID_PATH_PREFIXES:
+            candidate = segments[1]
+
+    if candidate is not None and VIDEO_ID_RE.fullmatch(candidate):
+        return candidate
+    return None
+
+
+def normalize_youtube_input(raw: str) -> str:
+    """Return the video id in ``raw``.
+
+    Raises ValueError if ``raw`` is not a recognized YouTube URL or video id.
+    """
+    video_id = _normalize(raw or "")
+    if video_id is None:
+        raise ValueError(INVALID_YOUTUBE_ERROR)
+    return video_id
+
+
+def normalize_youtube_inputs(raws: Iterable[str]) -> List[Optional[str]]:
+    """Batch ``normalize_youtube_input``: one video id (or None if invalid) per input.
+
+    Each distinct input is parsed once, even when it is not yet cached.
+    """
+    seen: dict[str, Optional[str]] = {}
+    out: List[Optional[str]] = []
+    for raw in raws:
+        raw = raw or ""
+        if raw not in seen:
+            seen[raw] = _normalize(raw)
+        out.append(seen[raw])
+    return out
+
+
+def cache_info():
+    return _normalize.cache_info()
+
+
+def clear_cache() -> None:
+    _normalize.cache_clear()
@@ -1,3 +1,5 @@
+import copy
+import os
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -17,12 +19,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # Outermost, so its timings cover the rest of the stack.
+    "archive.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "archive.routing.ReadYourWritesMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -41,7 +46,174 @@ WSGI_APPLICATION = "config.wsgi.application"
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+        "NAME": os.environ.get("TIME_WARP_SQLITE_PATH", BASE_DIR / "db.sqlite3"),
+    }
+}
+
+# Opt-in SQLite profile for production (TIME_WARP_SQLITE_PROFILE=production):
+# WAL lets readers proceed while a writer holds the lock, NORMAL sync is
+# durable across application crashes in WAL mode, BEGIN IMMEDIATE takes the
+# write lock up front (no mid-transaction upgrade failures), and the busy
+# timeout makes writers queue instead of failing with "database is locked".
+SQLITE_PRODUCTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+]
+
+if os.environ.get("TIME_WARP_SQLITE_PROFILE") == "production":
+    DATABASES["default"].update(
+        {
+            "CONN_MAX_AGE": None,
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {
+                "timeout": 20,
+                "transaction_mode": "IMMEDIATE",
+                "init_command": ";".join(SQLITE_PRODUCTION_PRAGMAS),
+            },
+        }
+    )
+
+# PostgreSQL backend (TIME_WARP_DATABASE=postgres) for deployments that need
+# concurrent writers. Requires psycopg 3 with the pool extra
+# (``pip install "psycopg[binary,pool]"``); Django's built-in pool replaces
+# persistent connections, so CONN_MAX_AGE must stay 0.
+if os.environ.get("TIME_WARP_DATABASE") == "postgres":
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": os.environ.get("TIME_WARP_PG_NAME", "time_warp"),
+        "USER": os.environ.get("TIME_WARP_PG_USER", "time_warp"),
+        "PASSWORD": os.environ.get("TIME_WARP_PG_PASSWORD", ""),
+        "HOST": os.environ.get("TIME_WARP_PG_HOST", "localhost"),
+        "PORT": os.environ.get("TIME_WARP_PG_PORT", "5432"),
+        "CONN_MAX_AGE": 0,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "pool": {
+                "min_size": int(os.environ.get("TIME_WARP_PG_POOL_MIN", "2")),
+                "max_size": int(os.environ.get("TIME_WARP_PG_POOL_MAX", "20")),
+                "timeout": 10,
+            },
+        },
+    }
+
+# Read replicas (archive.routing). Each comma-separated entry of
+# TIME_WARP_SQLITE_REPLICAS (file paths) or, with PostgreSQL,
+# TIME_WARP_PG_REPLICA_HOSTS (host or host:port) becomes a database alias
+# "replica1", "replica2", ... configured like "default". The read endpoints
+# pick one at random per request; writes always go to "default". A client
+# that wrote is pinned to "default" for ARCHIVE_READ_YOUR_WRITES_SECONDS
+# (keep it above the replication lag). Under test the replicas mirror the
+# test database.
+def _replica(**overrides):
+    replica = copy.deepcopy(DATABASES["default"])
+    replica.update(overrides, TEST={"MIRROR": "default"})
+    return replica
+
+
+if os.environ.get("TIME_WARP_DATABASE") == "postgres":
+    for _n, _host in enumerate(
+        filter(None, os.environ.get("TIME_WARP_PG_REPLICA_HOSTS", "").split(",")), 1
+    ):
+        _name, _, _port = _host.strip().partition(":")
+        DATABASES[f"replica{_n}"] = _replica(
+            HOST=_name, PORT=_port or DATABASES["default"]["PORT"]
+        )
+else:
+    for _n, _path in enumerate(
+        filter(None, os.environ.get("TIME_WARP_SQLITE_REPLICAS", "").split(",")), 1
+    ):
+        DATABASES[f"replica{_n}"] = _replica(NAME=_path.strip())
+
+DATABASE_ROUTERS = ["archive.routing.ReplicaRouter"]
+ARCHIVE_READ_REPLICAS = [alias for alias in DATABASES if alias != "default"]
+ARCHIVE_READ_YOUR_WRITES_SECONDS = 5.0
+
+# Bounded retry (exponential backoff with jitter) for write transactions that
+# still hit a lock error after the busy timeout (or, on PostgreSQL, a deadlock
+# or serialization failure). See archive.db.retry_on_lock.
+ARCHIVE_WRITE_RETRY_ATTEMPTS = 5
+ARCHIVE_WRITE_RETRY_BASE_DELAY = 0.02
+ARCHIVE_WRITE_RETRY_MAX_DELAY = 0.5
+
+# Serve clip listing, clip detail and submission detail from the native async
+# views in archive.api.async_views. Enable when running under ASGI
+# (config.asgi); under WSGI each async view would need its own event loop.
+ARCHIVE_ASYNC_READS = os.environ.get("TIME_WARP_ASYNC_READS") == "1"
+
+# Process-local Bloom filter of existing (youtube_video_id, performance_date)
+# pairs (archive.duplicates) so known duplicates skip the Clip insert and new
+# pairs skip the duplicate lookup. It catches up with clips created by other
+# processes every SYNC seconds and is rebuilt from the Clip table every
+# RECONCILE seconds; None disables either step.
+ARCHIVE_DUPLICATE_FILTER = os.environ.get("TIME_WARP_DUPLICATE_FILTER", "1") == "1"
+ARCHIVE_DUPLICATE_FILTER_SYNC_SECONDS = 5.0
+ARCHIVE_DUPLICATE_FILTER_RECONCILE_SECONDS = 900.0
+
+# Per-request instrumentation (archive.metrics). Server-Timing headers can be
+# turned off with TIME_WARP_SERVER_TIMING=0. With TIME_WARP_METRICS_DIR set,
+# every worker process flushes its histograms there so GET /metrics reports
+# the whole deployment; the directory must be shared by the workers and
+# emptied when the deployment restarts.
+ARCHIVE_SERVER_TIMING = os.environ.get("TIME_WARP_SERVER_TIMING", "1") == "1"
+ARCHIVE_METRICS_DIR = os.environ.get("TIME_WARP_METRICS_DIR") or None
+ARCHIVE_METRICS_FLUSH_SECONDS = 1.0
+
+# Token-bucket admission control for POST /submissions and, one token per
+# item, POST /submissions:batch (archive.ratelimit): (sustained requests per
+# second, burst) per contributor_id and per client IP; None disables a
+# bucket. Buckets live in each process's memory unless
+# TIME_WARP_RATE_LIMIT_FILE names a file shared by the workers (put it on a
+# tmpfs such as /dev/shm), which makes the limits host-wide. Behind a reverse
+# proxy set REST_FRAMEWORK["NUM_PROXIES"] so the client IP is read from
+# X-Forwarded-For. TIME_WARP_RATE_LIMIT=0 disables the limiter.
+ARCHIVE_RATE_LIMIT = os.environ.get("TIME_WARP_RATE_LIMIT", "1") == "1"
+ARCHIVE_RATE_LIMIT_FILE = os.environ.get("TIME_WARP_RATE_LIMIT_FILE") or None
+ARCHIVE_SUBMISSION_RATE_LIMITS = {
+    "contributor": (1.0, 30),
+    "ip": (5.0, 100),
+}
+
+# Static JSON shards (archive.shards): with TIME_WARP_STATIC_DIR set, the
+# archive is published there as clips/index.json plus one pre-rendered
+# clips/YYYY/MM.json per populated month, for a CDN or edge server to serve
+# without Django. Shards of the months affected by a commit that creates
+# clips are rewritten by a background thread ARCHIVE_STATIC_PUBLISH_DELAY
+# seconds later, together with every month dirtied meanwhile (also the retry
+# delay while another process is publishing); `manage.py publish_shards`
+# rebuilds them all.
+ARCHIVE_STATIC_DIR = os.environ.get("TIME_WARP_STATIC_DIR") or None
+ARCHIVE_STATIC_PUBLISH_DELAY = 1.0
+
+# Asynchronous submissions (archive.group_commit): POST /submissions validates
+# the input, answers 202 Accepted with status "pending" and leaves the write
+# to an in-process worker that commits whatever arrived within
+# ARCHIVE_GROUP_COMMIT_WINDOW seconds (at most ARCHIVE_GROUP_COMMIT_MAX_BATCH
+# submissions) in one transaction. A crash loses the submissions still queued.
+# Enable with TIME_WARP_ASYNC_SUBMISSIONS=1.
+ARCHIVE_ASYNC_SUBMISSIONS = os.environ.get("TIME_WARP_ASYNC_SUBMISSIONS") == "1"
+ARCHIVE_GROUP_COMMIT_WINDOW = 0.005
+ARCHIVE_GROUP_COMMIT_MAX_BATCH = 500
+
+REST_FRAMEWORK = {
+    # Same bytes as DRF's JSONRenderer, encoded by orjson when it is installed.
+    "DEFAULT_RENDERER_CLASSES": [
+        "archive.api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+}
+
+CACHES = {
+    "default": {
+        # In-process LRU bounded by entry count and total bytes. Archive reads
+        # are keyed by a version bumped on every Clip insert, so entries never
+        # need a TTL to stay correct.
+        "BACKEND": "archive.cache.LRUMemoryCache",
+        "LOCATION": "time-warp",
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 10000, "MAX_BYTES": 64 * 1024 * 1024},
     }
 }
 
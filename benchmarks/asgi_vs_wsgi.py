@@ -0,0 +1,95 @@
+"""Compare the read endpoints under WSGI (sync views) and ASGI (async views).
+
+Seeds a throwaway SQLite database, then for each mode starts a server and
+drives clip listing, clip detail and submission detail at high concurrency
+with slow clients (each connection waits ``--read-delay`` before reading its
+response). Reports requests/s, latency percentiles and the server's peak RSS.
+
+The ASGI mode needs uvicorn (``pip install uvicorn``).
+
+Usage (from the repository root):
+
+    python benchmarks/asgi_vs_wsgi.py --concurrency 1000 --requests 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from http_load import Request, run_load
+from servers import django_env, free_port, manage, peak_rss_kb, start_server, stop_server
+
+SEED_SCRIPT = """
+import json
+from archive.ingest import SubmissionInput, ingest_batch
+from archive.models import Contributor
+contributor = Contributor.objects.create(display_name="bench")
+subs = ingest_batch([
+    SubmissionInput(contributor, f"https://youtu.be/b{{n:010d}}", f"{{1950 + n % 70}}-{{1 + n % 12:02d}}-{{1 + n % 28:02d}}")
+    for n in range({clips})
+])
+print(json.dumps([[s.public_id, s.clip.public_id] for s in subs[:200]]))
+"""
+
+
+def run_mode(mode: str, db_path: Path, ids: List[List[str]], args) -> Dict[str, Any]:
+    env = django_env(db_path, TIME_WARP_ASYNC_READS="1" if mode == "asgi" else "0")
+    port = free_port()
+    proc = start_server(mode, env, port)
+    rng = random.Random(0)
+
+    def next_request(n: int) -> Request:
+        submission_id, clip_id = rng.choice(ids)
+        kind = n % 3
+        if kind == 0:
+            year = rng.randint(1950, 2019)
+            return "GET /clips", "GET", f"/clips?from={year}-01-01&limit=50", None
+        if kind == 1:
+            return "GET /clips/{id}", "GET", f"/clips/{clip_id}", None
+        return "GET /submissions/{id}", "GET", f"/submissions/{submission_id}", None
+
+    try:
+        result = asyncio.run(
+            run_load(
+                "127.0.0.1",
+                port,
+                next_request,
+                total=args.requests,
+                concurrency=args.concurrency,
+                read_delay=args.read_delay,
+            )
+        )
+        result["peak_rss_kb"] = peak_rss_kb(proc.pid)
+    finally:
+        stop_server(proc)
+    result["mode"] = mode
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clips", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=1000)
+    parser.add_argument("--read-delay", type=float, default=0.05)
+    parser.add_argument("--modes", nargs="+", default=["wsgi", "asgi"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.sqlite3"
+        env = django_env(db_path)
+        manage(env, "migrate", "--verbosity", "0")
+        ids = json.loads(manage(env, "shell", "-c", SEED_SCRIPT.format(clips=args.clips)))
+        results = [run_mode(mode, db_path, ids, args) for mode in args.modes]
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""Deterministic synthetic archive for benchmarks.
+
+Generates contributors, clips (each with its accepted submission) and
+rejected submissions from a seed, so two runs with the same parameters
+produce identical rows, public ids and timestamps. The shape is meant to look
+like a real archive:
+
+- contributor activity is Zipf-like: a few contributors add most clips;
+- performance dates cluster around a peak touring era, favour Friday and
+  Saturday shows, and a small set of famous dates collects many clips;
+- rejected submissions mix invalid links, invalid dates and duplicates of
+  existing clips, with the same validation errors the API records.
+
+Rows are written with ``executemany`` in chunks, bypassing model ``save``, so
+a million clips load in minutes. The target database must be empty.
+
+Usage (from the repository root):
+
+    python benchmarks/dataset.py --db /tmp/bench.sqlite3 --clips 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import random
+import string
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+ID_ALPHABET = string.ascii_letters + string.digits + "-_"
+FIRST_YEAR, LAST_YEAR = 1960, 2025
+PEAK_YEAR, PEAK_SPREAD = 1977, 9.0
+FAMOUS_DATE_SHARE = 0.15
+CREATED_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    contributors: int = 1000
+    clips: int = 100_000
+    rejected: int = 20_000
+    seed: int = 1
+    chunk_size: int = 5000
+
+
+class Generator:
+    """Produces the rows of a ``DatasetSpec``; independent of Django."""
+
+    def __init__(self, spec: DatasetSpec) -> None:
+        self.spec = spec
+        self.rng = random.Random(spec.seed)
+        # Zipf-like contributor activity: weight of the i-th contributor ~ 1/(i+1).
+        self._contributor_weights = list(
+            itertools.accumulate(1.0 / (i + 1) for i in range(spec.contributors))
+        )
+        self._famous_dates = [self._era_date() for _ in range(50)]
+        self._now = CREATED_START
+
+    def public_id(self, prefix: str) -> str:
+        return f"{prefix}_{self.rng.getrandbits(128):032x}"
+
+    def video_id(self) -> str:
+        return "".join(self.rng.choices(ID_ALPHABET, k=11))
+
+    def contributor_pk(self) -> int:
+        return self.rng.choices(
+            range(1, self.spec.contributors + 1), cum_weights=self._contributor_weights
+        )[0]
+
+    def _era_date(self) -> date:
+        year = round(self.rng.gauss(PEAK_YEAR, PEAK_SPREAD))
+        year = min(max(year, FIRST_YEAR), LAST_YEAR)
+        d = date(year, 1, 1) + timedelta(days=self.rng.randrange(365))
+        # Most shows are on weekends: move two thirds of dates to Fri/Sat.
+        if self.rng.random() < 2 / 3:
+            d += timedelta(days=(4 + self.rng.randrange(2) - d.weekday()) % 7)
+        return d
+
+    def performance_date(self) -> date:
+        if self.rng.random() < FAMOUS_DATE_SHARE:
+            return self.rng.choice(self._famous_dates)
+        return self._era_date()
+
+    def tick(self) -> datetime:
+        """Next created/submitted timestamp: mostly seconds apart, sometimes hours."""
+        gap = self.rng.expovariate(1 / 30) if self.rng.random() < 0.95 else 3600 * 6
+        self._now += timedelta(seconds=gap, microseconds=self.rng.randrange(1_000_000))
+        return self._now
+
+    def youtube_input(self, video_id: str) -> str:
+        form = self.rng.random()
+        if form < 0.6:
+            return f"https://www.youtube.com/watch?v={video_id}"
+        if form < 0.9:
+            return f"https://youtu.be/{video_id}"
+        return f"https://www.youtube.com/watch?v={video_id}&t={self.rng.randrange(3600)}s"
+
+    def title(self, d: date) -> str | None:
+        if self.rng.random() < 0.3:
+            return None
+        return f"Live {d.isoformat()} set {self.rng.randint(1, 3)}"
+
+    def contributors(self) -> Iterator[Tuple[Any, ...]]:
+        """(pk, public_id, display_name, external_id, created_at)."""
+        for pk in range(1, self.spec.contributors + 1):
+            yield pk, self.public_id("ctr"), f"contributor {pk}", f"ext-{pk}", self.tick()
+
+    def clips_and_submissions(self) -> Iterator[Tuple[Tuple[Any, ...], Tuple[Any, ...]]]:
+        """Clip rows with their accepted submission rows, in creation order.
+
+        Clip: (pk, public_id, contributor_id, youtube_video_id, raw_youtube_input,
+        performance_date, title, notes, created_at).
+        Submission: (public_id, status, contributor_id, clip_id, validation_error,
+        raw_youtube_input, raw_date_input, title, notes, submitted_at).
+        """
+        seen = set()
+        pk = 0
+        while pk < self.spec.clips:
+            video_id, d = self.video_id(), self.performance_date()
+            if (video_id, d) in seen:
+                continue
+            seen.add((video_id, d))
+            pk += 1
+            contributor = self.contributor_pk()
+            raw = self.youtube_input(video_id)
+            title = self.title(d)
+            created = self.tick()
+            yield (
+                (pk, self.public_id("clp"), contributor, video_id, raw, d, title, None, created),
+                (self.public_id("sub"), "accepted", contributor, pk, None, raw, d.isoformat(),
+                 title, None, created),
+            )
+
+    def rejected_submissions(self, clip_keys: Sequence[Tuple[str, date]]) -> Iterator[Tuple[Any, ...]]:
+        """Rejected submission rows (same columns as accepted ones, clip_id None)."""
+        from archive.validation import DUPLICATE_CLIP_ERROR, validate_submission_inputs
+
+        for _ in range(self.spec.rejected):
+            kind = self.rng.random()
+            if kind < 0.4 and clip_keys:
+                video_id, d = self.rng.choice(clip_keys)
+                raw_youtube, raw_date = self.youtube_input(video_id), d.isoformat()
+            elif kind < 0.7:
+                raw_youtube = self.rng.choice(
+                    ["not a link", "https://vimeo.com/12345", "https://youtu.be/short", ""]
+                )
+                raw_date = self.performance_date().isoformat()
+            else:
+                raw_youtube = self.youtube_input(self.video_id())
+                raw_date = self.rng.choice(["1977-02-30", "05/08/1977", "1977", "next friday"])
+            try:
+                validate_submission_inputs(raw_youtube, raw_date)
+                error = DUPLICATE_CLIP_ERROR
+            except ValueError as e:
+                error = str(e)
+            yield (self.public_id("sub"), "rejected", self.contributor_pk(), None, error,
+                   raw_youtube, raw_date, None, None, self.tick())
+
+
+def _chunks(rows: Iterator[Any], size: int) -> Iterator[List[Any]]:
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _insert_sql(model, columns: Sequence[str]) -> str:
+    from django.db import connection
+
+    qn = connection.ops.quote_name
+    return (
+        f"INSERT INTO {qn(model._meta.db_table)} ({', '.join(qn(c) for c in columns)}) "
+        f"VALUES ({', '.join(['%s'] * len(columns))})"
+    )
+
+
+def _adapt(row: Sequence[Any]) -> List[Any]:
+    from django.db import connection
+
+    ops = connection.ops
+    out = []
+    for value in row:
+        if isinstance(value, datetime):
+            value = ops.adapt_datetimefield_value(value)
+        elif isinstance(value, date):
+            value = ops.adapt_datefield_value(value)
+        out.append(value)
+    return out
+
+
+CONTRIBUTOR_COLUMNS = (
+    "id", "public_id", "display_name", "external_id", "created_at",
+    "accepted_submission_count", "rejected_submission_count", "clip_count",
+)
+CLIP_COLUMNS = (
+    "id", "public_id", "contributor_id", "youtube_video_id", "raw_youtube_input",
+    "performance_date", "title", "notes", "created_at", "performance_month", "performance_day",
+)
+SUBMISSION_COLUMNS = (
+    "public_id", "status", "contributor_id", "clip_id", "validation_error",
+    "raw_youtube_input", "raw_date_input", "title", "notes", "submitted_at",
+)
+
+
+def generate(spec: DatasetSpec) -> Dict[str, Any]:
+    """Write the dataset described by ``spec`` into the default database.
+
+    Must run in a configured Django process against a migrated, empty
+    database. Derived state (calendar counts, contributor counters, archive
+    version) is rebuilt at the end. Returns counts and the elapsed time.
+    """
+    from django.db import connection, transaction
+
+    from archive.cache import bump_archive_version
+    from archive.calendar import rebuild_calendar
+    from archive.contributors import rebuild_contributor_counts
+    from archive.models import Clip, Contributor, Submission
+
+    if Contributor.objects.exists() or Clip.objects.exists():
+        raise RuntimeError("dataset generation needs an empty database")
+
+    started = time.perf_counter()
+    gen = Generator(spec)
+    clip_keys: List[Tuple[str, date]] = []
+
+    with connection.cursor() as cursor:
+        sql = _insert_sql(Contributor, CONTRIBUTOR_COLUMNS)
+        for chunk in _chunks(gen.contributors(), spec.chunk_size):
+            with transaction.atomic():
+                # Counters start at zero and are recomputed at the end.
+                cursor.executemany(sql, [_adapt((*r, 0, 0, 0)) for r in chunk])
+
+        clip_sql = _insert_sql(Clip, CLIP_COLUMNS)
+        submission_sql = _insert_sql(Submission, SUBMISSION_COLUMNS)
+        for chunk in _chunks(gen.clips_and_submissions(), spec.chunk_size):
+            clip_keys.extend((clip[3], clip[5]) for clip, _ in chunk)
+            with transaction.atomic():
+                cursor.executemany(
+                    clip_sql, [_adapt((*clip, clip[5].month, clip[5].day)) for clip, _ in chunk]
+                )
+                cursor.executemany(submission_sql, [_adapt(sub) for _, sub in chunk])
+
+        for chunk in _chunks(gen.rejected_submissions(clip_keys), spec.chunk_size):
+            with transaction.atomic():
+                cursor.executemany(submission_sql, [_adapt(r) for r in chunk])
+
+    if connection.vendor == "postgresql":
+        # Explicit pks leave the sequences behind; later inserts would collide.
+        with connection.cursor() as cursor:
+            for model in (Contributor, Clip):
+                table = model._meta.db_table
+                cursor.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT MAX(id) FROM {table}))"
+                )
+
+    with transaction.atomic():
+        rebuild_calendar()
+        bump_archive_version()
+    rebuild_contributor_counts()
+
+    return {
+        **asdict(spec),
+        "elapsed_s": round(time.perf_counter() - started, 3),
+    }
+
+
+def generate_command(spec: DatasetSpec) -> str:
+    """``manage.py shell -c`` source that runs ``generate(spec)`` and prints JSON."""
+    from servers import REPO_ROOT
+
+    return (
+        "import json, sys; "
+        f"sys.path.insert(0, {str(REPO_ROOT / 'benchmarks')!r}); "
+        "from dataset import DatasetSpec, generate; "
+        f"print(json.dumps(generate(DatasetSpec(**{asdict(spec)!r}))))"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, required=True, help="SQLite file to create.")
+    parser.add_argument("--contributors", type=int, default=DatasetSpec.contributors)
+    parser.add_argument("--clips", type=int, default=DatasetSpec.clips)
+    parser.add_argument("--rejected", type=int, default=DatasetSpec.rejected)
+    parser.add_argument("--seed", type=int, default=DatasetSpec.seed)
+    args = parser.parse_args()
+
+    from servers import django_env, manage
+
+    env = django_env(args.db)
+    manage(env, "migrate", "--verbosity", "0")
+    spec = DatasetSpec(args.contributors, args.clips, args.rejected, args.seed)
+    print(manage(env, "shell", "-c", generate_command(spec)))
+
+
+if __name__ == "__main__":
+    main()
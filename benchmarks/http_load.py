@@ -0,0 +1,110 @@
+"""Minimal asyncio HTTP/1.1 load driver shared by the benchmarks.
+
+Uses raw sockets (one connection per request, ``Connection: close``) so it
+needs nothing beyond the standard library and can hold thousands of
+concurrent connections from one process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+Request = Tuple[str, str, str, Optional[bytes]]  # (label, method, path, JSON body)
+
+
+async def send(
+    host: str,
+    port: int,
+    method: str,
+    path: str,
+    body: Optional[bytes] = None,
+    read_delay: float = 0.0,
+) -> Tuple[int, float]:
+    """Send one request and return (status code, latency in seconds).
+
+    ``read_delay`` keeps the connection open for that long before reading the
+    response, emulating a slow client.
+    """
+    started = time.perf_counter()
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        head = [f"{method} {path} HTTP/1.1", f"Host: {host}", "Connection: close"]
+        if body is not None:
+            head += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+        if read_delay:
+            await asyncio.sleep(read_delay)
+        status_line = await reader.readline()
+        await reader.read()
+    finally:
+        writer.close()
+    parts = status_line.split()
+    status = int(parts[1]) if len(parts) > 1 else 0
+    return status, time.perf_counter() - started
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    q = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "p50_ms": round(q[49] * 1000, 2) if q else None,
+        "p95_ms": round(q[94] * 1000, 2) if q else None,
+        "p99_ms": round(q[98] * 1000, 2) if q else None,
+    }
+
+
+async def run_load(
+    host: str,
+    port: int,
+    next_request: Callable[[int], Request],
+    total: int,
+    concurrency: int,
+    read_delay: float = 0.0,
+    ok_statuses: Sequence[int] = (200, 201, 304, 409),
+) -> Dict[str, Any]:
+    """Issue ``total`` requests with at most ``concurrency`` in flight.
+
+    ``next_request(n)`` returns the n-th (label, method, path, body) to send.
+    Results are summarized overall and per label.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    by_kind: Dict[str, List[float]] = {}
+    errors_by_kind: Dict[str, int] = {}
+
+    async def one(n: int) -> None:
+        kind, method, path, body = next_request(n)
+        async with semaphore:
+            try:
+                status, latency = await send(host, port, method, path, body, read_delay)
+            except OSError:
+                status, latency = 0, 0.0
+        by_kind.setdefault(kind, []).append(latency)
+        if status not in ok_statuses:
+            errors_by_kind[kind] = errors_by_kind.get(kind, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(n) for n in range(total)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "overall": summarize(
+            [x for v in by_kind.values() for x in v], sum(errors_by_kind.values()), elapsed
+        ),
+        "by_endpoint": {
+            kind: summarize(lat, errors_by_kind.get(kind, 0), elapsed)
+            for kind, lat in sorted(by_kind.items())
+        },
+    }
+
+
+def json_body(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload).encode("utf-8")
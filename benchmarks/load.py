@@ -0,0 +1,139 @@
+"""End-to-end mixed read/write load against a local server.
+
+Builds a synthetic archive with ``dataset.py`` (or reuses ``--db``), starts
+the app under WSGI or ASGI and drives a mix of reads (clip listing, clip
+detail, calendar, submission detail) and writes (new clips, duplicates and
+invalid submissions through POST /submissions). Reports throughput and
+p50/p95/p99 latency overall and per endpoint, and writes them as JSON.
+
+Usage (from the repository root):
+
+    python benchmarks/load.py --clips 1000000 --requests 20000 --concurrency 64
+    python benchmarks/load.py --db /tmp/bench.sqlite3 --write-share 0.3
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+from dataset import DatasetSpec, generate_command
+from http_load import Request, json_body, run_load
+from results import write_results
+from servers import django_env, free_port, manage, peak_rss_kb, start_server, stop_server
+
+SAMPLE_SCRIPT = """
+import json
+from archive.models import Clip, Contributor, Submission
+
+def spread(qs, n=1000):
+    # Evenly spaced rows by pk, so the sample is the same on every run.
+    last = qs.order_by("-pk").values_list("pk", flat=True).first() or 0
+    return qs.filter(pk__in=range(1, last + 1, max(1, last // n))).order_by("pk")
+
+print(json.dumps({
+    "contributors": list(spread(Contributor.objects, 100).values_list("public_id", flat=True)),
+    "clips": [
+        [p, d.isoformat(), v]
+        for p, d, v in spread(Clip.objects).values_list("public_id", "performance_date", "youtube_video_id")
+    ],
+    "submissions": list(spread(Submission.objects).values_list("public_id", flat=True)),
+}))
+"""
+
+
+def workload(sample: Dict[str, List[Any]], write_share: float, seed: int):
+    """Return ``next_request(n)`` producing a deterministic read/write mix."""
+    rng = random.Random(seed)
+    contributors, clips, submissions = sample["contributors"], sample["clips"], sample["submissions"]
+
+    def next_request(n: int) -> Request:
+        if rng.random() < write_share:
+            kind = rng.random()
+            contributor_id = rng.choice(contributors)
+            if kind < 0.7:
+                raw_youtube, raw_date = f"https://youtu.be/L{n:010d}", f"{rng.randint(1960, 2025)}-06-15"
+            elif kind < 0.9:
+                _, raw_date, video_id = rng.choice(clips)
+                raw_youtube = f"https://youtu.be/{video_id}"
+            else:
+                raw_youtube, raw_date = "not a link", "1977-05-08"
+            body = json_body(
+                {"contributor_id": contributor_id, "raw_youtube_input": raw_youtube, "raw_date_input": raw_date}
+            )
+            return "POST /submissions", "POST", "/submissions", body
+        kind = rng.random()
+        if kind < 0.4:
+            _, performance_date, _ = rng.choice(clips)
+            return "GET /clips", "GET", f"/clips?from={performance_date}&limit=50", None
+        if kind < 0.7:
+            return "GET /clips/{id}", "GET", f"/clips/{rng.choice(clips)[0]}", None
+        if kind < 0.85:
+            year = rng.choice(clips)[1][:4]
+            return "GET /calendar", "GET", f"/calendar?year={year}", None
+        return "GET /submissions/{id}", "GET", f"/submissions/{rng.choice(submissions)}", None
+
+    return next_request
+
+
+def run(db_path: Path, args) -> Dict[str, Any]:
+    env = django_env(db_path, TIME_WARP_ASYNC_READS="1" if args.server == "asgi" else "0")
+    sample = json.loads(manage(env, "shell", "-c", SAMPLE_SCRIPT))
+    port = free_port()
+    proc = start_server(args.server, env, port)
+    try:
+        result = asyncio.run(
+            run_load(
+                "127.0.0.1",
+                port,
+                workload(sample, args.write_share, args.seed),
+                total=args.requests,
+                concurrency=args.concurrency,
+            )
+        )
+        result["peak_rss_kb"] = peak_rss_kb(proc.pid)
+    finally:
+        stop_server(proc)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="Existing database built by dataset.py.")
+    parser.add_argument("--contributors", type=int, default=DatasetSpec.contributors)
+    parser.add_argument("--clips", type=int, default=DatasetSpec.clips)
+    parser.add_argument("--rejected", type=int, default=DatasetSpec.rejected)
+    parser.add_argument("--seed", type=int, default=DatasetSpec.seed)
+    parser.add_argument("--server", choices=["wsgi", "asgi"], default="wsgi")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--write-share", type=float, default=0.1)
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/).")
+    args = parser.parse_args()
+
+    params: Dict[str, Any] = {
+        k: v for k, v in vars(args).items() if k not in ("db", "output")
+    }
+    if args.db:
+        params["db"] = str(args.db)
+        result = run(args.db, args)
+    else:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = Path(tmp) / "load.sqlite3"
+            env = django_env(db_path)
+            manage(env, "migrate", "--verbosity", "0")
+            spec = DatasetSpec(args.contributors, args.clips, args.rejected, args.seed)
+            params["dataset"] = json.loads(manage(env, "shell", "-c", generate_command(spec)))
+            result = run(db_path, args)
+
+    print(json.dumps(result["overall"], indent=2))
+    print(write_results("load", params, result, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Micro-benchmarks for per-request hot paths.
+
+Times, in-process and without a database:
+
+- ``extract_youtube_video_id`` over the link shapes contributors submit;
+- ``dt_to_z`` timestamp formatting;
+- serialization of a clip page (``clip_page_to_dict`` + the JSON renderer)
+  and of a single submission;
+- the POST /submissions rate limiter: token-bucket updates over 1000
+  contributors with the in-process and the shared-file store, and the
+  throttle check DRF runs per request.
+
+Each case reports the best and median time per call over several repeats.
+
+Usage (from the repository root):
+
+    python benchmarks/micro.py --repeat 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from dataset import DatasetSpec, Generator
+from results import write_results
+from servers import DJANGO_ROOT
+
+
+def _setup_django() -> None:
+    sys.path.insert(0, str(DJANGO_ROOT))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+    import django
+
+    django.setup()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """Best and median nanoseconds per call of ``func``."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    per_call = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "calls_per_repeat": number,
+        "best_ns": round(min(per_call), 1),
+        "median_ns": round(statistics.median(per_call), 1),
+    }
+
+
+def sample_clip_rows(n: int) -> List[Tuple[Any, ...]]:
+    """Rows shaped like ``clip_rows()`` (CLIP_ROW_FIELDS order)."""
+    gen = Generator(DatasetSpec(contributors=10, clips=n, rejected=0))
+    rows = []
+    for (pk, public_id, _, video_id, _raw, d, title, notes, created), (sub_id, *_rest) in (
+        gen.clips_and_submissions()
+    ):
+        rows.append(
+            (public_id, video_id, d, title, notes, created, gen.public_id("ctr"), sub_id, pk)
+        )
+    return rows
+
+
+def rate_limit_cases(directory: str) -> Dict[str, Callable[[], Any]]:
+    from rest_framework.parsers import JSONParser
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from archive.api.throttling import SubmissionRateThrottle
+    from archive.ratelimit import MemoryStore, RateLimiter, SharedMemoryStore
+
+    # Both buckets of a submission, for 1000 contributors behind 1000 IPs.
+    limits = [
+        [(f"ip:10.0.{i // 256}.{i % 256}", 5.0, 100), (f"ctr:ctr_{i:032x}", 1.0, 30)]
+        for i in range(1000)
+    ]
+
+    def acquire(store) -> Callable[[], Any]:
+        limiter = RateLimiter(store)
+        requests = itertools.cycle(limits)
+        return lambda: limiter.acquire(next(requests), time.time())
+
+    request = Request(
+        APIRequestFactory().post(
+            "/submissions",
+            {"contributor_id": "ctr_0", "raw_youtube_input": "x", "raw_date_input": "1977-05-08"},
+            format="json",
+        ),
+        parsers=[JSONParser()],
+    )
+    request.data  # parsed once per request by the view anyway
+    throttle = SubmissionRateThrottle()
+    return {
+        "rate limiter (memory store)": acquire(MemoryStore()),
+        "rate limiter (shared file store)": acquire(
+            SharedMemoryStore(os.path.join(directory, "buckets"))
+        ),
+        "throttle check (POST /submissions)": lambda: throttle.allow_request(request, None),
+    }
+
+
+def run(repeat: int, page_size: int) -> Dict[str, Dict[str, float]]:
+    from archive.api.renderers import FastJSONRenderer
+    from archive.api.views import clip_page_to_dict, submission_to_dict
+    from archive.formatting import dt_to_z
+    from archive.models import Contributor, Submission
+    from archive.validation import extract_youtube_video_id
+
+    links = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42s",
+        "https://m.youtube.com/watch?feature=share&v=dQw4w9WgXcQ",
+    ]
+    timestamps = [
+        datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=17 * i, microseconds=i)
+        for i in range(100)
+    ]
+    clips = sample_clip_rows(page_size)
+    submission = Submission(
+        public_id="sub_0",
+        contributor=Contributor(public_id="ctr_0"),
+        status=Submission.Status.REJECTED,
+        validation_error="Invalid YouTube URL or video id",
+        raw_youtube_input="not a link",
+        raw_date_input=date(1977, 5, 8).isoformat(),
+        submitted_at=timestamps[0],
+    )
+    renderer = FastJSONRenderer()
+
+    def extract() -> None:
+        for link in links:
+            extract_youtube_video_id(link)
+
+    def format_timestamps() -> None:
+        for ts in timestamps:
+            dt_to_z(ts)
+
+    cases: Dict[str, Callable[[], Any]] = {
+        f"extract_youtube_video_id x{len(links)}": extract,
+        f"dt_to_z x{len(timestamps)}": format_timestamps,
+        f"clip_page x{page_size} (dict)": lambda: clip_page_to_dict(clips, "cursor"),
+        f"clip_page x{page_size} (dict + JSON)": lambda: renderer.render(
+            clip_page_to_dict(clips, "cursor")
+        ),
+        "submission (dict + JSON)": lambda: renderer.render(submission_to_dict(submission)),
+    }
+    with tempfile.TemporaryDirectory() as directory:
+        cases.update(rate_limit_cases(directory))
+        return {name: measure(func, repeat) for name, func in cases.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/).")
+    args = parser.parse_args()
+
+    _setup_django()
+    results = run(args.repeat, args.page_size)
+    for name, r in results.items():
+        print(f"{name:40} best {r['best_ns'] / 1000:10.2f} us  median {r['median_ns'] / 1000:10.2f} us")
+    params = {"repeat": args.repeat, "page_size": args.page_size}
+    print(write_results("micro", params, results, args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""JSON result files shared by the benchmarks, so runs can be compared over time."""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from servers import REPO_ROOT
+
+RESULTS_DIR = REPO_ROOT / "benchmarks" / "results"
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(
+    name: str, params: Dict[str, Any], results: Any, output: Optional[Path] = None
+) -> Path:
+    """Write ``results`` with run metadata and return the file path.
+
+    Defaults to ``benchmarks/results/<name>-<UTC timestamp>.json``.
+    """
+    now = datetime.now(timezone.utc)
+    document = {
+        "benchmark": name,
+        "started_at": now.isoformat().replace("+00:00", "Z"),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "params": params,
+        "results": results,
+    }
+    if output is None:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        output = RESULTS_DIR / f"{name}-{now.strftime('%Y%m%dT%H%M%SZ')}.json"
+    output.write_text(json.dumps(document, indent=2) + "\n")
+    return output
@@ -0,0 +1,212 @@
+"""Per-row cost of serializing clip listings, before and after the row-based path.
+
+Walks the first pages of ``GET /clips`` and the NDJSON export against a
+synthetic archive and times each stage per clip:
+
+- ``legacy``: Clip model instances from ``clip_queryset()``, the previous
+  ``clip_to_dict`` (``astimezone().isoformat().replace()`` per timestamp,
+  ``date.isoformat()`` per date) and DRF's stock ``JSONRenderer``; the export
+  with ``json.dumps`` per line;
+- ``fast``: named value rows from ``clip_rows()``, ``clip_row_to_dict`` with
+  the cached formatters and ``FastJSONRenderer``; the export as shipped.
+
+Both paths must produce identical bytes; the script fails if they do not.
+
+Usage (from the repository root):
+
+    python benchmarks/serialization.py --clips 50000 --pages 20 --page-size 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from dataset import DatasetSpec, generate
+from results import write_results
+from servers import DJANGO_ROOT, django_env
+
+
+def _setup_django(db_path: Path) -> None:
+    os.environ.update(django_env(db_path))
+    sys.path.insert(0, str(DJANGO_ROOT))
+    import django
+
+    django.setup()
+
+
+def legacy_dt_to_z(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def legacy_clip_to_dict(clip) -> Dict[str, Any]:
+    from archive.formatting import youtube_url
+
+    return {
+        "id": clip.public_id,
+        "youtube_video_id": clip.youtube_video_id,
+        "youtube_url": youtube_url(clip.youtube_video_id),
+        "performance_date": clip.performance_date.isoformat(),
+        "title": clip.title,
+        "notes": clip.notes,
+        "created_at": legacy_dt_to_z(clip.created_at),
+        "created_by_contributor_id": clip.contributor_public_id,
+        "added_via_submission_id": clip.submission_public_id,
+    }
+
+
+@contextlib.contextmanager
+def legacy_export() -> Iterator[None]:
+    """Swap the export's formatters back to the per-call stdlib versions."""
+    from archive import export
+
+    saved = export.dt_to_z, export.format_date, export._encode_json
+    export.dt_to_z = legacy_dt_to_z
+    export.format_date = lambda d: d.isoformat()
+    export._encode_json = lambda row: json.dumps(row, ensure_ascii=False)
+    try:
+        yield
+    finally:
+        export.dt_to_z, export.format_date, export._encode_json = saved
+
+
+def time_listing(
+    queryset: Callable[[], Any],
+    to_dict: Callable[[Any], Dict[str, Any]],
+    renderer,
+    pages: int,
+    page_size: int,
+) -> Tuple[Dict[str, float], List[bytes]]:
+    """Seconds spent per stage over ``pages`` consecutive pages, and the bodies."""
+    from archive.api.pagination import decode_cursor, paginate
+
+    totals = {"fetch": 0.0, "dict": 0.0, "render": 0.0}
+    bodies: List[bytes] = []
+    cursor = None
+    rows_seen = 0
+    for _ in range(pages):
+        t0 = time.perf_counter()
+        rows, next_token = paginate(queryset(), cursor, page_size)
+        t1 = time.perf_counter()
+        data = {"items": [to_dict(row) for row in rows], "next_cursor": next_token}
+        t2 = time.perf_counter()
+        bodies.append(renderer.render(data))
+        t3 = time.perf_counter()
+        totals["fetch"] += t1 - t0
+        totals["dict"] += t2 - t1
+        totals["render"] += t3 - t2
+        rows_seen += len(rows)
+        if next_token is None:
+            break
+        cursor = decode_cursor(next_token)
+    totals["rows"] = rows_seen
+    return totals, bodies
+
+
+def time_export(rows: int) -> Tuple[float, List[str]]:
+    from archive.export import iter_clip_rows, ndjson_lines
+
+    started = time.perf_counter()
+    lines = []
+    for line in ndjson_lines(iter_clip_rows()):
+        lines.append(line)
+        if len(lines) == rows:
+            break
+    return time.perf_counter() - started, lines
+
+
+def per_row_us(seconds: float, rows: int) -> float:
+    return round(seconds / rows * 1e6, 3)
+
+
+def run(pages: int, page_size: int, export_rows: int, repeat: int) -> Dict[str, Any]:
+    from rest_framework.renderers import JSONRenderer
+
+    from archive.api.renderers import FastJSONRenderer
+    from archive.api.views import clip_queryset, clip_row_to_dict, clip_rows
+
+    paths = {
+        "legacy": (clip_queryset, legacy_clip_to_dict, JSONRenderer()),
+        "fast": (clip_rows, clip_row_to_dict, FastJSONRenderer()),
+    }
+    results: Dict[str, Any] = {}
+    bodies: Dict[str, List[bytes]] = {}
+    for name, (queryset, to_dict, renderer) in paths.items():
+        best: Dict[str, float] = {}
+        for _ in range(repeat):
+            totals, bodies[name] = time_listing(queryset, to_dict, renderer, pages, page_size)
+            for stage in ("fetch", "dict", "render"):
+                best[stage] = min(best.get(stage, float("inf")), totals[stage])
+        rows = int(totals["rows"])
+        results[f"list_{name}"] = {
+            "rows": rows,
+            **{f"{stage}_us_per_row": per_row_us(best[stage], rows) for stage in best},
+            "total_us_per_row": per_row_us(sum(best.values()), rows),
+        }
+    if bodies["legacy"] != bodies["fast"]:
+        raise SystemExit("listing bodies differ between the legacy and fast paths")
+
+    lines: Dict[str, List[str]] = {}
+    for name in ("legacy", "fast"):
+        context = legacy_export() if name == "legacy" else contextlib.nullcontext()
+        elapsed = float("inf")
+        with context:
+            for _ in range(repeat):
+                seconds, lines[name] = time_export(export_rows)
+                elapsed = min(elapsed, seconds)
+        results[f"export_{name}"] = {
+            "rows": len(lines[name]),
+            "total_us_per_row": per_row_us(elapsed, len(lines[name])),
+        }
+    if lines["legacy"] != lines["fast"]:
+        raise SystemExit("export lines differ between the legacy and fast paths")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", type=Path, help="Existing database built by dataset.py.")
+    parser.add_argument("--clips", type=int, default=50_000)
+    parser.add_argument("--seed", type=int, default=DatasetSpec.seed)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=200)
+    parser.add_argument("--export-rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = args.db or Path(tmp) / "bench.sqlite3"
+        _setup_django(db_path)
+        if args.db is None:
+            from django.core.management import call_command
+
+            call_command("migrate", verbosity=0)
+            generate(DatasetSpec(contributors=1000, clips=args.clips, rejected=0, seed=args.seed))
+        results = run(args.pages, args.page_size, args.export_rows, args.repeat)
+
+    for name, r in results.items():
+        stages = "  ".join(f"{k[:-11]} {v:7.2f}" for k, v in r.items() if k.endswith("_us_per_row"))
+        print(f"{name:14} us/row: {stages}")
+    params = {
+        "db": str(args.db) if args.db else None,
+        "clips": args.clips if args.db is None else None,
+        "seed": args.seed,
+        "pages": args.pages,
+        "page_size": args.page_size,
+        "export_rows": args.export_rows,
+        "repeat": args.repeat,
+    }
+    print(write_results("serialization", params, results, args.output))
+
+
+if __name__ == "__main__":
+    main()
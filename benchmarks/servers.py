@@ -0,0 +1,99 @@
+"""Helpers to run the Django app against a throwaway database for benchmarks."""
+
+from __future__ import annotations
+
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DJANGO_ROOT = REPO_ROOT / "apps" / "server"
+
+
+def django_env(db_path: Path, **extra: str) -> Dict[str, str]:
+    """Environment for a Django process using the SQLite file at ``db_path``."""
+    env = dict(os.environ)
+    env["DJANGO_SETTINGS_MODULE"] = "config.settings"
+    env["TIME_WARP_SQLITE_PATH"] = str(db_path)
+    # Load generators send everything from one IP; measure the app, not the limiter.
+    env["TIME_WARP_RATE_LIMIT"] = "0"
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(DJANGO_ROOT), env.get("PYTHONPATH")]))
+    env.update(extra)
+    return env
+
+
+def manage(env: Dict[str, str], *args: str) -> str:
+    """Run ``manage.py`` and return the last line of its stdout."""
+    result = subprocess.run(
+        [sys.executable, str(DJANGO_ROOT / "manage.py"), *args],
+        env=env,
+        cwd=DJANGO_ROOT,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    lines = result.stdout.strip().splitlines()
+    return lines[-1] if lines else ""
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(mode: str, env: Dict[str, str], port: int) -> subprocess.Popen:
+    """Start the app on 127.0.0.1:``port``.
+
+    ``wsgi`` uses Django's threaded development server (one thread per
+    connection); ``asgi`` uses uvicorn (``pip install uvicorn``) on
+    ``config.asgi``.
+    """
+    if mode == "wsgi":
+        cmd = [sys.executable, str(DJANGO_ROOT / "manage.py"), "runserver", "--noreload", f"127.0.0.1:{port}"]
+    elif mode == "asgi":
+        cmd = [
+            sys.executable, "-m", "uvicorn", "config.asgi:application",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--log-level", "warning", "--backlog", "4096",
+        ]
+    else:
+        raise ValueError(f"unknown server mode {mode!r}")
+    proc = subprocess.Popen(
+        cmd, env=env, cwd=DJANGO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"{mode} server exited with {proc.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"{mode} server did not start")
+
+
+def stop_server(proc: subprocess.Popen) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+
+def peak_rss_kb(pid: int) -> Optional[int]:
+    """Peak resident set size of a process (Linux only; None elsewhere)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
@@ -0,0 +1,138 @@
+"""Concurrent-writer stress test for the SQLite profiles.
+
+Starts several worker processes (like several WSGI workers) that hammer
+POST /submissions against one SQLite file and reports throughput, latency and
+lock errors for the default profile and for TIME_WARP_SQLITE_PROFILE=production.
+With --async-submissions the workers run with TIME_WARP_ASYNC_SUBMISSIONS=1
+(202 + group commit); the elapsed time then includes flushing each worker's
+queue, so throughput counts committed submissions.
+
+Usage (from the repository root):
+
+    python benchmarks/sqlite_write_stress.py --workers 8 --per-worker 200
+    python benchmarks/sqlite_write_stress.py --profiles production --async-submissions
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from servers import DJANGO_ROOT, django_env, manage
+
+
+def _worker(job: Dict[str, Any]) -> Dict[str, Any]:
+    os.environ.update(job["env"])
+    sys.path.insert(0, str(DJANGO_ROOT))
+    import django
+
+    django.setup()
+    from django.test import Client
+
+    client = Client()
+    latencies: List[float] = []
+    errors = 0
+    for n in range(job["per_worker"]):
+        payload = {
+            "contributor_id": job["contributor_id"],
+            "raw_youtube_input": f"https://youtu.be/w{job['worker']:02d}{n:08d}",
+            "raw_date_input": f"{1960 + n % 60}-{1 + n % 12:02d}-{1 + n % 28:02d}",
+        }
+        started = time.perf_counter()
+        try:
+            resp = client.post(
+                "/submissions", data=json.dumps(payload), content_type="application/json"
+            )
+            ok = resp.status_code in (201, 202, 409)
+        except Exception:
+            ok = False
+        latencies.append(time.perf_counter() - started)
+        errors += not ok
+    if job["env"].get("TIME_WARP_ASYNC_SUBMISSIONS") == "1":
+        from archive.group_commit import group_commit
+
+        group_commit.flush()
+    return {"latencies": latencies, "errors": errors}
+
+
+def run_profile(
+    profile: str, workers: int, per_worker: int, async_submissions: bool = False
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        env = django_env(
+            Path(tmp) / "stress.sqlite3",
+            TIME_WARP_SQLITE_PROFILE=profile,
+            TIME_WARP_ASYNC_SUBMISSIONS="1" if async_submissions else "0",
+        )
+        manage(env, "migrate", "--verbosity", "0")
+        contributor_id = manage(
+            env,
+            "shell",
+            "-c",
+            "from archive.models import Contributor; "
+            "print(Contributor.objects.create(display_name='stress').public_id)",
+        )
+        jobs = [
+            {"env": env, "contributor_id": contributor_id, "worker": w, "per_worker": per_worker}
+            for w in range(workers)
+        ]
+        ctx = multiprocessing.get_context("spawn")
+        started = time.perf_counter()
+        with ctx.Pool(workers) as pool:
+            results = pool.map(_worker, jobs)
+        elapsed = time.perf_counter() - started
+        committed = int(
+            manage(
+                env,
+                "shell",
+                "-c",
+                "from archive.models import Submission; print(Submission.objects.count())",
+            )
+        )
+
+    latencies = sorted(x for r in results for x in r["latencies"])
+    q = statistics.quantiles(latencies, n=100)
+    return {
+        "profile": profile,
+        "async_submissions": async_submissions,
+        "workers": workers,
+        "requests": len(latencies),
+        "committed": committed,
+        "errors": sum(r["errors"] for r in results),
+        "elapsed_s": round(elapsed, 3),
+        "requests_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(q[49] * 1000, 2),
+        "p99_ms": round(q[98] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--per-worker", type=int, default=200)
+    parser.add_argument(
+        "--profiles", nargs="+", default=["default", "production"], help="Profiles to compare."
+    )
+    parser.add_argument(
+        "--async-submissions",
+        action="store_true",
+        help="Answer 202 and write through the group-commit worker.",
+    )
+    args = parser.parse_args()
+    results = [
+        run_profile(p, args.workers, args.per_worker, args.async_submissions)
+        for p in args.profiles
+    ]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
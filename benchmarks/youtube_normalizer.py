@@ -0,0 +1,109 @@
+"""Throughput of the YouTube input normalizer (archive.youtube).
+
+Runs a deterministic mix of raw inputs (watch URLs with tracking parameters,
+short links, shorts/embed/live paths, bare ids and invalid strings) through:
+
+- ``legacy``: the previous single ``YOUTUBE_ID_RE.search`` (fewer shapes);
+- ``cold``: ``normalize_youtube_input`` with an empty cache, all inputs distinct;
+- ``warm``: repeated inputs that fit in the memo cache;
+- ``batch``: ``normalize_youtube_inputs`` over a list with repeats, as bulk
+  imports see it.
+
+Usage (from the repository root):
+
+    python benchmarks/youtube_normalizer.py --inputs 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from results import write_results
+from servers import DJANGO_ROOT
+
+LEGACY_RE = re.compile(r"(?:v=|youtu\.be/)([A-Za-z0-9_-]{11})")
+ID_ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+
+def make_inputs(n: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    shapes: List[Callable[[str], str]] = [
+        lambda v: f"https://www.youtube.com/watch?v={v}",
+        lambda v: f"https://youtu.be/{v}?si={v}{v}",
+        lambda v: f"https://www.youtube.com/watch?v={v}&list=PL{v}{v}&index=3"
+        f"&utm_source=newsletter&utm_medium=email&fbclid={v * 4}",
+        lambda v: f"https://m.youtube.com/watch?feature=share&v={v}",
+        lambda v: f"https://www.youtube.com/shorts/{v}?feature=share",
+        lambda v: f"https://www.youtube.com/embed/{v}?start=30",
+        lambda v: f"https://www.youtube.com/live/{v}",
+        lambda v: v,
+        lambda v: f"https://vimeo.com/{rng.randrange(10**9)}",
+        lambda v: f"not a url {v}",
+    ]
+    out = []
+    for _ in range(n):
+        video_id = "".join(rng.choices(ID_ALPHABET, k=11))
+        out.append(rng.choice(shapes)(video_id))
+    return out
+
+
+def throughput(func: Callable[[], object], n: int) -> Dict[str, float]:
+    started = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - started
+    return {"inputs": n, "seconds": round(elapsed, 4), "inputs_per_s": round(n / elapsed)}
+
+
+def run(n: int, seed: int) -> Dict[str, Dict[str, float]]:
+    sys.path.insert(0, str(DJANGO_ROOT))
+    from archive import youtube
+
+    inputs = make_inputs(n, seed)
+    cached = inputs[: min(n, youtube.CACHE_SIZE)]
+    with_repeats = inputs[: n // 4] * 4
+
+    def legacy() -> None:
+        for raw in inputs:
+            LEGACY_RE.search(raw)
+
+    def single(raws: List[str]) -> None:
+        for raw in raws:
+            try:
+                youtube.normalize_youtube_input(raw)
+            except ValueError:
+                pass
+
+    results = {"legacy": throughput(legacy, n)}
+    youtube.clear_cache()
+    results["cold"] = throughput(lambda: single(inputs), n)
+    single(cached)
+    results["warm"] = throughput(lambda: single(cached), len(cached))
+    youtube.clear_cache()
+    results["batch"] = throughput(
+        lambda: youtube.normalize_youtube_inputs(with_repeats), len(with_repeats)
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--inputs", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="Result file (default: benchmarks/results/).")
+    args = parser.parse_args()
+
+    results = run(args.inputs, args.seed)
+    for name, r in results.items():
+        print(f"{name:8} {r['inputs_per_s']:>12,} inputs/s")
+    params = {"inputs": args.inputs, "seed": args.seed}
+    print(write_results("youtube_normalizer", params, results, args.output))
+
+
+if __name__ == "__main__":
+    main()
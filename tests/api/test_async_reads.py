@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+
+from archive.api import async_views
+
+
+def _call(view, path: str, *args, **headers):
+    request = RequestFactory().get(path, **headers)
+    return async_to_sync(view)(request, *args)
+
+
+def test_async_views_match_sync_views(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    for n, d in enumerate(["1994-06-01", "1971-03-12", "2001-09-30", "1972-03-12"]):
+        submission = submit(contributor_id, f"asy{n:08d}", d, title="Async show").json()
+    clip_id = submission["clip_id"]
+
+    for view, path, args in [
+        (async_views.list_clips, "/clips?limit=2", ()),
+        (async_views.list_clips_on_this_day, "/clips/on-this-day?month=3&day=12&limit=1", ()),
+        (async_views.get_nearest_clips, "/clips/nearest?date=1980-01-01&limit=1", ()),
+        (async_views.get_clip, f"/clips/{clip_id}", (clip_id,)),
+        (async_views.list_clip_neighbors, f"/clips/{clip_id}/next", (clip_id, "next")),
+        (async_views.list_clip_neighbors, f"/clips/{clip_id}/prev?limit=2", (clip_id, "prev")),
+        (async_views.get_submission, f"/submissions/{submission['id']}", (submission["id"],)),
+        (async_views.get_contributor, f"/contributors/{contributor_id}", (contributor_id,)),
+        (
+            async_views.list_contributor_clips,
+            f"/contributors/{contributor_id}/clips?limit=3",
+            (contributor_id,),
+        ),
+    ]:
+        sync_resp = client._c.get(path)
+        async_resp = _call(view, path, *args)
+        assert async_resp.status_code == sync_resp.status_code == 200
+        assert async_resp.content == sync_resp.content
+        assert async_resp.get("ETag") == sync_resp.get("ETag")
+
+    # The listing cursor round-trips through the async view.
+    first = client.get("/clips", params={"limit": 2}).json()
+    page = _call(async_views.list_clips, f"/clips?limit=2&cursor={first['next_cursor']}")
+    assert page.status_code == 200
+    assert b'"performance_date":"2001-09-30"' in page.content
+
+
+def test_async_views_errors_and_conditional_get(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    clip_id = submit(contributor_id, "aaaaaaaaaaa", "1994-06-01").json()["clip_id"]
+
+    assert _call(async_views.get_clip, "/clips/clp_missing", "clp_missing").status_code == 404
+    assert _call(async_views.get_submission, "/submissions/x", "x").status_code == 404
+    assert _call(async_views.get_contributor, "/contributors/x", "x").status_code == 404
+    assert _call(async_views.list_contributor_clips, "/contributors/x/clips", "x").status_code == 404
+    missing = _call(async_views.list_clip_neighbors, "/clips/x/next", "x", "next")
+    assert missing.status_code == 404
+    assert _call(async_views.list_clips, "/clips?limit=0").status_code == 400
+    assert _call(async_views.list_clips_on_this_day, "/clips/on-this-day").status_code == 400
+    assert _call(async_views.get_nearest_clips, "/clips/nearest").status_code == 400
+
+    etag = _call(async_views.get_clip, f"/clips/{clip_id}", clip_id)["ETag"]
+    resp = _call(async_views.get_clip, f"/clips/{clip_id}", clip_id, HTTP_IF_NONE_MATCH=etag)
+    assert resp.status_code == 304
+
+
+def test_get_submission(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    created = submit(contributor_id, "aaaaaaaaaaa", "1994-06-01").json()
+
+    resp = client.get(f"/submissions/{created['id']}")
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == created
+    assert client.get("/submissions/sub_missing").status_code == 404
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import pytest
+from django.db import DatabaseError
+
+from archive import group_commit as group_commit_module
+from archive.group_commit import WRITE_FAILED_ERROR, group_commit
+from archive.models import Contributor, Submission
+from archive.validation import DUPLICATE_CLIP_ERROR
+
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+@pytest.fixture(autouse=True)
+def _async_mode(settings):
+    settings.ARCHIVE_ASYNC_SUBMISSIONS = True
+    # Long enough that every submission of a test lands in one batch.
+    settings.ARCHIVE_GROUP_COMMIT_WINDOW = 30.0
+    yield
+    group_commit.flush()
+
+
+def test_accepted_with_202_and_pending_until_committed(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+
+    resp = submit(contributor_id, "asyncA0001x")
+    assert resp.status_code == 202, resp.text
+    data = resp.json()
+    assert data["status"] == "pending"
+    assert data["clip_id"] is None
+
+    assert client.get(f"/submissions/{data['id']}").json() == data
+    assert not Submission.objects.exists()
+
+    group_commit.flush()
+
+    final = client.get(f"/submissions/{data['id']}").json()
+    assert final["status"] == "accepted"
+    assert final["clip_id"] is not None
+    assert client.get(f"/clips/{final['clip_id']}").status_code == 200
+
+
+def test_invalid_input_is_rejected_up_front_and_recorded(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+
+    resp = submit(contributor_id, "asyncB0001x", raw_date="1977-02-30")
+    assert resp.status_code == 202
+    data = resp.json()
+    assert data["status"] == "rejected"
+    assert data["validation_error"]
+
+    group_commit.flush()
+
+    stored = client.get(f"/submissions/{data['id']}").json()
+    assert stored["status"] == "rejected"
+    assert stored["validation_error"] == data["validation_error"]
+
+
+def test_burst_is_one_transaction_with_one_duplicate_check(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+    batches, committed = group_commit.batches, group_commit.committed
+
+    ids = [submit(contributor_id, f"asyncC{n:04d}x").json()["id"] for n in range(5)]
+    # Same clip twice within the burst, and once more after it commits.
+    ids.append(submit(contributor_id, "asyncC0000x").json()["id"])
+    group_commit.flush()
+
+    assert group_commit.batches == batches + 1
+    assert group_commit.committed == committed + 6
+    statuses = [client.get(f"/submissions/{i}").json()["status"] for i in ids]
+    assert statuses == ["accepted"] * 5 + ["rejected"]
+    assert Submission.objects.get(public_id=ids[-1]).validation_error == DUPLICATE_CLIP_ERROR
+
+    late = submit(contributor_id, "asyncC0001x").json()
+    assert late["status"] == "pending"
+    group_commit.flush()
+    assert client.get(f"/submissions/{late['id']}").json()["status"] == "rejected"
+
+    contributor = Contributor.objects.get(public_id=contributor_id)
+    assert contributor.accepted_submission_count == 5
+    assert contributor.rejected_submission_count == 2
+    assert contributor.clip_count == 5
+    days = client.get("/calendar", params={"year": 1977, "month": 5}).json()["days"]
+    assert days == [{"date": "1977-05-08", "clip_count": 5}]
+
+
+def test_unknown_contributor_is_still_rejected_synchronously(submit) -> None:
+    resp = submit("ctr_missing", "asyncD0001x")
+    assert resp.status_code == 400
+    group_commit.flush()
+    assert not Submission.objects.exists()
+
+
+def test_failed_batch_is_retried_one_submission_at_a_time(
+    client, create_contributor, submit, monkeypatch
+) -> None:
+    ingest_batch = group_commit_module.ingest_batch
+
+    def ingest(items):
+        if any(item.raw_youtube_input == "asyncE0001x" for item in items):
+            raise DatabaseError("value too long for type character varying(50)")
+        return ingest_batch(items)
+
+    monkeypatch.setattr(group_commit_module, "ingest_batch", ingest)
+    contributor_id = create_contributor()
+    ids = [submit(contributor_id, f"asyncE000{n}x").json()["id"] for n in range(3)]
+    group_commit.flush()
+
+    results = [client.get(f"/submissions/{i}").json() for i in ids]
+    assert [r["status"] for r in results] == ["accepted", "rejected", "accepted"]
+    assert results[1]["validation_error"] == WRITE_FAILED_ERROR
+    assert Submission.objects.count() == 2
+
+
+def test_inputs_longer_than_their_columns_are_refused(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "asyncF0001x", raw_date="1977-05-08" * 6).status_code == 400
+    assert submit(contributor_id, "asyncF0002x", title="x" * 501).status_code == 400
+    group_commit.flush()
+    assert not Submission.objects.exists()
+
+
+def test_worker_survives_a_broken_connection(
+    client, create_contributor, submit, monkeypatch
+) -> None:
+    def broken() -> None:
+        raise DatabaseError("server closed the connection unexpectedly")
+
+    contributor_id = create_contributor()
+    with monkeypatch.context() as m:
+        m.setattr(group_commit_module, "close_old_connections", broken)
+        lost = submit(contributor_id, "asyncG0001x").json()["id"]
+        group_commit.flush()
+    assert client.get(f"/submissions/{lost}").json()["validation_error"] == WRITE_FAILED_ERROR
+
+    saved = submit(contributor_id, "asyncG0002x").json()["id"]
+    group_commit.flush()
+    assert client.get(f"/submissions/{saved}").json()["status"] == "accepted"
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+
+@pytest.fixture
+def populated(client, create_contributor, submit, submission_item) -> None:
+    contributor_id = create_contributor()
+    for n, d in enumerate(["1994-06-01", "1994-06-01", "1994-06-18", "1994-11-05"]):
+        assert submit(contributor_id, f"cal{n:08d}", d).json()["status"] == "accepted"
+    # Duplicates and invalid submissions must not be counted.
+    submit(contributor_id, "cal00000000", "1994-06-01")
+    submit(contributor_id, "cal00000009", "1994-06-31")
+    resp = client.post(
+        "/submissions:batch",
+        json=[
+            submission_item(contributor_id, "bat00000000", "1994-06-18"),
+            submission_item(contributor_id, "bat00000000", "1994-06-18"),
+            submission_item(contributor_id, "bat00000001", "1995-01-01"),
+        ],
+    )
+    assert resp.status_code == 201, resp.text
+
+
+def test_calendar_year_and_month_views(client, populated) -> None:
+    resp = client.get("/calendar", params={"year": 1994})
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["total"] == 5
+    assert data["months"] == [
+        {"month": 6, "clip_count": 4},
+        {"month": 11, "clip_count": 1},
+    ]
+
+    resp = client.get("/calendar", params={"year": 1994, "month": 6})
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["days"] == [
+        {"date": "1994-06-01", "clip_count": 2},
+        {"date": "1994-06-18", "clip_count": 2},
+    ]
+
+
+def test_calendar_rejects_bad_parameters(client) -> None:
+    assert client.get("/calendar").status_code == 400
+    assert client.get("/calendar", params={"year": "abc"}).status_code == 400
+    assert client.get("/calendar", params={"year": 1994, "month": 13}).status_code == 400
+
+
+def test_rebuild_calendar_repairs_drift(populated) -> None:
+    from archive.models import CalendarDay
+
+    call_command("rebuild_calendar", "--check")
+
+    CalendarDay.objects.filter(performance_date="1994-06-01").update(clip_count=7)
+    with pytest.raises(CommandError):
+        call_command("rebuild_calendar", "--check")
+
+    call_command("rebuild_calendar")
+    assert CalendarDay.objects.get(performance_date="1994-06-01").clip_count == 2
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def _queries(client, path: str, params=None) -> tuple:
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.get(path, params=params)
+    return resp, len(ctx.captured_queries)
+
+
+def test_get_clip_returns_clip_and_404(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    clip_id = submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").json()["clip_id"]
+
+    resp = client.get(f"/clips/{clip_id}")
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert data["id"] == clip_id
+    assert data["performance_date"] == "1977-05-08"
+    assert data["youtube_url"] == "https://www.youtube.com/watch?v=aaaaaaaaaaa"
+
+    assert client.get("/clips/clp_missing").status_code == 404
+
+
+def test_repeat_reads_are_served_from_cache(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    clip_id = submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").json()["clip_id"]
+
+    first, cold = _queries(client, f"/clips/{clip_id}")
+    second, warm = _queries(client, f"/clips/{clip_id}")
+    assert first.json() == second.json()
+    assert warm == 2 < cold  # only the ETag validator and archive version lookups
+
+    _, cold = _queries(client, "/clips", {"limit": 10})
+    _, warm = _queries(client, "/clips", {"limit": 10})
+    assert warm == 2 < cold
+
+
+def test_only_accepted_submissions_invalidate(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    submit(contributor_id, "aaaaaaaaaaa", "1977-05-08")
+    assert len(client.get("/clips").json()["items"]) == 1
+
+    # Duplicate and invalid submissions leave the cache warm.
+    assert submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").status_code == 409
+    submit(contributor_id, "bad", "1977-05-08")
+    _, queries = _queries(client, "/clips")
+    assert queries == 2
+
+    # An accepted submission is visible immediately.
+    submit(contributor_id, "bbbbbbbbbbb", "1977-05-09")
+    assert len(client.get("/clips").json()["items"]) == 2
+
+
+def test_archive_version_bumps_spread_over_the_shards(db) -> None:
+    from archive.cache import archive_version, bump_archive_version
+    from archive.models import ArchiveVersion
+
+    before = archive_version()
+    for _ in range(64):
+        bump_archive_version()
+    assert archive_version() == before + 64
+    assert ArchiveVersion.objects.filter(version__gt=0).count() > 1
+
+
+def test_lru_cache_respects_byte_limit() -> None:
+    from archive.cache import LRUMemoryCache
+
+    cache = LRUMemoryCache(
+        "test-lru-bytes", {"OPTIONS": {"MAX_BYTES": 4096, "MAX_ENTRIES": 1000}}
+    )
+    cache.clear()
+    for n in range(50):
+        cache.set(f"k{n}", "x" * 500)
+        cache.get("k0")  # keep k0 hot
+    assert cache.used_bytes <= 4096
+    assert cache.get("k0") is not None
+    assert cache.get("k1") is None
+    cache.delete("k0")
+    cache.clear()
+    assert cache.used_bytes == 0
+
+
+def test_lru_cache_counts_an_entry_culled_while_being_replaced_once() -> None:
+    from archive.cache import LRUMemoryCache
+
+    cache = LRUMemoryCache(
+        "test-lru-cull", {"OPTIONS": {"MAX_BYTES": 1 << 20, "MAX_ENTRIES": 4, "CULL_FREQUENCY": 2}}
+    )
+    cache.clear()
+    for n in range(4):
+        cache.set(f"k{n}", "x" * 100)
+    # k0 is least recently used: the cull evicts it just before it is rewritten.
+    cache.set("k0", "y" * 200)
+    assert cache.used_bytes == sum(len(v) for v in cache._cache.values())
+    cache.clear()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture
+def ids(client, create_contributor, submit) -> List[str]:
+    """Create clips (with same-day ties) and return their ids in chronological order."""
+    contributor_id = create_contributor()
+    dates = ["1994-06-01", "1971-03-12", "1994-06-01", "2001-09-30", "1971-03-12"]
+    for n, d in enumerate(dates):
+        resp = submit(contributor_id, f"nbr{n:08d}", d)
+        assert resp.status_code == 201, resp.text
+    listing = client.get("/clips").json()
+    return [c["id"] for c in listing["items"]]
+
+
+def _ids(resp) -> List[str]:
+    assert resp.status_code == 200, resp.text
+    return [c["id"] for c in resp.json()["items"]]
+
+
+def test_next_and_prev_return_adjacent_clips(client, ids) -> None:
+    assert _ids(client.get(f"/clips/{ids[2]}/next")) == [ids[3]]
+    assert _ids(client.get(f"/clips/{ids[2]}/prev")) == [ids[1]]
+    assert _ids(client.get(f"/clips/{ids[1]}/next", params={"limit": 3})) == ids[2:5]
+    assert _ids(client.get(f"/clips/{ids[3]}/prev", params={"limit": 10})) == ids[:3]
+
+
+def test_hopping_one_clip_at_a_time_follows_the_listing(client, ids) -> None:
+    forward = [ids[0]]
+    while True:
+        step = _ids(client.get(f"/clips/{forward[-1]}/next"))
+        if not step:
+            break
+        forward.extend(step)
+    assert forward == ids
+
+    backward = [ids[-1]]
+    while True:
+        step = _ids(client.get(f"/clips/{backward[-1]}/prev"))
+        if not step:
+            break
+        backward.extend(step)
+    assert backward == ids[::-1]
+
+
+def test_cursors_continue_the_listing(client, ids) -> None:
+    nxt = client.get(f"/clips/{ids[0]}/next", params={"limit": 2}).json()
+    rest = client.get("/clips", params={"cursor": nxt["next_cursor"]}).json()
+    assert [c["id"] for c in rest["items"]] == ids[3:]
+
+    prev = client.get(f"/clips/{ids[3]}/prev", params={"limit": 2}).json()
+    rest = client.get("/clips", params={"cursor": prev["next_cursor"]}).json()
+    assert [c["id"] for c in rest["items"]] == ids[3:]
+
+    # Nothing on the far side of either end.
+    last = client.get(f"/clips/{ids[-1]}/next").json()
+    first = client.get(f"/clips/{ids[0]}/prev").json()
+    assert last == first == {"items": [], "next_cursor": None}
+
+
+def test_items_use_the_clip_representation(client, ids) -> None:
+    item = client.get(f"/clips/{ids[0]}/next").json()["items"][0]
+    assert item == client.get(f"/clips/{ids[1]}").json()
+
+
+def test_unknown_clip_and_bad_limit(client, ids) -> None:
+    assert client.get("/clips/clp_missing/next").status_code == 404
+    assert client.get("/clips/clp_missing/prev").status_code == 404
+    assert client.get(f"/clips/{ids[0]}/next", params={"limit": 0}).status_code == 400
+    assert client.get(f"/clips/{ids[0]}/prev", params={"limit": "x"}).status_code == 400
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+@pytest.mark.parametrize("direction", ["next", "prev"])
+def test_each_hop_is_one_index_seek(client, direction: str, ids) -> None:
+    with CaptureQueriesContext(connection) as ctx:
+        client.get(f"/clips/{ids[2]}/{direction}")
+    seek_sql = ctx.captured_queries[-1]["sql"]
+    with connection.cursor() as cur:
+        cur.execute(f"EXPLAIN QUERY PLAN {seek_sql}")
+        plan = " ".join(str(row) for row in cur.fetchall())
+    assert "clip_chrono_idx" in plan
+    assert "TEMP B-TREE" not in plan
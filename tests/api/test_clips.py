@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from django.db import connection
+
+
+def _video_id(n: int) -> str:
+    return f"vid{n:08d}"
+
+
+def test_list_clips_orders_by_performance_date_and_pages_with_cursor(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+    dates = ["1994-06-01", "1971-03-12", "1994-06-01", "2001-09-30", "1971-03-12"]
+    for n, d in enumerate(dates):
+        assert submit(contributor_id, _video_id(n), d).status_code == 201
+
+    seen: List[dict] = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/clips", params=params)
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        assert len(data["items"]) <= 2
+        seen.extend(data["items"])
+        pages += 1
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len({c["id"] for c in seen}) == len(dates)
+    keys = [(c["performance_date"], c["created_at"]) for c in seen]
+    assert keys == sorted(keys)
+
+    first = seen[0]
+    assert first["youtube_url"] == f"https://www.youtube.com/watch?v={first['youtube_video_id']}"
+    assert first["created_by_contributor_id"] == contributor_id
+    assert first["added_via_submission_id"].startswith("sub_")
+
+
+def test_list_clips_filters_inclusive_date_range(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    for n, d in enumerate(["1969-08-15", "1969-08-16", "1969-08-17", "1969-08-18"]):
+        assert submit(contributor_id, _video_id(n), d).status_code == 201
+
+    resp = client.get("/clips", params={"from": "1969-08-16", "to": "1969-08-17"})
+    assert resp.status_code == 200, resp.text
+    data = resp.json()
+    assert [c["performance_date"] for c in data["items"]] == ["1969-08-16", "1969-08-17"]
+    assert data["next_cursor"] is None
+
+
+def test_list_clips_rejects_bad_parameters(client) -> None:
+    assert client.get("/clips", params={"limit": 0}).status_code == 400
+    assert client.get("/clips", params={"limit": 201}).status_code == 400
+    assert client.get("/clips", params={"from": "1994-13-01"}).status_code == 400
+    assert client.get("/clips", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+def test_list_clips_seek_uses_chronological_index(client) -> None:
+    from archive.api.pagination import Cursor, seek_after
+    from archive.models import Clip
+    from datetime import date, datetime, timezone
+
+    cursor = Cursor(date(1994, 6, 1), datetime(2024, 1, 1, tzinfo=timezone.utc), 1)
+    qs = seek_after(Clip.objects.all(), cursor).order_by(
+        "performance_date", "created_at", "id"
+    )[:51]
+    sql, params = qs.query.sql_with_params()
+    with connection.cursor() as cur:
+        cur.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        plan = " ".join(str(row) for row in cur.fetchall())
+
+    assert "clip_chrono_idx" in plan
+    assert "TEMP B-TREE" not in plan
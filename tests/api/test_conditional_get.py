@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def _get(client, path: str, params=None, etag=None):
+    headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+    return client._c.get(path, data=params or {}, **headers)
+
+
+def test_listing_returns_304_until_range_changes(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    submit(contributor_id, "aaaaaaaaaaa", "1994-06-01")
+    params = {"from": "1994-01-01", "to": "1994-12-31"}
+
+    first = _get(client, "/clips", params)
+    assert first.status_code == 200
+    etag = first["ETag"]
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = _get(client, "/clips", params, etag)
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert len(ctx.captured_queries) == 1
+
+    # A clip outside the range leaves the validator unchanged...
+    submit(contributor_id, "bbbbbbbbbbb", "2001-01-01")
+    assert _get(client, "/clips", params, etag).status_code == 304
+
+    # ...one inside it does not.
+    submit(contributor_id, "ccccccccccc", "1994-07-01")
+    resp = _get(client, "/clips", params, etag)
+    assert resp.status_code == 200
+    assert resp["ETag"] != etag
+
+
+def test_unbounded_listing_follows_the_archive_version(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+    submit(contributor_id, "aaaaaaaaaaa", "1994-06-01")
+    etag = _get(client, "/clips")["ETag"]
+
+    # Revalidating reads the archive version only, never the Clip table.
+    with CaptureQueriesContext(connection) as ctx:
+        assert _get(client, "/clips", etag=etag).status_code == 304
+    assert len(ctx.captured_queries) == 1
+    assert "archive_archiveversion" in ctx.captured_queries[0]["sql"]
+
+    submit(contributor_id, "bbbbbbbbbbb", "2001-01-01")
+    assert _get(client, "/clips", etag=etag).status_code == 200
+
+
+def test_different_pages_have_different_etags(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    for n in range(3):
+        submit(contributor_id, f"pg{n:09d}", "1994-06-01")
+    first = _get(client, "/clips", {"limit": 1})
+    second = _get(client, "/clips", {"limit": 1, "cursor": first.data["next_cursor"]})
+    assert first["ETag"] != second["ETag"]
+
+
+def test_calendar_and_clip_detail_support_conditional_get(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+    clip_id = submit(contributor_id, "aaaaaaaaaaa", "1994-06-01").json()["clip_id"]
+
+    cal = _get(client, "/calendar", {"year": 1994})
+    assert _get(client, "/calendar", {"year": 1994}, cal["ETag"]).status_code == 304
+    assert "ETag" not in _get(client, "/calendar", {"year": "x"})
+
+    detail = _get(client, f"/clips/{clip_id}")
+    assert _get(client, f"/clips/{clip_id}", etag=detail["ETag"]).status_code == 304
+    assert _get(client, "/clips/clp_missing").status_code == 404
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+def test_range_validator_is_index_only(db) -> None:
+    from datetime import date
+
+    from archive.api.conditional import clip_range_validator
+
+    with CaptureQueriesContext(connection) as ctx:
+        clip_range_validator(date(1994, 1, 1), date(1994, 12, 31))
+    sql = ctx.captured_queries[-1]["sql"]
+    with connection.cursor() as cur:
+        cur.execute(f"EXPLAIN QUERY PLAN {sql}")
+        plan = " ".join(str(row) for row in cur.fetchall())
+    assert "COVERING INDEX clip_chrono_idx" in plan
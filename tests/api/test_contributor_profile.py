@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from archive.contributors import diff_counts
+from archive.models import Contributor
+
+
+def _clip_dates(client, contributor_id: str, **params) -> List[str]:
+    dates: List[str] = []
+    cursor = None
+    while True:
+        page_params = {**params, "cursor": cursor} if cursor else params
+        resp = client.get(f"/contributors/{contributor_id}/clips", params=page_params)
+        assert resp.status_code == 200, resp.text
+        dates.extend(c["performance_date"] for c in resp.json()["items"])
+        cursor = resp.json()["next_cursor"]
+        if cursor is None:
+            return dates
+
+
+def test_profile_representation(client) -> None:
+    resp = client.post("/contributors", json={"display_name": "Taper", "external_id": "t-1"})
+    created = resp.json()
+
+    profile = client.get(f"/contributors/{created['id']}").json()
+    assert profile == {
+        **created,
+        "submission_count": 0,
+        "accepted_submission_count": 0,
+        "rejected_submission_count": 0,
+        "clip_count": 0,
+    }
+
+
+def test_counters_follow_every_submission_outcome(
+    client, create_contributor, submit, submission_item, contributor_counters
+) -> None:
+    alice = create_contributor("Alice")
+    bob = create_contributor("Bob")
+
+    assert submit(alice, "aaaaaaaaaaa", "1977-05-08").status_code == 201
+    # Invalid input, then a duplicate the filter knows about.
+    assert submit(alice, "bbbbbbbbbbb", "1977-02-30").json()["status"] == "rejected"
+    assert submit(bob, "aaaaaaaaaaa", "1977-05-08").status_code == 409
+    resp = client.post(
+        "/submissions:batch",
+        json=[
+            submission_item(bob, "ccccccccccc", "1980-01-01"),
+            submission_item(bob, "ddddddddddd", "1981-01-01"),
+            submission_item(alice, "ccccccccccc", "1980-01-01"),
+            submission_item(alice, "eeeeeeeeeee", "1980-13-01"),
+        ],
+    )
+    assert resp.status_code == 201, resp.text
+
+    assert contributor_counters(alice) == (4, 1, 3, 1)
+    assert contributor_counters(bob) == (3, 2, 1, 2)
+    assert diff_counts() == {}
+
+
+def test_repair_command_detects_and_fixes_drift(
+    create_contributor, submit, contributor_counters
+) -> None:
+    contributor_id = create_contributor()
+    submit(contributor_id, "aaaaaaaaaaa", "1977-05-08")
+    Contributor.objects.filter(public_id=contributor_id).update(clip_count=7)
+
+    with pytest.raises(CommandError, match="1 contributor"):
+        call_command("rebuild_contributor_counts", "--check")
+    assert contributor_counters(contributor_id)[3] == 7
+
+    call_command("rebuild_contributor_counts", "--chunk-size", "1")
+    assert contributor_counters(contributor_id) == (1, 1, 0, 1)
+    call_command("rebuild_contributor_counts", "--check")
+
+
+def test_clips_are_listed_chronologically_per_contributor(
+    client, create_contributor, submit
+) -> None:
+    alice = create_contributor("Alice")
+    bob = create_contributor("Bob")
+    for n, d in enumerate(["1994-06-01", "1971-03-12", "2001-09-30", "1971-03-12"]):
+        assert submit(alice, f"alc{n:08d}", d).status_code == 201
+    assert submit(bob, "bob00000000", "1980-01-01").status_code == 201
+
+    assert _clip_dates(client, alice, limit=1) == [
+        "1971-03-12",
+        "1971-03-12",
+        "1994-06-01",
+        "2001-09-30",
+    ]
+    assert _clip_dates(client, bob) == ["1980-01-01"]
+    assert _clip_dates(client, create_contributor("Nobody")) == []
+
+    # Items use the clip representation.
+    item = client.get(f"/contributors/{bob}/clips").json()["items"][0]
+    assert item == client.get(f"/clips/{item['id']}").json()
+
+
+def test_unknown_contributor_and_bad_parameters(client, create_contributor) -> None:
+    contributor_id = create_contributor()
+
+    assert client.get("/contributors/ctr_missing").status_code == 404
+    assert client.get("/contributors/ctr_missing/clips").status_code == 404
+    for params in ({"cursor": "!!"}, {"limit": 0}):
+        resp = client.get(f"/contributors/{contributor_id}/clips", params=params)
+        assert resp.status_code == 400
+        assert "detail" in resp.json()
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+def test_clip_pages_are_index_seeks(client, create_contributor) -> None:
+    contributor_id = create_contributor()
+
+    with CaptureQueriesContext(connection) as ctx:
+        client.get(f"/contributors/{contributor_id}/clips")
+    page_sql = ctx.captured_queries[-1]["sql"]
+    with connection.cursor() as cur:
+        cur.execute(f"EXPLAIN QUERY PLAN {page_sql}")
+        plan = " ".join(str(row) for row in cur.fetchall())
+    assert "clip_contributor_chrono_idx" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from archive.duplicates import BloomFilter, duplicate_filter
+from archive.models import Clip, Contributor
+
+
+def _random_key(rng: random.Random):
+    video_id = "".join(rng.choices("abcdefghijklmnopqrstuvwxyz0123456789-_", k=11))
+    return video_id, date(1960, 1, 1) + timedelta(days=rng.randrange(25000))
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives() -> None:
+    rng = random.Random(3)
+    bloom = BloomFilter(capacity=20_000, error_rate=0.01)
+    added = [_random_key(rng) for _ in range(20_000)]
+    for key in added:
+        bloom.add(key)
+
+    assert all(key in bloom for key in added)
+    false_positives = sum(_random_key(rng) in bloom for _ in range(20_000))
+    assert false_positives / 20_000 < 0.02
+
+
+def test_known_duplicate_skips_the_write_transaction(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").status_code == 201
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = submit(contributor_id, "aaaaaaaaaaa", "1977-05-08")
+    assert resp.status_code == 409
+    assert resp.json()["status"] == "rejected"
+    assert resp.json()["clip_id"] is None
+    sql = [q["sql"].upper() for q in ctx.captured_queries]
+    # Only the rejected submission and its counter are written; the clip
+    # insert (and its conflict) is never attempted.
+    assert not any(s.startswith('INSERT INTO "ARCHIVE_CLIP"') for s in sql), sql
+    writes = [s.split()[0] for s in sql if s.startswith(("INSERT", "UPDATE"))]
+    assert writes == ["INSERT", "UPDATE"], sql
+
+
+def test_batch_skips_lookup_for_new_pairs_and_recovers_from_a_stale_filter(
+    client, create_contributor, submission_item
+) -> None:
+    contributor_id = create_contributor()
+
+    with CaptureQueriesContext(connection) as ctx:
+        resp = client.post(
+            "/submissions:batch",
+            json=[submission_item(contributor_id, f"new{i:08d}", "1980-01-01") for i in range(5)],
+        )
+    assert resp.status_code == 201
+    clip_selects = [
+        q for q in ctx.captured_queries
+        if q["sql"].upper().startswith("SELECT") and 'FROM "ARCHIVE_CLIP"' in q["sql"].upper()
+    ]
+    assert clip_selects == []
+
+    # Another process created a clip this process has not seen yet.
+    duplicate_filter.clear()
+    resp = client.post(
+        "/submissions:batch",
+        json=[
+            submission_item(contributor_id, "new00000000", "1980-01-01"),
+            submission_item(contributor_id, "fresh000000", "1980-01-01"),
+        ],
+    )
+    assert resp.status_code == 201
+    assert [r["status"] for r in resp.json()["items"]] == ["rejected", "accepted"]
+    assert Clip.objects.count() == 6
+
+
+@pytest.mark.django_db(transaction=True)
+def test_sync_and_reconcile_follow_the_clip_table() -> None:
+    contributor = Contributor.objects.create(display_name="Other process")
+    key = ("zzzzzzzzzzz", date(1985, 3, 3))
+    assert not duplicate_filter.might_exist(key)
+
+    Clip.objects.create(
+        contributor=contributor,
+        youtube_video_id=key[0],
+        raw_youtube_input=f"https://youtu.be/{key[0]}",
+        performance_date=key[1],
+    )
+    assert not duplicate_filter.might_exist(key)
+    assert duplicate_filter.sync() == 1
+    assert duplicate_filter.might_exist(key)
+
+    duplicate_filter.clear()
+    duplicate_filter.reconcile()
+    assert duplicate_filter.might_exist(key)
+
+    # A reset filter is rebuilt from the table in the background, and every
+    # pair may exist until it is ready.
+    other = ("yyyyyyyyyyy", date(1985, 3, 3))
+    duplicate_filter.reset()
+    assert duplicate_filter.might_exist(other)
+    duplicate_filter.join()
+    assert duplicate_filter.might_exist(key)
+    assert not duplicate_filter.might_exist(other)
+
+
+def test_disabled_filter_always_checks_the_database(
+    settings, create_contributor, submit
+) -> None:
+    settings.ARCHIVE_DUPLICATE_FILTER = False
+    assert duplicate_filter.might_exist(("aaaaaaaaaaa", date(1977, 5, 8)))
+
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").status_code == 201
+    with CaptureQueriesContext(connection) as ctx:
+        assert submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").status_code == 409
+    # No separate existence check: the conflict-aware insert detects it.
+    clip_selects = [
+        q for q in ctx.captured_queries
+        if q["sql"].upper().startswith("SELECT") and 'FROM "ARCHIVE_CLIP"' in q["sql"].upper()
+    ]
+    assert clip_selects == []
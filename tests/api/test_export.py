@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+
+import pytest
+
+
+@pytest.fixture
+def contributor_id(create_contributor, submit) -> str:
+    contributor_id = create_contributor()
+    for n, d in enumerate(["1994-06-01", "1971-03-12", "2001-09-30"]):
+        resp = submit(contributor_id, f"https://youtu.be/exp{n:08d}", d, title=f"Show, part {n}")
+        assert resp.json()["status"] == "accepted"
+    return contributor_id
+
+
+def _stream(client, params) -> tuple:
+    resp = client._c.get("/clips/export", data=params)
+    assert resp.status_code == 200
+    assert resp.streaming
+    return resp, b"".join(resp.streaming_content).decode("utf-8")
+
+
+def test_export_ndjson_in_performance_date_order(client, contributor_id) -> None:
+    resp, body = _stream(client, {})
+    assert resp["Content-Type"] == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in body.splitlines()]
+    assert [r["performance_date"] for r in rows] == ["1971-03-12", "1994-06-01", "2001-09-30"]
+    assert all(r["created_by_contributor_id"] == contributor_id for r in rows)
+    assert all(r["added_via_submission_id"].startswith("sub_") for r in rows)
+    assert "submission_raw_date_input" not in rows[0]
+
+    # Same representation as GET /clips/{id}.
+    assert client.get(f"/clips/{rows[0]['id']}").json() == rows[0]
+
+
+def test_export_csv_with_bounds_and_submission(client, contributor_id) -> None:
+    _, body = _stream(
+        client,
+        {"format": "csv", "from": "1990-01-01", "to": "1999-12-31", "include": "submission"},
+    )
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert len(rows) == 1
+    assert rows[0]["performance_date"] == "1994-06-01"
+    assert rows[0]["title"] == "Show, part 0"
+    assert rows[0]["submission_raw_date_input"] == "1994-06-01"
+
+
+def test_export_rejects_bad_parameters(client) -> None:
+    assert client._c.get("/clips/export", data={"format": "xml"}).status_code == 400
+    assert client._c.get("/clips/export", data={"from": "nope"}).status_code == 400
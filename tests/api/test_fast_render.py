@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+
+from archive.api import renderers
+from archive.api.renderers import FastJSONRenderer
+from archive.formatting import dt_to_z, format_date
+
+UTC = timezone.utc
+
+PAYLOADS = [
+    {},
+    [],
+    {"detail": "Clip not found"},
+    {"detail": [ErrorDetail("This field is required.", code="required")]},
+    {"title": "Café \U0001f3b8 \u2028line\u2029 \"quoted\" \\ \t\n\x00\x1f\x7f"},
+    {"id": uuid.UUID("12345678-1234-5678-1234-567812345678"), "n": Decimal("1.50")},
+    {"big": 2**70, "neg": -(2**63), "flags": [True, False, None]},
+    {1: "non-string key"},
+    {
+        "at": datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+        "naive": datetime(2024, 1, 2, 3, 4, 5),
+        "day": date(1977, 5, 8),
+        "time": time(1, 2, 3, 4000),
+        "delta": timedelta(seconds=5),
+    },
+]
+
+
+@pytest.mark.parametrize("data", PAYLOADS, ids=range(len(PAYLOADS)))
+def test_renders_the_same_bytes_as_the_stock_renderer(data) -> None:
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_none_and_indented_output_match_the_stock_renderer() -> None:
+    data = {"items": [{"a": 1}]}
+    indented = "application/json; indent=2"
+    assert FastJSONRenderer().render(None) == b""
+    assert FastJSONRenderer().render(data, indented, {}) == JSONRenderer().render(
+        data, indented, {}
+    )
+
+
+def test_falls_back_to_the_stock_renderer_without_orjson(monkeypatch) -> None:
+    monkeypatch.setattr(renderers, "orjson", None)
+    for data in PAYLOADS:
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize(
+    "dt",
+    [
+        datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=UTC),
+        datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+        datetime(2024, 1, 2, 3, 4, 5, 10, tzinfo=timezone(timedelta(hours=2))),
+    ],
+)
+def test_timestamp_formatting_matches_isoformat(dt: datetime) -> None:
+    assert dt_to_z(dt) == dt.astimezone(UTC).isoformat().replace("+00:00", "Z")
+    assert format_date(dt.date()) == dt.date().isoformat()
+
+
+def test_clip_responses_are_byte_compatible(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor("Rénderer")
+    for i, title in enumerate(["Café \u2028 show", "tab\there", None]):
+        resp = submit(
+            contributor_id,
+            f"https://youtu.be/{'abcdefghij'[i] * 11}",
+            f"1977-05-0{i + 1}",
+            title=title,
+            notes="\U0001f3b6" if title else None,
+        )
+        assert resp.status_code == 201, resp.text
+
+    listing = client._c.get("/clips", {"limit": 2})
+    assert listing.status_code == 200
+    assert listing.content == JSONRenderer().render(listing.json())
+    assert listing.json()["next_cursor"]
+
+    clip_id = listing.json()["items"][0]["id"]
+    detail = client._c.get(f"/clips/{clip_id}")
+    assert detail.status_code == 200
+    assert detail.content == JSONRenderer().render(detail.json())
+    assert detail.json() == listing.json()["items"][0]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import re
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from django.urls import resolve
+
+from archive.api import async_views
+from archive.metrics import RequestMetricsMiddleware, registry
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    registry.reset()
+    yield
+    registry.reset()
+
+
+def _timings(header: str) -> dict:
+    """Parse a Server-Timing header into {name: (dur_ms, desc)}."""
+    out = {}
+    for entry in header.split(", "):
+        name, *params = entry.split(";")
+        fields = dict(p.split("=", 1) for p in params)
+        out[name] = (float(fields["dur"]), fields.get("desc", "").strip('"'))
+    return out
+
+
+def _sample(body: str, metric: str, **labels: str) -> float:
+    label_re = ",".join(f'{k}="{re.escape(v)}"' for k, v in labels.items())
+    m = re.search(rf"^{metric}\{{{label_re}\}} (\S+)$", body, re.MULTILINE)
+    assert m, f"{metric} {labels} not in /metrics"
+    return float(m.group(1))
+
+
+def test_submission_server_timing_breaks_down_the_request(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    resp = submit(contributor_id, "https://youtu.be/aaaaaaaaaaa", "1994-06-01")
+    assert resp.status_code == 201
+
+    timings = _timings(resp.headers["Server-Timing"])
+    assert set(timings) == {"total", "db", "validate", "write", "render"}
+    assert int(timings["db"][1].split()[0]) >= 3
+    assert timings["total"][0] >= timings["write"][0] + timings["validate"][0]
+
+
+def test_metrics_endpoint_reports_histograms_per_endpoint(client) -> None:
+    for _ in range(3):
+        assert client.get("/clips").status_code == 200
+    assert client.get("/clips/clp_missing").status_code == 404
+
+    resp = client._c.get("/metrics")
+    assert resp.status_code == 200
+    assert resp["Content-Type"].startswith("text/plain; version=0.0.4")
+    body = resp.content.decode()
+
+    assert "# TYPE archive_request_duration_seconds histogram" in body
+    listing = {"endpoint": "/clips", "method": "GET", "status": "200"}
+    assert _sample(body, "archive_request_duration_seconds_count", **listing) == 3
+    assert _sample(
+        body, "archive_request_duration_seconds_bucket", **listing, le="+Inf"
+    ) == 3
+    assert _sample(body, "archive_db_queries_count", **listing) == 3
+    assert _sample(body, "archive_render_duration_seconds_count", **listing) == 3
+    assert _sample(
+        body,
+        "archive_request_duration_seconds_count",
+        endpoint="/clips/<str:clip_id>",
+        method="GET",
+        status="404",
+    ) == 1
+    # Scrapes are not measured themselves.
+    assert 'endpoint="/metrics"' not in body
+
+
+def test_metrics_merge_worker_files(client, settings, tmp_path) -> None:
+    settings.ARCHIVE_METRICS_DIR = str(tmp_path)
+    settings.ARCHIVE_METRICS_FLUSH_SECONDS = 0
+
+    assert client.get("/clips").status_code == 200
+    (own_file,) = tmp_path.glob("*.json")
+    document = json.loads(own_file.read_text())
+    assert document["archive_request_duration_seconds"][0][0] == ["/clips", "GET", "200"]
+
+    # Another worker process wrote the same series.
+    other = tmp_path / "99999-deadbeef.json"
+    other.write_text(own_file.read_text())
+
+    body = client._c.get("/metrics").content.decode()
+    listing = {"endpoint": "/clips", "method": "GET", "status": "200"}
+    assert _sample(body, "archive_request_duration_seconds_count", **listing) == 2
+
+
+def test_async_views_are_measured_without_adapting(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    clip_id = submit(contributor_id, "https://youtu.be/bbbbbbbbbbb", "1971-03-12").json()["clip_id"]
+
+    async def get_response(request):
+        return await async_views.get_clip(request, clip_id)
+
+    middleware = RequestMetricsMiddleware(get_response)
+    request = RequestFactory().get(f"/clips/{clip_id}")
+    request.resolver_match = resolve(f"/clips/{clip_id}")
+    resp = async_to_sync(middleware)(request)
+
+    assert resp.status_code == 200
+    timings = _timings(resp["Server-Timing"])
+    # ETag lookup, cache version and the clip itself, issued from ORM threads.
+    assert int(timings["db"][1].split()[0]) >= 2
+    assert "render" in timings
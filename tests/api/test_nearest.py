@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+@pytest.fixture
+def populated(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    dates = ["1965-03-01", "1965-03-01", "1965-03-21", "1972-07-04"]
+    for n, d in enumerate(dates):
+        resp = submit(contributor_id, f"nst{n:08d}", d)
+        assert resp.status_code == 201, resp.text
+
+
+def _nearest(client, **params) -> dict:
+    resp = client.get("/clips/nearest", params=params)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+@pytest.mark.parametrize(
+    "target,direction,expected",
+    [
+        ("1965-03-01", "either", "1965-03-01"),
+        ("1965-03-01", "before", "1965-03-01"),
+        ("1965-03-01", "after", "1965-03-01"),
+        ("1965-03-08", "either", "1965-03-01"),
+        ("1965-03-15", "either", "1965-03-21"),
+        ("1965-03-11", "either", "1965-03-01"),  # tie: the earlier date
+        ("1965-03-15", "before", "1965-03-01"),
+        ("1965-03-02", "after", "1965-03-21"),
+        ("1950-01-01", "either", "1965-03-01"),
+        ("1999-12-31", "either", "1972-07-04"),
+        ("1950-01-01", "before", None),
+        ("1999-12-31", "after", None),
+    ],
+)
+def test_finds_the_closest_populated_date(
+    client, target, direction, expected, populated
+) -> None:
+    data = _nearest(client, date=target, direction=direction)
+    assert data["date"] == expected
+    assert {c["performance_date"] for c in data["items"]} == ({expected} if expected else set())
+
+
+def test_returns_the_dates_clips_with_a_listing_cursor(client, populated) -> None:
+    data = _nearest(client, date="1964-12-25", limit=1)
+    assert data["date"] == "1965-03-01"
+    listing = client.get("/clips", params={"from": "1965-03-01", "to": "1965-03-01"}).json()
+    assert data["items"] == listing["items"][:1]
+
+    rest = client.get(
+        "/clips",
+        params={"from": "1965-03-01", "to": "1965-03-01", "cursor": data["next_cursor"]},
+    ).json()
+    assert data["items"] + rest["items"] == listing["items"]
+    assert _nearest(client, date="1964-12-25")["next_cursor"] is None
+
+
+def test_empty_archive(client) -> None:
+    assert _nearest(client, date="1977-05-08") == {"date": None, "items": [], "next_cursor": None}
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"date": "1977-02-30"}, {"date": "1977-05-08", "direction": "sideways"}],
+)
+def test_rejects_invalid_parameters(client, params) -> None:
+    resp = client.get("/clips/nearest", params=params)
+    assert resp.status_code == 400
+    assert "detail" in resp.json()
+
+
+def test_at_most_two_date_seeks(client, populated) -> None:
+    with CaptureQueriesContext(connection) as ctx:
+        _nearest(client, date="1968-01-01")
+    seeks = [
+        q["sql"]
+        for q in ctx.captured_queries
+        if q["sql"].startswith('SELECT "archive_clip"."performance_date"')
+    ]
+    assert len(seeks) == 2
+    assert all("LIMIT 1" in sql for sql in seeks)
+
+    if connection.vendor == "sqlite":
+        for sql in seeks:
+            with connection.cursor() as cur:
+                cur.execute(f"EXPLAIN QUERY PLAN {sql}")
+                plan = " ".join(str(row) for row in cur.fetchall())
+            assert "COVERING INDEX clip_chrono_idx" in plan
+            assert "TEMP B-TREE" not in plan
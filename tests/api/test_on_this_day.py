@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from archive.models import Clip
+
+
+def _walk(client, params: dict) -> List[dict]:
+    items: List[dict] = []
+    cursor = None
+    while True:
+        page_params = {**params, "cursor": cursor} if cursor else params
+        resp = client.get("/clips/on-this-day", params=page_params)
+        assert resp.status_code == 200, resp.text
+        items.extend(resp.json()["items"])
+        cursor = resp.json()["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_returns_the_day_in_every_year_in_chronological_order(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+    dates = ["1994-05-08", "1977-05-08", "1977-05-09", "1985-05-08", "1977-05-08", "1977-08-05"]
+    for n, d in enumerate(dates):
+        assert submit(contributor_id, f"otd{n:08d}", d).status_code == 201
+
+    items = _walk(client, {"month": "05", "day": "08", "limit": 2})
+
+    assert [c["performance_date"] for c in items] == [
+        "1977-05-08",
+        "1977-05-08",
+        "1985-05-08",
+        "1994-05-08",
+    ]
+    first, second = items[:2]
+    assert (first["created_at"], first["id"]) < (second["created_at"], second["id"])
+    assert [c["performance_date"] for c in _walk(client, {"month": 5, "day": 9})] == [
+        "1977-05-09"
+    ]
+
+
+def test_page_matches_the_listing_representation(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "aaaaaaaaaaa", "1977-05-08").status_code == 201
+
+    day = client.get("/clips/on-this-day", params={"month": 5, "day": 8}).json()
+    listing = client.get("/clips").json()
+    assert day == listing
+
+
+def test_february_29th_is_a_valid_day(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "bbbbbbbbbbb", "1980-02-29").status_code == 201
+
+    items = _walk(client, {"month": 2, "day": 29})
+    assert [c["performance_date"] for c in items] == ["1980-02-29"]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {},
+        {"month": 5},
+        {"month": 2, "day": 30},
+        {"month": 13, "day": 1},
+        {"month": "may", "day": 8},
+    ],
+)
+def test_rejects_invalid_days(client, params) -> None:
+    resp = client.get("/clips/on-this-day", params=params)
+    assert resp.status_code == 400
+    assert "detail" in resp.json()
+
+
+def test_rejects_invalid_cursor_and_limit(client) -> None:
+    for params in ({"cursor": "!!"}, {"limit": 0}):
+        resp = client.get("/clips/on-this-day", params={"month": 5, "day": 8, **params})
+        assert resp.status_code == 400
+
+
+def test_month_and_day_are_stored_by_every_write_path(
+    client, create_contributor, submit, submission_item
+) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "ccccccccccc", "1971-12-31").status_code == 201
+    resp = client.post(
+        "/submissions:batch",
+        json={"items": [submission_item(contributor_id, "ddddddddddd", "1972-01-02")]},
+    )
+    assert resp.status_code == 201, resp.text
+
+    rows = Clip.objects.order_by("performance_date").values_list(
+        "performance_month", "performance_day"
+    )
+    assert list(rows) == [(12, 31), (1, 2)]
+
+
+def test_conditional_get_follows_the_day(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "eeeeeeeeeee", "1977-05-08").status_code == 201
+
+    params = {"month": 5, "day": 8}
+    etag = client._c.get("/clips/on-this-day", params)["ETag"]
+
+    def revalidate() -> int:
+        return client._c.get("/clips/on-this-day", params, HTTP_IF_NONE_MATCH=etag).status_code
+
+    assert revalidate() == 304
+    # Another day: still fresh.
+    assert submit(contributor_id, "fffffffffff", "1990-06-01").status_code == 201
+    assert revalidate() == 304
+    assert submit(contributor_id, "ggggggggggg", "1990-05-08").status_code == 201
+    assert revalidate() == 200
+
+
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plan")
+def test_pages_are_index_seeks(client) -> None:
+    with CaptureQueriesContext(connection) as ctx:
+        client.get("/clips/on-this-day", params={"month": 5, "day": 8})
+    page_sql = ctx.captured_queries[-1]["sql"]
+    with connection.cursor() as cur:
+        cur.execute(f"EXPLAIN QUERY PLAN {page_sql}")
+        plan = " ".join(str(row) for row in cur.fetchall())
+    assert "clip_month_day_idx" in plan
+    assert "TEMP B-TREE" not in plan
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from archive.ratelimit import MAX_DEBT_SECONDS, MemoryStore, RateLimiter, SharedMemoryStore
+
+
+def test_contributor_bucket_returns_429_with_retry_after(
+    settings, create_contributor, submit
+) -> None:
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": (0.5, 3), "ip": None}
+    alice = create_contributor("Alice")
+    bob = create_contributor("Bob")
+
+    assert [submit(alice, f"rl{n:09d}").status_code for n in range(3)] == [201, 201, 201]
+    resp = submit(alice, "rl000000003")
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+    assert "throttled" in resp.json()["detail"]
+    assert submit(bob, "rl000000004").status_code == 201
+
+
+def test_ip_bucket_is_shared_by_contributors(settings, create_contributor, submit) -> None:
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": None, "ip": (1.0, 2)}
+    ids = [create_contributor(f"C{n}") for n in range(3)]
+
+    assert submit(ids[0], "rl000000000").status_code == 201
+    assert submit(ids[1], "rl000000001").status_code == 201
+    assert submit(ids[2], "rl000000002").status_code == 429
+    assert submit(ids[2], "rl000000002", extra={"REMOTE_ADDR": "10.0.0.2"}).status_code == 201
+
+
+def test_rejected_before_any_database_work(settings, create_contributor, submit) -> None:
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": (1.0, 1), "ip": (1.0, 100)}
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "rl000000000").status_code == 201
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert submit(contributor_id, "rl000000001").status_code == 429
+    assert ctx.captured_queries == []
+
+
+def test_disabled_and_other_endpoints_unaffected(
+    client, settings, create_contributor, submit
+) -> None:
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": (1.0, 1), "ip": (1.0, 1)}
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "rl000000000").status_code == 201
+    assert client.get("/clips").status_code == 200
+
+    settings.ARCHIVE_RATE_LIMIT = False
+    assert submit(contributor_id, "rl000000001").status_code == 201
+
+
+def test_shared_file_limits_across_processes(
+    settings, tmp_path, create_contributor, submit
+) -> None:
+    settings.ARCHIVE_RATE_LIMIT_FILE = str(tmp_path / "buckets")
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": (1.0, 2), "ip": None}
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "rl000000000").status_code == 201
+    assert submit(contributor_id, "rl000000001").status_code == 201
+
+    # Another worker maps the same file and sees the drained bucket.
+    other = SharedMemoryStore(settings.ARCHIVE_RATE_LIMIT_FILE)
+    _, tat = other.load(f"ctr:{contributor_id}", 0.0)
+    assert tat > 0
+    other.close()
+
+
+def test_batch_costs_one_token_per_item(
+    client, settings, create_contributor, submission_item
+) -> None:
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": (0.5, 5), "ip": (1.0, 8)}
+    alice = create_contributor("Alice")
+    bob = create_contributor("Bob")
+
+    def batch(*items: tuple):
+        return client.post(
+            "/submissions:batch",
+            json=[submission_item(c, v) for c, v in items],
+        )
+
+    resp = batch(*[(alice, f"rlbatch{n:04d}") for n in range(4)], (bob, "rlbatch9000"))
+    assert resp.status_code == 201, resp.text
+    # Alice has one token left, so two more of hers are refused as a whole...
+    resp = batch((alice, "rlbatch0004"), (alice, "rlbatch0005"))
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "2"
+    # ...while the shared IP bucket still admits three more items.
+    resp = batch((alice, "rlbatch0004"), (bob, "rlbatch9001"), (bob, "rlbatch9002"))
+    assert resp.status_code == 201
+    assert batch((bob, "rlbatch9003")).status_code == 429
+
+
+def test_batch_larger_than_the_burst_is_charged_in_full(
+    client, settings, create_contributor, submit, submission_item
+) -> None:
+    settings.ARCHIVE_SUBMISSION_RATE_LIMITS = {"contributor": (1.0, 3), "ip": None}
+    alice = create_contributor("Alice")
+    items = [submission_item(alice, f"rldebt{n:05d}") for n in range(20)]
+    assert client.post("/submissions:batch", json=items).status_code == 201
+
+    # 20 tokens from a full bucket of 3 at 1/s: the next one is 18 s away.
+    resp = submit(alice, "rldebt99999")
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "18"
+
+
+@pytest.mark.parametrize("store", ["memory", "shared"])
+def test_token_bucket_semantics(store, tmp_path) -> None:
+    limiter = RateLimiter(
+        MemoryStore() if store == "memory" else SharedMemoryStore(str(tmp_path / "b"), slots=64)
+    )
+    a = [("a", 2.0, 3)]
+    both = [("a", 2.0, 3), ("b", 2.0, 1)]
+
+    assert [limiter.acquire(a, 100.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire(a, 100.0) == pytest.approx(0.5)
+    assert limiter.acquire(a, 100.25) == pytest.approx(0.25)
+    assert limiter.acquire(a, 100.5) == 0.0  # one token refilled
+    assert limiter.acquire(a, 100.5) > 0
+    assert limiter.acquire(a, 102.0) == 0.0
+
+    # All or nothing: a rejection by one bucket takes no token from the other.
+    assert limiter.acquire(both, 200.0) == 0.0
+    assert limiter.acquire(both, 200.0) == pytest.approx(0.5)
+    assert limiter.acquire([("a", 2.0, 3)], 200.0) == 0.0
+    assert limiter.acquire([("a", 2.0, 3)], 200.0) == 0.0
+
+    # Weighted requests take several tokens.
+    assert limiter.acquire([("c", 2.0, 3)], 300.0, costs=[2]) == 0.0
+    assert limiter.acquire([("c", 2.0, 3)], 300.0, costs=[2]) == pytest.approx(0.5)
+
+    # A cost above the burst needs a full bucket and is charged in full:
+    # 10 tokens at 2/s move the TAT 5 s ahead: even one token is 4 s away.
+    d = [("d", 2.0, 3)]
+    assert limiter.acquire(d, 300.0, costs=[10]) == 0.0
+    assert limiter.acquire(d, 300.0) == pytest.approx(4.0)
+    assert limiter.acquire(d, 303.0) == pytest.approx(1.0)
+    assert limiter.acquire(d, 304.0) == 0.0
+    assert limiter.acquire(d, 304.0, costs=[10]) == pytest.approx(1.5)  # not full yet
+    assert limiter.acquire(d, 305.5, costs=[10]) == 0.0
+
+    # A clock that went backwards does not lock a bucket out.
+    assert limiter.acquire(a, 200.0 - 2 * MAX_DEBT_SECONDS) == 0.0
+
+
+def test_stores_stay_bounded(tmp_path) -> None:
+    memory = MemoryStore(max_keys=10)
+    limiter = RateLimiter(memory)
+    for n in range(100):
+        assert limiter.acquire([(f"k{n}", 1.0, 1)], float(n)) == 0.0
+    assert len(memory._tats) <= 10
+
+    shared = SharedMemoryStore(str(tmp_path / "buckets"), slots=8)
+    limiter = RateLimiter(shared)
+    for n in range(100):
+        assert limiter.acquire([(f"k{n}", 1.0, 1)], 0.0) == 0.0
+    assert (tmp_path / "buckets").stat().st_size == 8 * 16
+    shared.close()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+from django.db import connections
+from django.test.utils import CaptureQueriesContext
+
+from archive.models import Clip
+from archive.routing import (
+    PIN_COOKIE,
+    PIN_HEADER,
+    ReplicaRouter,
+    is_pinned,
+    reads_from_replica,
+)
+
+REPLICA = "replica1"
+
+pytestmark = pytest.mark.django_db(transaction=True, databases=["default", REPLICA])
+
+
+@pytest.fixture(autouse=True)
+def _replicas(settings):
+    settings.ARCHIVE_READ_REPLICAS = [REPLICA]
+    settings.ARCHIVE_READ_YOUR_WRITES_SECONDS = 5.0
+
+
+def _queries(alias: str, func) -> list:
+    with CaptureQueriesContext(connections[alias]) as ctx:
+        func()
+    return [q["sql"] for q in ctx.captured_queries]
+
+
+def _read_endpoints(submission: dict) -> list:
+    return [
+        "/clips",
+        f"/clips/{submission['clip_id']}",
+        f"/submissions/{submission['id']}",
+        "/calendar?year=1994&month=6",
+        f"/contributors/{submission['contributor_id']}",
+    ]
+
+
+def test_reads_go_to_the_replica_and_writes_to_the_primary(
+    client, create_contributor, submit
+) -> None:
+    contributor_id = create_contributor()
+    submission = submit(contributor_id, "replica0001", "1994-06-18").json()
+
+    # A client that never wrote (no pin) is served by the replica alone.
+    reader = type(client)()
+    for path in _read_endpoints(submission):
+        replica: list = []
+
+        def read() -> None:
+            resp = reader._c.get(path)
+            assert resp.status_code == 200, resp.content
+
+        primary = _queries("default", lambda: replica.extend(_queries(REPLICA, read)))
+        assert primary == [], path
+        assert replica, path
+
+    # Writes never touch the replica.
+    writes = _queries(
+        REPLICA, lambda: reader.post("/contributors", json={"display_name": "Reader"})
+    )
+    assert writes == []
+
+
+def test_writer_is_pinned_to_the_primary(client, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    before = time.time()
+    resp = submit(contributor_id, "https://youtu.be/replica0002", "1994-06-18")
+    assert resp.status_code == 201
+    pin = resp.headers[PIN_HEADER]
+    until = float(pin)
+    assert before + 4.9 < until <= time.time() + 5.001  # rounded to milliseconds
+    assert client._c.cookies[PIN_COOKIE].value == pin
+
+    # The cookie pins every read to the primary.
+    submission = resp.json()
+    for path in _read_endpoints(submission):
+        replica = _queries(REPLICA, lambda: client._c.get(path))
+        assert replica == [], path
+
+    # So does the header, for clients without a cookie jar.
+    reader = type(client)()
+    path = f"/clips/{submission['clip_id']}"
+    pinned = _queries(REPLICA, lambda: reader._c.get(path, headers={PIN_HEADER: pin}))
+    assert pinned == []
+    assert _queries(REPLICA, lambda: reader._c.get(path)) != []
+
+
+@pytest.mark.parametrize("offset", [-1.0, 3600.0])
+def test_expired_or_implausible_pins_are_ignored(
+    client, offset, create_contributor, submit
+) -> None:
+    submission = submit(create_contributor(), "replica0001", "1994-06-18").json()
+    reader = type(client)()
+    reader._c.cookies[PIN_COOKIE] = f"{time.time() + offset:.3f}"
+
+    queries = _queries(REPLICA, lambda: reader._c.get(f"/clips/{submission['clip_id']}"))
+    assert queries != []
+
+
+def test_pin_rounded_up_past_the_window_still_counts(rf) -> None:
+    now = time.time()
+    # The pin is sent with millisecond precision and may round up.
+    request = rf.get("/clips", headers={PIN_HEADER: f"{now + 5.0005:.4f}"})
+    assert is_pinned(request, now=now)
+
+
+def test_failed_writes_do_not_pin(client, submit) -> None:
+    resp = submit("ctr_missing", "https://youtu.be/replica0003", "1994-06-18")
+    assert resp.status_code == 400
+    assert PIN_HEADER not in resp.headers
+    assert PIN_COOKIE not in client._c.cookies
+
+
+def test_async_views_are_routed_too(rf) -> None:
+    router = ReplicaRouter()
+
+    @reads_from_replica
+    async def view(request):
+        return router.db_for_read(Clip)
+
+    assert asyncio.run(view(rf.get("/clips"))) == REPLICA
+    assert router.db_for_read(Clip) is None
+
+
+def test_replica_instances_are_saved_to_the_primary() -> None:
+    router = ReplicaRouter()
+    assert router.db_for_write(Clip) == "default"
+    assert router.allow_migrate(REPLICA, "archive") is False
+    assert router.allow_migrate("default", "archive") is None
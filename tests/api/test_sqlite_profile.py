@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import importlib.util
+
+import pytest
+from django.db import OperationalError, transaction
+
+
+def test_retry_on_lock_retries_transient_lock_errors(transactional_db, settings) -> None:
+    from archive.db import retry_on_lock
+
+    settings.ARCHIVE_WRITE_RETRY_BASE_DELAY = 0
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise OperationalError("database is locked")
+        return "ok"
+
+    assert retry_on_lock(flaky) == "ok"
+    assert len(calls) == 3
+
+
+def test_retry_on_lock_gives_up(transactional_db, settings) -> None:
+    from archive.db import retry_on_lock
+
+    settings.ARCHIVE_WRITE_RETRY_ATTEMPTS = 2
+    settings.ARCHIVE_WRITE_RETRY_BASE_DELAY = 0
+    calls = []
+
+    def locked():
+        calls.append(1)
+        raise OperationalError("database is locked")
+
+    with pytest.raises(OperationalError):
+        retry_on_lock(locked)
+    assert len(calls) == 2
+
+    # Other operational errors and nested transactions are never retried.
+    def broken():
+        calls.append(1)
+        raise OperationalError("disk I/O error")
+
+    calls.clear()
+    with pytest.raises(OperationalError):
+        retry_on_lock(broken)
+    assert len(calls) == 1
+
+    calls.clear()
+    with transaction.atomic(), pytest.raises(OperationalError):
+        retry_on_lock(locked)
+    assert len(calls) == 1
+
+
+def _load_settings(monkeypatch, **env: str):
+    """Execute a fresh copy of config/settings.py with ``env`` set."""
+    import config.settings
+
+    monkeypatch.delenv("TIME_WARP_DATABASE", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    spec = importlib.util.spec_from_file_location("_settings_under_test", config.settings.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_production_profile_pragmas_apply_to_new_connections(tmp_path, monkeypatch, db) -> None:
+    from django.db.utils import ConnectionHandler
+
+    prod = _load_settings(
+        monkeypatch,
+        TIME_WARP_SQLITE_PROFILE="production",
+        TIME_WARP_SQLITE_PATH=str(tmp_path / "prod.sqlite3"),
+    )
+    default = prod.DATABASES["default"]
+    assert default["OPTIONS"]["transaction_mode"] == "IMMEDIATE"
+    assert default["CONN_MAX_AGE"] is None
+
+    conn = ConnectionHandler({"default": default})["default"]
+    try:
+        with conn.cursor() as cur:
+            cur.execute("PRAGMA journal_mode")
+            assert cur.fetchone()[0] == "wal"
+            cur.execute("PRAGMA synchronous")
+            assert cur.fetchone()[0] == 1  # NORMAL
+            cur.execute("PRAGMA busy_timeout")
+            assert cur.fetchone()[0] == 20000
+            cur.execute("PRAGMA temp_store")
+            assert cur.fetchone()[0] == 2  # MEMORY
+    finally:
+        conn.close()
+
+    # Without the profile, none of it applies.
+    dev = _load_settings(monkeypatch, TIME_WARP_SQLITE_PROFILE="")
+    assert "OPTIONS" not in dev.DATABASES["default"]
+
+
+def test_is_lock_error_recognises_postgres_retryable_sqlstates() -> None:
+    from archive.db import is_lock_error
+
+    class DriverError(Exception):
+        def __init__(self, sqlstate):
+            self.sqlstate = sqlstate
+
+    for sqlstate, expected in [("40001", True), ("40P01", True), ("23505", False)]:
+        exc = OperationalError("driver error")
+        exc.__cause__ = DriverError(sqlstate)
+        assert is_lock_error(exc) is expected
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+
+import pytest
+
+from archive.shards import LOCK_NAME, publish_months, shard_publisher
+
+
+@pytest.fixture
+def static_dir(settings, tmp_path):
+    settings.ARCHIVE_STATIC_DIR = str(tmp_path)
+    # Long enough that the background thread never publishes during a test;
+    # the tests publish with flush() instead.
+    settings.ARCHIVE_STATIC_PUBLISH_DELAY = 30.0
+    yield tmp_path
+    shard_publisher.flush()
+
+
+def _load(path) -> dict:
+    return json.loads(path.read_bytes())
+
+
+@pytest.fixture
+def contributor_id(create_contributor) -> str:
+    return create_contributor("Publisher")
+
+
+def test_accepted_clip_rewrites_only_its_month(
+    client, contributor_id, static_dir, django_capture_on_commit_callbacks, submit
+) -> None:
+    with django_capture_on_commit_callbacks(execute=True):
+        submit(contributor_id, "shardA00001", "1994-06-18")
+        submit(contributor_id, "shardA00002", "1994-06-01")
+        submit(contributor_id, "shardA00003", "1994-11-05")
+    assert not (static_dir / "clips").exists()
+    shard_publisher.flush()
+
+    june = _load(static_dir / "clips/1994/06.json")
+    listing = client.get("/clips", params={"from": "1994-06-01", "to": "1994-06-30"}).json()
+    assert june == {"year": 1994, "month": 6, "clip_count": 2, "items": listing["items"]}
+    assert _load(static_dir / "clips/index.json") == {
+        "total": 3,
+        "months": [
+            {"year": 1994, "month": 6, "clip_count": 2, "path": "clips/1994/06.json"},
+            {"year": 1994, "month": 11, "clip_count": 1, "path": "clips/1994/11.json"},
+        ],
+    }
+
+    november = static_dir / "clips/1994/11.json"
+    mtime = november.stat().st_mtime_ns
+    with django_capture_on_commit_callbacks(execute=True):
+        submit(contributor_id, "shardA00004", "1994-06-30")
+    shard_publisher.flush()
+    assert november.stat().st_mtime_ns == mtime
+    assert _load(static_dir / "clips/1994/06.json")["clip_count"] == 3
+    assert _load(static_dir / "clips/index.json")["total"] == 4
+    # Only the published files and the lock: no temporary files left behind.
+    assert sorted(p.name for p in static_dir.rglob("*") if p.is_file()) == [
+        ".publish.lock",
+        "06.json",
+        "11.json",
+        "index.json",
+    ]
+
+
+def test_rejected_and_duplicate_submissions_publish_nothing(
+    contributor_id, static_dir, django_capture_on_commit_callbacks, submit
+) -> None:
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        submit(contributor_id, "shardB00001", "1994-02-30")
+    assert callbacks == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        submit(contributor_id, "shardB00001", "1994-02-03")
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        assert submit(contributor_id, "shardB00001", "1994-02-03").json()["status"] == "rejected"
+    assert callbacks == []
+
+
+def test_batch_ingest_publishes_each_month_once(
+    client, contributor_id, static_dir, django_capture_on_commit_callbacks
+) -> None:
+    items = [
+        {
+            "contributor_id": contributor_id,
+            "raw_youtube_input": f"https://youtu.be/shardC{n:05d}",
+            "raw_date_input": f"1971-0{1 + n % 3}-1{n}",
+        }
+        for n in range(6)
+    ]
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        resp = client.post("/submissions:batch", json={"items": items})
+    assert resp.status_code == 201, resp.text
+    assert len(callbacks) == 1
+    shard_publisher.flush()
+    assert [m["clip_count"] for m in _load(static_dir / "clips/index.json")["months"]] == [2, 2, 2]
+
+
+def test_disabled_without_a_static_dir(
+    contributor_id, settings, django_capture_on_commit_callbacks, submit
+) -> None:
+    settings.ARCHIVE_STATIC_DIR = None
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        submit(contributor_id, "shardD00001", "1994-06-18")
+    assert callbacks == []
+
+
+def test_missing_index_is_rebuilt_from_calendar_counts(
+    contributor_id, static_dir, settings, submit
+) -> None:
+    settings.ARCHIVE_STATIC_DIR = None
+    submit(contributor_id, "shardE00001", "1980-01-01")
+    submit(contributor_id, "shardE00002", "1981-01-01")
+
+    publish_months([(1980, 1)], root=static_dir)
+
+    index = _load(static_dir / "clips/index.json")
+    assert [(m["year"], m["clip_count"]) for m in index["months"]] == [(1980, 1), (1981, 1)]
+    assert not (static_dir / "clips/1981/01.json").exists()
+    assert oct(os.stat(static_dir / "clips/1980/01.json").st_mode & 0o777) == "0o644"
+
+
+def test_busy_lock_leaves_the_months_to_retry(
+    contributor_id, static_dir, settings, submit
+) -> None:
+    settings.ARCHIVE_STATIC_DIR = None
+    submit(contributor_id, "shardF00001", "1980-01-01")
+
+    with open(static_dir / LOCK_NAME, "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)  # e.g. another process's publish_shards
+        assert publish_months([(1980, 1)], root=static_dir, blocking=False) is False
+        fcntl.flock(lock, fcntl.LOCK_UN)
+    assert not (static_dir / "clips").exists()
+
+    assert publish_months([(1980, 1)], root=static_dir, blocking=False) is True
+    assert _load(static_dir / "clips/index.json")["total"] == 1
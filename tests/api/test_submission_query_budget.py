@@ -0,0 +1,66 @@
+"""Statement budgets for POST /submissions, one per outcome.
+
+Savepoint bookkeeping (emitted because each test runs inside a transaction)
+is excluded so the budgets count only the statements production executes.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def _statements(submit, contributor_id: str, youtube: str, raw_date: str) -> List[str]:
+    with CaptureQueriesContext(connection) as ctx:
+        submit(contributor_id, youtube, raw_date)
+    return [
+        q["sql"]
+        for q in ctx.captured_queries
+        if not q["sql"].upper().startswith(("SAVEPOINT", "RELEASE SAVEPOINT"))
+    ]
+
+
+@pytest.mark.parametrize(
+    "youtube,raw_date,budget",
+    [
+        # contributor lookup, submission insert, counter update
+        ("not a url", "1994-06-01", 3),
+        ("https://youtu.be/dQw4w9WgXcQ", "1994-06-31", 3),
+        # contributor lookup, existence check, submission insert, counter update
+        ("https://youtu.be/aaaaaaaaaaa", "1994-06-01", 4),
+    ],
+)
+def test_rejected_submission_budget(youtube, raw_date, budget, create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "https://youtu.be/aaaaaaaaaaa", "1994-06-01").status_code == 201
+
+    statements = _statements(submit, contributor_id, youtube, raw_date)
+    assert len(statements) == budget, statements
+    updates = [s for s in statements if s.upper().startswith("UPDATE")]
+    assert len(updates) == 1 and '"archive_contributor"' in updates[0], updates
+    assert not any("archive_clip" in s and s.upper().startswith("INSERT") for s in statements)
+
+
+def test_duplicate_unknown_to_the_filter_budget(create_contributor, submit) -> None:
+    from archive.duplicates import duplicate_filter
+
+    contributor_id = create_contributor()
+    assert submit(contributor_id, "https://youtu.be/aaaaaaaaaaa", "1994-06-01").status_code == 201
+    duplicate_filter.clear()  # as if another process had created the clip
+
+    # contributor lookup, clip insert (conflict), submission insert, counter update
+    statements = _statements(submit, contributor_id, "https://youtu.be/aaaaaaaaaaa", "1994-06-01")
+    assert len(statements) == 4, statements
+
+
+def test_accepted_submission_budget(create_contributor, submit) -> None:
+    contributor_id = create_contributor()
+
+    statements = _statements(submit, contributor_id, "https://youtu.be/bbbbbbbbbbb", "1994-06-01")
+    # contributor lookup, clip insert, calendar upsert, archive version bump,
+    # submission insert, counter update
+    assert len(statements) == 6, statements
+    assert sum(s.upper().startswith("SELECT") for s in statements) == 1
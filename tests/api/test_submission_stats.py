@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from archive.models import Submission
+from archive.rollups import fold_submissions, last_complete_day
+
+UTC = timezone.utc
+
+
+def _backdate(resp, at: datetime) -> None:
+    assert resp.status_code in (201, 409), resp.text
+    Submission.objects.filter(public_id=resp.json()["id"]).update(submitted_at=at)
+
+
+def _archive(create_contributor, submit):
+    alice = create_contributor("Alice")
+    bob = create_contributor("Bob")
+    day1 = datetime(2026, 3, 1, 23, 59, tzinfo=UTC)
+    day2 = datetime(2026, 3, 2, 0, 0, tzinfo=UTC)
+    _backdate(submit(alice, "https://youtu.be/aaaaaaaaaaa", "1977-05-08"), day1)
+    _backdate(submit(alice, "https://youtu.be/bbbbbbbbbbb", "1977-02-30"), day1)
+    _backdate(submit(bob, "https://youtu.be/aaaaaaaaaaa", "1977-05-08"), day1)
+    _backdate(submit(bob, "not a video", "1977-05-08"), day2)
+    _backdate(submit(bob, "https://youtu.be/ccccccccccc", "1980-01-01"), day2)
+    # Today: not folded until the day is over.
+    _backdate(submit(alice, "https://youtu.be/ddddddddddd", "1980-01-01"), datetime.now(UTC))
+    return alice, bob
+
+
+def _stats(client, **params) -> dict:
+    resp = client.get("/stats/submissions", params=params)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def _rejections(invalid_date=0, invalid_youtube=0, duplicate_clip=0) -> dict:
+    return {
+        "invalid_date": invalid_date,
+        "invalid_youtube": invalid_youtube,
+        "duplicate_clip": duplicate_clip,
+    }
+
+
+def test_reports_folded_days_by_outcome(client, create_contributor, submit) -> None:
+    alice, bob = _archive(create_contributor, submit)
+    assert _stats(client) == {
+        "from": None,
+        "to": None,
+        "folded_through": None,
+        "submission_count": 0,
+        "accepted_submission_count": 0,
+        "rejected_submission_count": 0,
+        "rejections": _rejections(),
+        "days": [],
+    }
+
+    assert fold_submissions() == last_complete_day()
+    stats = _stats(client)
+    assert stats["folded_through"] == last_complete_day().isoformat()
+    assert (stats["submission_count"], stats["accepted_submission_count"]) == (5, 2)
+    assert stats["rejections"] == _rejections(1, 1, 1)
+    assert stats["days"] == [
+        {
+            "date": "2026-03-01",
+            "submission_count": 3,
+            "accepted_submission_count": 1,
+            "rejected_submission_count": 2,
+            "rejections": _rejections(invalid_date=1, duplicate_clip=1),
+        },
+        {
+            "date": "2026-03-02",
+            "submission_count": 2,
+            "accepted_submission_count": 1,
+            "rejected_submission_count": 1,
+            "rejections": _rejections(invalid_youtube=1),
+        },
+    ]
+
+    only_bob = _stats(client, contributor_id=bob, **{"from": "2026-03-01", "to": "2026-03-01"})
+    assert only_bob["submission_count"] == 1
+    assert only_bob["rejections"] == _rejections(duplicate_clip=1)
+    assert (only_bob["from"], only_bob["to"]) == ("2026-03-01", "2026-03-01")
+
+
+def test_folding_is_incremental(client, create_contributor, submit) -> None:
+    _archive(create_contributor, submit)
+
+    assert fold_submissions(until=date(2026, 3, 1)) == date(2026, 3, 1)
+    assert [d["date"] for d in _stats(client)["days"]] == ["2026-03-01"]
+    assert fold_submissions(until=date(2026, 3, 1)) == date(2026, 3, 1)  # no double count
+    fold_submissions(days_per_chunk=1)
+    stats = _stats(client)
+    assert stats["submission_count"] == 5
+    assert [d["submission_count"] for d in stats["days"]] == [3, 2]
+
+
+def test_reads_only_the_rollups(client, create_contributor, submit) -> None:
+    _archive(create_contributor, submit)
+    fold_submissions()
+
+    with CaptureQueriesContext(connection) as ctx:
+        _stats(client)
+    assert not any('"archive_submission"' in q["sql"] for q in ctx.captured_queries)
+
+
+def test_rejects_invalid_parameters(client) -> None:
+    assert client.get("/stats/submissions", params={"from": "2026-02-30"}).status_code == 400
+    resp = client.get("/stats/submissions", params={"contributor_id": "ctr_missing"})
+    assert resp.status_code == 404
+
+
+def test_last_complete_day_waits_for_in_flight_writes() -> None:
+    assert last_complete_day(datetime(2026, 3, 2, 0, 30, tzinfo=UTC)) == date(2026, 2, 28)
+    assert last_complete_day(datetime(2026, 3, 2, 1, 30, tzinfo=UTC)) == date(2026, 3, 1)
@@ -41,3 +41,14 @@ def test_create_submission_valid_input_is_accepted_and_returns_clip_id(client) -
     assert isinstance(data.get("clip_id"), str) and data["clip_id"]
     assert data.get("raw_youtube_input") == submission_payload["raw_youtube_input"]
     assert data.get("raw_date_input") == submission_payload["raw_date_input"]
+
+
+def test_inputs_longer_than_their_columns_fail_with_400(create_contributor, submit) -> None:
+    from archive.models import Submission
+
+    contributor_id = create_contributor()
+    resp = submit(contributor_id, "dQw4w9WgXcQ", raw_date="1977-05-08" * 6)
+    assert resp.status_code == 400
+    assert "raw_date_input" in resp.text
+    assert submit(contributor_id, "dQw4w9WgXcQ", title="x" * 501).status_code == 400
+    assert not Submission.objects.exists()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import json
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+def test_batch_reports_per_item_outcomes(
+    client, create_contributor, submit, submission_item
+) -> None:
+    contributor_id = create_contributor()
+    existing = submission_item(contributor_id, "aaaaaaaaaaa", "1995-07-01")
+    assert submit(contributor_id, "aaaaaaaaaaa", "1995-07-01").status_code == 201
+
+    items = [
+        submission_item(contributor_id, "bbbbbbbbbbb", "1995-07-01"),
+        submission_item(contributor_id, "bbbbbbbbbbb", "1995-07-01"),  # duplicate within batch
+        existing,  # duplicate against the archive
+        submission_item(contributor_id, "ccccccccccc", "1995-02-30"),  # invalid date
+        submission_item(contributor_id, "nope", "1995-07-02"),
+    ]
+    resp = client.post("/submissions:batch", json={"items": items})
+    assert resp.status_code == 201, resp.text
+    results = resp.json()["items"]
+
+    assert [r["status"] for r in results] == [
+        "accepted",
+        "rejected",
+        "rejected",
+        "rejected",
+        "rejected",
+    ]
+    assert results[0]["clip_id"] and results[0]["validation_error"] is None
+    assert "duplicate" in results[1]["validation_error"].lower()
+    assert "duplicate" in results[2]["validation_error"].lower()
+    assert results[3]["validation_error"] and results[3]["clip_id"] is None
+    assert results[4]["validation_error"] and results[4]["clip_id"] is None
+    for item, result in zip(items, results):
+        assert result["id"].startswith("sub_")
+        assert result["contributor_id"] == contributor_id
+        assert result["raw_youtube_input"] == item["raw_youtube_input"]
+        assert result["raw_date_input"] == item["raw_date_input"]
+
+
+def test_batch_accepts_ndjson(client, create_contributor, submission_item) -> None:
+    contributor_id = create_contributor()
+    lines = [
+        json.dumps(submission_item(contributor_id, f"nd{n:09d}", "2003-03-03"))
+        for n in range(3)
+    ]
+    resp = client._c.post(
+        "/submissions:batch",
+        data="\n".join(lines) + "\n",
+        content_type="application/x-ndjson",
+    )
+    assert resp.status_code == 201, resp.content
+    assert [r["status"] for r in resp.data["items"]] == ["accepted"] * 3
+
+
+def test_batch_query_count_does_not_grow_with_batch_size(
+    client, settings, create_contributor, submission_item
+) -> None:
+    settings.ARCHIVE_RATE_LIMIT = False  # more items than a contributor's burst
+    contributor_id = create_contributor()
+
+    def run(prefix: str, n: int) -> int:
+        items = [
+            submission_item(contributor_id, f"{prefix}{i:08d}", "1988-08-08") for i in range(n)
+        ]
+        with CaptureQueriesContext(connection) as ctx:
+            resp = client.post("/submissions:batch", json=items)
+        assert resp.status_code == 201, resp.text
+        return len(ctx.captured_queries)
+
+    assert run("sml", 2) == run("big", 50)
+
+
+def test_batch_rejects_unknown_contributor_and_bad_shapes(
+    client, create_contributor, submission_item
+) -> None:
+    contributor_id = create_contributor()
+    ok = submission_item(contributor_id, "ddddddddddd", "1999-12-31")
+    unknown = {**ok, "contributor_id": "ctr_missing"}
+
+    assert client.post("/submissions:batch", json=[ok, unknown]).status_code == 400
+    assert client.post("/submissions:batch", json=[]).status_code == 400
+    assert client.post("/submissions:batch", json={"items": "x"}).status_code == 400
+    assert client.post("/submissions:batch", json=[{"contributor_id": contributor_id}]).status_code == 400
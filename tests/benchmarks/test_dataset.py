@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import replace
+
+import pytest
+
+from conftest import REPO_ROOT
+
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from dataset import DatasetSpec, Generator, generate  # noqa: E402
+
+SPEC = DatasetSpec(contributors=20, clips=300, rejected=60, seed=7, chunk_size=100)
+
+
+def _rows(spec: DatasetSpec):
+    gen = Generator(spec)
+    contributors = list(gen.contributors())
+    clips = list(gen.clips_and_submissions())
+    rejected = list(gen.rejected_submissions([(c[3], c[5]) for c, _ in clips]))
+    return contributors, clips, rejected
+
+
+def test_generator_is_deterministic_per_seed() -> None:
+    assert _rows(SPEC) == _rows(SPEC)
+    assert _rows(SPEC) != _rows(replace(SPEC, seed=8))
+
+
+@pytest.mark.django_db
+def test_generate_writes_a_consistent_archive(client, submit) -> None:
+    from archive.calendar import diff_counts
+    from archive.contributors import diff_counts as diff_contributor_counts
+    from archive.models import Clip, Contributor, Submission
+    from archive.validation import DUPLICATE_CLIP_ERROR
+
+    generate(SPEC)
+
+    assert Contributor.objects.count() == SPEC.contributors
+    assert Clip.objects.count() == SPEC.clips
+    assert Submission.objects.filter(status="accepted", clip__isnull=False).count() == SPEC.clips
+    rejected = Submission.objects.filter(status="rejected")
+    assert rejected.count() == SPEC.rejected
+    assert not rejected.filter(validation_error__isnull=True).exists()
+    assert rejected.filter(validation_error=DUPLICATE_CLIP_ERROR).exists()
+    assert diff_counts() == {}
+    assert diff_contributor_counts() == {}
+    assert sum(Contributor.objects.values_list("clip_count", flat=True)) == SPEC.clips
+
+    # The generated archive is served like one built through the API.
+    page = client.get("/clips", params={"limit": 200}).json()
+    assert len(page["items"]) == 200
+    assert page["next_cursor"]
+
+    resp = submit(Contributor.objects.get(pk=1).public_id, "https://youtu.be/aaaaaaaaaaa")
+    assert resp.status_code == 201
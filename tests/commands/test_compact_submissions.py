@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+UTC = timezone.utc
+
+
+@pytest.fixture
+def archive(create_contributor, submit):
+    """Rejected and accepted submissions 200 days old, plus a recent rejection."""
+    from archive.models import Submission
+
+    contributor_id = create_contributor("Compactor")
+    old = datetime.now(UTC) - timedelta(days=200)
+    recent = datetime.now(UTC) - timedelta(days=10)
+    submitted = []
+    for youtube, raw_date, at in [
+        ("https://youtu.be/aaaaaaaaaaa", "1977-05-08", old),
+        ("https://youtu.be/aaaaaaaaaaa", "1977-05-08", old),
+        ("https://youtu.be/bbbbbbbbbbb", "1977-13-01", old),
+        ("not a video", "1977-05-08", old),
+        ("https://youtu.be/ccccccccccc", "1977-02-30", recent),
+    ]:
+        public_id = submit(contributor_id, youtube, raw_date).json()["id"]
+        Submission.objects.filter(public_id=public_id).update(submitted_at=at)
+        submitted.append(public_id)
+    return contributor_id, submitted
+
+
+def _stats(client) -> dict:
+    return client.get("/stats/submissions").json()
+
+
+def test_archives_and_deletes_old_rejected_submissions(
+    client, archive, tmp_path, contributor_counters
+) -> None:
+    from archive.contributors import diff_counts, rebuild_contributor_counts
+    from archive.models import Submission
+
+    contributor_id, submitted = archive
+    before = [client.get(f"/submissions/{s}").json() for s in submitted]
+    counters = contributor_counters(contributor_id)
+    path = tmp_path / "rejected.ndjson.gz"
+
+    out = StringIO()
+    call_command("compact_submissions", "--archive", str(path), "--chunk-size", "2", stdout=out)
+
+    assert "Deleted 3 rejected submission(s)" in out.getvalue()
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        archived = [json.loads(line) for line in f]
+    assert archived == before[1:4]
+    assert list(Submission.objects.order_by("pk").values_list("public_id", flat=True)) == [
+        submitted[0],
+        submitted[4],
+    ]
+    assert client.get(f"/submissions/{submitted[1]}").status_code == 404
+
+    # Reporting and the contributor counters survive the deletion.
+    stats = _stats(client)
+    assert stats["submission_count"] == 5
+    assert stats["rejections"] == {"invalid_date": 2, "invalid_youtube": 1, "duplicate_clip": 1}
+    assert diff_counts() == {}
+    rebuild_contributor_counts()
+    assert contributor_counters(contributor_id) == counters
+
+
+def test_fold_only_and_retention(client, archive) -> None:
+    from archive.models import Submission
+
+    call_command("compact_submissions", "--fold-only", stdout=StringIO())
+    assert Submission.objects.count() == 5
+    assert _stats(client)["submission_count"] == 5
+
+    call_command("compact_submissions", "--retain-days", "365", stdout=StringIO())
+    assert Submission.objects.count() == 5
+    call_command("compact_submissions", "--retain-days", "0", stdout=StringIO())
+    assert Submission.objects.filter(status="rejected").count() == 0
+    assert _stats(client)["submission_count"] == 5
+
+
+def test_stops_at_the_deadline_and_resumes(client, archive) -> None:
+    from archive.models import Submission
+
+    out = StringIO()
+    call_command(
+        "compact_submissions", "--fold-days", "1", "--max-seconds", "1e-9", stdout=out
+    )
+    assert "run again to continue" in out.getvalue()
+    assert Submission.objects.count() == 5
+
+    out = StringIO()
+    call_command("compact_submissions", stdout=out)
+    assert "Compaction complete." in out.getvalue()
+    assert Submission.objects.count() == 2
+    assert _stats(client)["submission_count"] == 5
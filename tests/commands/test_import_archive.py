@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.fixture
+def contributor(db):
+    from archive.models import Contributor
+
+    return Contributor.objects.create(display_name="Archivist")
+
+
+def _records(contributor_id: str, n: int) -> list:
+    return [
+        {
+            "contributor_id": contributor_id,
+            "raw_youtube_input": f"https://www.youtube.com/watch?v=imp{i:08d}",
+            "raw_date_input": f"19{60 + i % 40:02d}-01-01",
+            "title": f"Tape {i}",
+        }
+        for i in range(n)
+    ]
+
+
+def _write_ndjson(path, records) -> None:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+
+def test_import_ndjson_validates_and_deduplicates(tmp_path, contributor) -> None:
+    from archive.models import CalendarDay, Clip, Submission
+
+    records = _records(contributor.public_id, 10)
+    records.append(dict(records[0]))  # duplicate
+    records.append({**records[1], "raw_date_input": "1999-02-30"})  # invalid date
+    records.append({**records[2], "contributor_id": "ctr_unknown"})  # skipped
+    source = tmp_path / "archive.ndjson"
+    _write_ndjson(source, records)
+
+    out = StringIO()
+    call_command("import_archive", str(source), "--batch-size", "4", stdout=out)
+
+    assert Clip.objects.count() == 10
+    assert Submission.objects.filter(status="rejected").count() == 2
+    assert sum(CalendarDay.objects.values_list("clip_count", flat=True)) == 10
+    assert "rows/s" in out.getvalue()
+    assert "10 accepted, 2 rejected, 1 skipped" in out.getvalue()
+    assert not (tmp_path / "archive.ndjson.checkpoint").exists()
+
+
+def test_import_resumes_from_checkpoint(tmp_path, contributor) -> None:
+    from archive.models import Clip
+
+    records = _records(contributor.public_id, 6)
+    source = tmp_path / "archive.ndjson"
+    _write_ndjson(source, records)
+    checkpoint = tmp_path / "archive.ndjson.checkpoint"
+    checkpoint.write_text(json.dumps({"source": str(source.resolve()), "records": 4}))
+
+    call_command("import_archive", str(source), stdout=StringIO())
+
+    assert sorted(Clip.objects.values_list("title", flat=True)) == ["Tape 4", "Tape 5"]
+
+
+def test_rerun_after_a_lost_checkpoint_imports_nothing_twice(tmp_path, contributor) -> None:
+    from archive.models import Contributor, Submission
+
+    records = _records(contributor.public_id, 6)
+    source = tmp_path / "archive.ndjson"
+    _write_ndjson(source, records)
+    call_command("import_archive", str(source), "--batch-size", "4", stdout=StringIO())
+
+    # As if the process died after each commit, before its checkpoint.
+    checkpoint = tmp_path / "archive.ndjson.checkpoint"
+    checkpoint.write_text(json.dumps({"source": str(source.resolve()), "records": 0}))
+    out = StringIO()
+    call_command("import_archive", str(source), "--batch-size", "4", stdout=out)
+
+    assert "0 accepted, 0 rejected, 6 skipped" in out.getvalue()
+    assert Submission.objects.count() == 6
+    counters = Contributor.objects.values_list(
+        "accepted_submission_count", "rejected_submission_count"
+    ).get(pk=contributor.pk)
+    assert counters == (6, 0)
+
+
+def test_records_that_are_not_objects_are_skipped(tmp_path, contributor) -> None:
+    from archive.models import Clip
+
+    source = tmp_path / "archive.ndjson"
+    record = json.dumps(_records(contributor.public_id, 1)[0])
+    source.write_text(f'[1, 2]\n42\n"text"\nnull\n{record}\n')
+    out = StringIO()
+    call_command("import_archive", str(source), stdout=out)
+
+    assert Clip.objects.count() == 1
+    assert "1 accepted, 0 rejected, 4 skipped" in out.getvalue()
+
+
+def test_import_csv_creates_contributors_by_external_id(tmp_path, db) -> None:
+    from archive.models import Clip, Contributor
+
+    source = tmp_path / "archive.csv"
+    source.write_text(
+        "contributor_id,raw_youtube_input,raw_date_input,title,notes\n"
+        "tapers-guild,https://youtu.be/csv00000001,1972-05-04,Show,\n"
+        "tapers-guild,https://youtu.be/csv00000002,1972-05-07,,Soundboard\n"
+    )
+
+    call_command(
+        "import_archive",
+        str(source),
+        "--contributor-field",
+        "external_id",
+        "--create-contributors",
+        stdout=StringIO(),
+    )
+
+    assert Contributor.objects.filter(external_id="tapers-guild").count() == 1
+    titles = dict(Clip.objects.values_list("youtube_video_id", "title"))
+    assert titles == {"csv00000001": "Show", "csv00000002": None}
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from archive.shards import publish_months
+
+
+@pytest.fixture
+def archive(create_contributor, submit) -> None:
+    contributor_id = create_contributor("Rebuilder")
+    for n, raw_date in enumerate(["1965-03-01", "1965-03-21", "1972-07-04", "1965-03-01"]):
+        resp = submit(contributor_id, f"https://youtu.be/pub{n:08d}", raw_date)
+        assert resp.status_code == 201, resp.text
+
+
+def _tree(root) -> dict:
+    return {str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*.json"))}
+
+
+def test_full_rebuild_matches_incremental_publishing(archive, tmp_path) -> None:
+    incremental, full = tmp_path / "incremental", tmp_path / "full"
+    publish_months([(1965, 3), (1972, 7)], root=incremental)
+
+    out = StringIO()
+    call_command("publish_shards", "--output", str(full), stdout=out)
+
+    assert "Published 4 clip(s) in 2 month shard(s)" in out.getvalue()
+    assert _tree(full) == _tree(incremental)
+    assert list(_tree(full)) == ["clips/1965/03.json", "clips/1972/07.json", "clips/index.json"]
+    assert json.loads((full / "clips/1965/03.json").read_bytes())["clip_count"] == 3
+
+
+def test_rebuild_removes_shards_of_empty_months(archive, tmp_path) -> None:
+    stale = tmp_path / "clips/1999/12.json"
+    stale.parent.mkdir(parents=True)
+    stale.write_text('{"items": []}')
+
+    call_command("publish_shards", "--output", str(tmp_path), stdout=StringIO())
+
+    assert not stale.exists()
+    index = json.loads((tmp_path / "clips/index.json").read_bytes())
+    assert [m["year"] for m in index["months"]] == [1965, 1972]
+
+
+def test_uses_the_configured_directory(db, settings, tmp_path) -> None:
+    settings.ARCHIVE_STATIC_DIR = None
+    with pytest.raises(CommandError):
+        call_command("publish_shards", stdout=StringIO())
+
+    settings.ARCHIVE_STATIC_DIR = str(tmp_path)
+    call_command("publish_shards", stdout=StringIO())
+    assert json.loads((tmp_path / "clips/index.json").read_bytes()) == {"total": 0, "months": []}
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+
+@pytest.mark.parametrize(
+    "command, locked_table, source_table",
+    [
+        ("rebuild_calendar", "archive_calendarday", "archive_clip"),
+        ("rebuild_contributor_counts", "archive_contributor", "archive_submission"),
+    ],
+)
+def test_rebuild_locks_the_counter_table_before_recounting_on_postgres(
+    monkeypatch, create_contributor, submit, command, locked_table, source_table
+) -> None:
+    submit(create_contributor(), "aaaaaaaaaaa")
+    statements = []
+
+    def record(execute, sql, params, many, context):
+        statements.append(sql)
+        if sql.startswith("LOCK TABLE"):
+            return None  # SQLite has no LOCK TABLE; only the order matters here.
+        return execute(sql, params, many, context)
+
+    monkeypatch.setattr(connection, "vendor", "postgresql")
+    with connection.execute_wrapper(record):
+        call_command(command)
+
+    lock = f'LOCK TABLE "{locked_table}" IN SHARE ROW EXCLUSIVE MODE'
+    assert lock in statements
+    first_read = next(i for i, sql in enumerate(statements) if f'"{source_table}"' in sql)
+    assert statements.index(lock) < first_read
@@ -4,7 +4,7 @@ import os
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
 
 import pytest
 
@@ -16,6 +16,10 @@ if str(DJANGO_ROOT) not in sys.path:
     sys.path.insert(0, str(DJANGO_ROOT))
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# A read-replica alias ("replica1"), mirroring the test database; routing to
+# it is off unless a test enables it (see _clear_cache).
+os.environ.setdefault("TIME_WARP_SQLITE_REPLICAS", str(DJANGO_ROOT / "replica.sqlite3"))
+os.environ.setdefault("TIME_WARP_PG_REPLICA_HOSTS", os.environ.get("TIME_WARP_PG_HOST", "localhost"))
 
 import django  # noqa: E402
 
@@ -29,6 +33,7 @@ class _Resp:
     status_code: int
     _data: Any
     _raw: bytes
+    headers: Mapping[str, str]
 
     @property
     def text(self) -> str:
@@ -55,6 +60,7 @@ class ContractClient:
             status_code=resp.status_code,
             _data=getattr(resp, "data", None),
             _raw=getattr(resp, "content", b""),
+            headers=resp.headers,
         )
 
     def get(
@@ -65,10 +71,105 @@ class ContractClient:
             status_code=resp.status_code,
             _data=getattr(resp, "data", None),
             _raw=getattr(resp, "content", b""),
+            headers=resp.headers,
         )
 
 
+@pytest.fixture(autouse=True)
+def _clear_cache(settings) -> None:
+    """Cached reads and the duplicate filter follow DB state that each test rolls back."""
+    from django.core.cache import cache
+
+    from archive.duplicates import duplicate_filter
+    from archive.ratelimit import submission_limiter
+
+    cache.clear()
+    # Every test starts from an empty archive; periodic catch-up and
+    # reconciliation are exercised explicitly where needed.
+    settings.ARCHIVE_DUPLICATE_FILTER_SYNC_SECONDS = None
+    settings.ARCHIVE_DUPLICATE_FILTER_RECONCILE_SECONDS = None
+    duplicate_filter.clear()
+    # Every test client shares one IP; start each test with full buckets.
+    submission_limiter.reset()
+    settings.ARCHIVE_READ_REPLICAS = []
+
+
 @pytest.fixture
 def client(db) -> ContractClient:
     """Contract client with DB access enabled via pytest-django."""
     return ContractClient()
+
+
+@pytest.fixture
+def create_contributor(client) -> Callable[..., str]:
+    """Factory creating a contributor through the API; returns its public id."""
+
+    def create(display_name: str = "Curator", external_id: Optional[str] = None) -> str:
+        resp = client.post(
+            "/contributors", json={"display_name": display_name, "external_id": external_id}
+        )
+        assert resp.status_code == 201, resp.text
+        return resp.json()["id"]
+
+    return create
+
+
+@pytest.fixture
+def submission_item() -> Callable[..., Dict[str, Any]]:
+    """Factory for one CreateSubmissionRequest payload (as sent by ``submit``).
+
+    ``youtube`` is used verbatim as ``raw_youtube_input``; extra keyword
+    arguments (title, notes) join the payload.
+    """
+
+    def item(
+        contributor_id: str, youtube: str, raw_date: str = "1977-05-08", **fields: Any
+    ) -> Dict[str, Any]:
+        return {
+            "contributor_id": contributor_id,
+            "raw_youtube_input": youtube,
+            "raw_date_input": raw_date,
+            **fields,
+        }
+
+    return item
+
+
+@pytest.fixture
+def submit(client, submission_item) -> Callable[..., _Resp]:
+    """Factory posting one submission; returns the response.
+
+    ``youtube`` is sent verbatim as ``raw_youtube_input`` (a bare 11-character
+    video id is valid input). Extra keyword arguments (title, notes) join the
+    payload; ``extra`` is passed to the test client (e.g. ``REMOTE_ADDR``).
+    """
+
+    def post(
+        contributor_id: str,
+        youtube: str,
+        raw_date: str = "1977-05-08",
+        extra: Optional[Dict[str, Any]] = None,
+        **fields: Any,
+    ) -> _Resp:
+        payload = submission_item(contributor_id, youtube, raw_date, **fields)
+        return client.post("/submissions", json=payload, **(extra or {}))
+
+    return post
+
+
+@pytest.fixture
+def contributor_counters(client) -> Callable[[str], Tuple[int, int, int, int]]:
+    """Reads a contributor's (submission, accepted, rejected, clip) counts via the API."""
+
+    def counters(contributor_id: str) -> Tuple[int, int, int, int]:
+        resp = client.get(f"/contributors/{contributor_id}")
+        assert resp.status_code == 200, resp.text
+        data = resp.json()
+        return (
+            data["submission_count"],
+            data["accepted_submission_count"],
+            data["rejected_submission_count"],
+            data["clip_count"],
+        )
+
+    return counters
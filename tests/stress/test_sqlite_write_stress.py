@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+sys.path.insert(0, str(REPO_ROOT / "benchmarks"))
+
+from sqlite_write_stress import run_profile  # noqa: E402
+
+
+@pytest.mark.stress
+@pytest.mark.parametrize("profile", ["default", "production"])
+def test_concurrent_writers_complete_without_lock_errors(profile) -> None:
+    result = run_profile(profile, workers=4, per_worker=50)
+    assert result["errors"] == 0
+    assert result["requests"] == result["committed"] == 200
+    assert result["requests_per_s"] > 0
+    assert 0 < result["p50_ms"] <= result["p99_ms"]
+
+
+@pytest.mark.stress
+def test_group_commit_writes_every_submission() -> None:
+    result = run_profile("production", workers=4, per_worker=50, async_submissions=True)
+    assert result["errors"] == 0
+    assert result["requests"] == result["committed"] == 200
+    assert 0 < result["p50_ms"] <= result["p99_ms"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import pytest
+
+from archive.validation import validate_submission_batch, validate_submission_inputs
+from archive.youtube import (
+    INVALID_YOUTUBE_ERROR,
+    cache_info,
+    clear_cache,
+    normalize_youtube_input,
+    normalize_youtube_inputs,
+)
+
+CORPUS_PATH = Path(__file__).with_name("youtube_corpus.tsv")
+
+
+def _load_corpus() -> List[Tuple[str, Optional[str]]]:
+    cases = []
+    for line in CORPUS_PATH.read_text(encoding="utf-8").splitlines():
+        if not line or line.startswith("#"):
+            continue
+        raw, expected = line.split("\t")
+        cases.append((raw, None if expected == "-" else expected))
+    return cases
+
+
+CORPUS = _load_corpus()
+
+
+@pytest.mark.parametrize("raw,expected", CORPUS, ids=[raw.strip() or "blank" for raw, _ in CORPUS])
+def test_corpus(raw: str, expected: Optional[str]) -> None:
+    if expected is None:
+        with pytest.raises(ValueError, match=INVALID_YOUTUBE_ERROR):
+            normalize_youtube_input(raw)
+    else:
+        assert normalize_youtube_input(raw) == expected
+
+
+@pytest.mark.parametrize("raw", ["", "   ", None])
+def test_empty_input_is_rejected(raw) -> None:
+    with pytest.raises(ValueError, match=INVALID_YOUTUBE_ERROR):
+        normalize_youtube_input(raw)
+
+
+def test_batch_matches_single_inputs() -> None:
+    raws = [raw for raw, _ in CORPUS] * 2
+    assert normalize_youtube_inputs(raws) == [expected for _, expected in CORPUS] * 2
+
+
+def test_results_are_memoized() -> None:
+    clear_cache()
+    raw = "https://youtu.be/dQw4w9WgXcQ?si=memo"
+    for _ in range(3):
+        normalize_youtube_input(raw)
+    info = cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+    assert info.maxsize is not None
+
+
+def test_submission_batch_matches_single_validation() -> None:
+    pairs = [
+        ("https://youtu.be/dQw4w9WgXcQ", "1977-05-08"),
+        ("https://youtu.be/dQw4w9WgXcQ", "1977-02-30"),
+        ("not a url", "1977-05-08"),
+        ("not a url", "yesterday"),
+    ]
+    batch = validate_submission_batch(pairs)
+    for (raw_youtube, raw_date), result in zip(pairs, batch):
+        try:
+            expected = validate_submission_inputs(raw_youtube, raw_date)
+        except ValueError as e:
+            assert isinstance(result, ValueError)
+            assert str(result) == str(e)
+        else:
+            assert result == expected